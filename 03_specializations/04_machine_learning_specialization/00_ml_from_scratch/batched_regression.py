@@ -0,0 +1,172 @@
+import numpy as np
+
+from linear_regression import LinearRegression
+
+
+class BatchedLinearRegression:
+    """
+    Trains K linear regression models with different hyperparameters at once.
+
+    Model k uses the learning rate `alphas[k]` and the L2 regularization strength
+    `lambdas[k]`. The weights of all models are stored as the columns of a
+    (num_features, K) matrix, so every gradient descent epoch is one
+    matrix-matrix product over X instead of K matrix-vector products. This makes
+    hyperparameter sweeps much cheaper than fitting the models one by one.
+
+    Each model minimizes the `RidgeRegression` objective with lambda_ = lambdas[k]
+    using the same full-batch updates as `LinearRegression`. With `tol` set, a model is
+    frozen once its gradient norm drops below `tol`, and training stops when all
+    models have converged.
+
+    Args:
+        alphas (float | np.ndarray): The learning rate(s), broadcast against `lambdas`.
+        lambdas (float | np.ndarray, optional): The L2 regularization strength(s). Defaults to 0.0.
+        epochs (int, optional): The number of iterations for gradient descent. Defaults to 1000.
+        tol (float, optional): The gradient norm below which a model stops. Defaults to None.
+
+    """
+
+    def __init__(
+        self,
+        alphas: float | np.ndarray,
+        lambdas: float | np.ndarray = 0.0,
+        epochs: int = 1000,
+        tol: float | None = None,
+    ) -> None:
+        """
+        Initializes the sweep's configuration.
+
+        """
+        self.alphas, self.lambdas = (
+            np.array(values, dtype=float)
+            for values in np.broadcast_arrays(
+                np.atleast_1d(alphas), np.atleast_1d(lambdas)
+            )
+        )
+        self.epochs = epochs
+        self.tol = tol
+        self.weights = None
+        self.bias = None
+        self.n_iter_ = None
+        self.loss_history_ = None
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "BatchedLinearRegression":
+        """
+        Trains all models on the provided data.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Training data targets (num_observations).
+
+        Raises:
+            ValueError: If `y` is not one-dimensional.
+
+        Returns:
+            BatchedLinearRegression: The fitted sweep instance.
+
+        """
+        if y.ndim != 1:
+            raise ValueError("BatchedLinearRegression expects a one-dimensional y.")
+
+        num_observations, num_features = X.shape
+        num_models = self.alphas.shape[0]
+
+        # Initialize parameters
+        self.weights = np.zeros((num_features, num_models))
+        self.bias = np.zeros(num_models)
+        self.n_iter_ = np.full(num_models, self.epochs)
+        loss_history = np.empty((self.epochs, num_models))
+        active = np.ones(num_models, dtype=bool)
+
+        # Preallocate the per-epoch buffers
+        X_T = X.T
+        error = np.empty((num_observations, num_models))
+        dw = np.empty((num_features, num_models))
+        y_column = y[:, np.newaxis]
+
+        # Gradient Descent
+        epoch = -1
+        for epoch in range(self.epochs):
+            # Calculate predictions and errors of all models
+            np.matmul(X, self.weights, out=error)
+            error += self.bias
+            error -= y_column
+            loss_history[epoch] = np.einsum("ij,ij->j", error, error) / num_observations
+
+            # Calculate gradients of all models
+            np.matmul(X_T, error, out=dw)
+            dw *= 1 / num_observations
+            dw += self.lambdas * self.weights
+            db = np.sum(error, axis=0) / num_observations
+
+            # Freeze the models whose gradient has vanished
+            if self.tol is not None:
+                grad_norm = np.sqrt(np.einsum("ij,ij->j", dw, dw) + db**2)
+                converged = active & (grad_norm < self.tol)
+                self.n_iter_[converged] = epoch + 1
+                active &= ~converged
+                if not active.any():
+                    break
+
+            # Update parameters of the active models
+            step_size = np.where(active, self.alphas, 0.0)
+            dw *= step_size
+            self.weights -= dw
+            self.bias -= step_size * db
+
+        self.loss_history_ = loss_history[: epoch + 1].copy()
+
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Makes predictions with all models.
+
+        Args:
+            X (np.ndarray): New data to predict on.
+
+        Raises:
+            ValueError: If called before the .fit() method.
+
+        Returns:
+            np.ndarray: The predicted values (num_observations, K).
+
+        """
+        if self.weights is None or self.bias is None:
+            raise ValueError("BatchedLinearRegression has not been fitted yet.")
+
+        return X @ self.weights + self.bias
+
+    def score(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Computes the mean squared error of every model, e.g. on a validation set.
+
+        Args:
+            X (np.ndarray): Validation features.
+            y (np.ndarray): Validation targets.
+
+        Returns:
+            np.ndarray: The mean squared error per model (K).
+
+        """
+        error = self.predict(X) - y[:, np.newaxis]
+        return np.einsum("ij,ij->j", error, error) / error.shape[0]
+
+    def get_model(self, index: int) -> LinearRegression:
+        """
+        Extracts one of the fitted models as a stand-alone `LinearRegression`.
+
+        Args:
+            index (int): The index of the model.
+
+        Returns:
+            LinearRegression: A fitted model with the weights and bias of that model.
+
+        """
+        model = LinearRegression(alpha=self.alphas[index], epochs=self.epochs)
+        model.weights = self.weights[:, index].copy()
+        model.bias = float(self.bias[index])
+        model.n_iter_ = int(self.n_iter_[index])
+        model.loss_history_ = self.loss_history_[: model.n_iter_, index].copy()
+
+        return model
@@ -0,0 +1,86 @@
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def iter_array_batches(
+    X: np.ndarray,
+    y: np.ndarray,
+    batch_size: int = 10_000,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Yields consecutive row batches of an array pair.
+
+    The batches are slices, so for a `np.memmap` only the rows of the current
+    batch are read from disk.
+
+    Args:
+        X (np.ndarray): Features (num_observations, num_features), e.g. a `np.memmap`.
+        y (np.ndarray): Targets (num_observations).
+        batch_size (int, optional): The number of rows per batch. Defaults to 10_000.
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]: The (X_batch, y_batch) pairs.
+    """
+    for start in range(0, X.shape[0], batch_size):
+        yield (
+            np.asarray(X[start : start + batch_size]),
+            np.asarray(y[start : start + batch_size]),
+        )
+
+
+def iter_csv_batches(
+    path: str,
+    feature_columns: Sequence[str],
+    target_column: str,
+    batch_size: int = 10_000,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Yields row batches of a CSV file without loading the whole file.
+
+    Args:
+        path (str): The path of the CSV file.
+        feature_columns (Sequence[str]): The names of the feature columns.
+        target_column (str): The name of the target column.
+        batch_size (int, optional): The number of rows per batch. Defaults to 10_000.
+
+    Yields:
+        tuple[np.ndarray, np.ndarray]: The (X_batch, y_batch) pairs.
+    """
+    columns = list(feature_columns) + [target_column]
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=batch_size):
+        yield chunk[list(feature_columns)].to_numpy(), chunk[target_column].to_numpy()
+
+
+class CSVBatches:
+    """
+    A re-iterable source of CSV batches: every iteration re-reads the file.
+    Use it with `LinearRegression.fit_stream(..., n_passes=...)` for several passes.
+
+    Args:
+        path (str): The path of the CSV file.
+        feature_columns (Sequence[str]): The names of the feature columns.
+        target_column (str): The name of the target column.
+        batch_size (int, optional): The number of rows per batch. Defaults to 10_000.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        feature_columns: Sequence[str],
+        target_column: str,
+        batch_size: int = 10_000,
+    ):
+        """
+        Initializes the source's configuration.
+        """
+        self.path = path
+        self.feature_columns = feature_columns
+        self.target_column = target_column
+        self.batch_size = batch_size
+
+    def __iter__(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        return iter_csv_batches(
+            self.path, self.feature_columns, self.target_column, self.batch_size
+        )
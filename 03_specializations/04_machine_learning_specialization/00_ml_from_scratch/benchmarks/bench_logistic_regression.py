@@ -0,0 +1,73 @@
+"""
+Benchmark for fitting `LogisticRegression` on millions of rows.
+
+Fits every solver on a synthetic binary and a multinomial problem and reports
+the fit time, the number of iterations and the training log-loss and accuracy.
+"newton" (IRLS) and "lbfgs" reach the optimum in a few passes over the data,
+while "gd" and one epoch of "sgd" show the cost of a first-order pass.
+
+Run from the `00_ml_from_scratch` directory:
+    python benchmarks/bench_logistic_regression.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from logistic_regression import LogisticRegression  # noqa: E402
+from metrics import accuracy_score, log_loss  # noqa: E402
+
+# (num_observations, num_features, num_classes)
+PROBLEMS = [(2_000_000, 20, 2), (1_000_000, 20, 5)]
+SOLVERS = [
+    ("lbfgs", {}),
+    ("newton", {}),
+    ("gd", {"alpha": 1.0, "epochs": 100}),
+    ("sgd", {"alpha": 0.05, "epochs": 1, "batch_size": 256}),
+]
+
+
+def make_problem(
+    rng: np.random.Generator, num_observations: int, num_features: int, num_classes: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draws features and labels from a multinomial logit model.
+    """
+    X = rng.normal(size=(num_observations, num_features))
+    weights = rng.normal(size=(num_features, num_classes))
+    # The argmax of the scores plus Gumbel noise follows the softmax probabilities
+    scores = X @ weights + rng.gumbel(size=(num_observations, num_classes))
+
+    return X, np.argmax(scores, axis=1)
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+
+    print(
+        f"{'shape':>16} | {'classes':>7} | {'solver':>6} | {'s':>7} | "
+        f"{'iters':>5} | {'log-loss':>8} | {'accuracy':>8}"
+    )
+    print("-" * 76)
+    for num_observations, num_features, num_classes in PROBLEMS:
+        X, y = make_problem(rng, num_observations, num_features, num_classes)
+
+        for solver, options in SOLVERS:
+            model = LogisticRegression(solver=solver, random_state=0, **options)
+            start = time.perf_counter()
+            model.fit(X, y)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{str(X.shape):>16} | {num_classes:>7} | {solver:>6} | "
+                f"{elapsed:>7.2f} | {model.n_iter_:>5} | "
+                f"{log_loss(y, model.predict_proba(X)):>8.4f} | "
+                f"{accuracy_score(y, model.predict(X)):>8.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for scoring predictions with several regression metrics at once.
+
+Compares computing MSE, MAE, R² and explained variance with one NumPy expression
+per metric (each pass allocates a full-size residual pred - y, as
+`mean_squared_error` does) with the fused single-pass `evaluate`. For each size
+it reports the time, the throughput in GB/s of y and pred and the peak temporary
+memory (traced with `tracemalloc`).
+
+Run from the `00_ml_from_scratch` directory:
+    python benchmarks/bench_metrics.py
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from metrics import evaluate  # noqa: E402
+
+SHAPES = [(100_000,), (1_000_000,), (10_000_000,), (1_000_000, 10)]
+METRICS = ["mse", "mae", "r2", "explained_variance"]
+REPEATS = 3
+
+
+def separate(y: np.ndarray, pred: np.ndarray) -> dict[str, float]:
+    """
+    Every metric computed on its own, the way `mean_squared_error` does it.
+    """
+    total = np.sum((y - np.mean(y, axis=0)) ** 2, axis=0)
+    return {
+        "mse": float(np.mean((pred - y) ** 2)),
+        "mae": float(np.mean(np.abs(pred - y))),
+        "r2": float(np.mean(1 - np.sum((pred - y) ** 2, axis=0) / total)),
+        "explained_variance": float(
+            np.mean(1 - np.var(pred - y, axis=0) / np.var(y, axis=0))
+        ),
+    }
+
+
+def fused(y: np.ndarray, pred: np.ndarray) -> dict[str, float]:
+    """
+    All metrics from one blocked pass.
+    """
+    return evaluate(y, pred, METRICS)
+
+
+def measure(score, y: np.ndarray, pred: np.ndarray) -> tuple[float, float]:
+    """
+    Returns the best time in seconds and the peak temporary bytes of a call.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    score(y, pred)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        score(y, pred)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), peak - before
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+
+    print(
+        f"{'shape':>14} | {'scoring':>8} | {'ms':>8} | {'GB/s':>6} | {'peak temp MB':>12}"
+    )
+    print("-" * 62)
+    for shape in SHAPES:
+        y = rng.normal(loc=3.0, size=shape)
+        pred = y + rng.normal(loc=0.1, scale=0.5, size=shape)
+        reference = separate(y, pred)
+
+        for name, score in [("separate", separate), ("evaluate", fused)]:
+            result = score(y, pred)
+            assert all(np.isclose(result[key], reference[key]) for key in METRICS)
+
+            elapsed, allocated = measure(score, y, pred)
+            print(
+                f"{str(shape):>14} | {name:>8} | {elapsed * 1e3:>8.1f} | "
+                f"{(y.nbytes + pred.nbytes) / elapsed / 1e9:>6.2f} | "
+                f"{allocated / 1e6:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for fitting `StandardScaler` on dense matrices of different shapes.
+
+Compares the original fit, which calls `np.mean` and `np.std` on the full array
+(several passes and a full-size temporary), with the single-pass column-blocked
+fit of `StandardScaler`, single-threaded and with one thread per CPU. For each
+shape it reports the fit time, the throughput in GB/s and the peak temporary
+memory (traced with `tracemalloc`).
+
+Run from the `00_ml_from_scratch` directory:
+    python benchmarks/bench_standard_scaler.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from preprocessing import StandardScaler  # noqa: E402
+
+SHAPES = [(1_000_000, 10), (100_000, 100), (10_000, 1_000), (2_000, 10_000)]
+REPEATS = 3
+
+
+def two_pass_fit(X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The fit as it was before the single-pass rework.
+    """
+    return np.mean(X, axis=0), np.std(X, axis=0)
+
+
+def blocked_fit(n_jobs: int | None):
+    """
+    Returns a fit with the column-blocked `StandardScaler`.
+    """
+
+    def fit(X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        scaler = StandardScaler(n_jobs=n_jobs).fit(X)
+        return scaler.mean_, scaler.scale_
+
+    return fit
+
+
+def measure(fit, X: np.ndarray) -> tuple[float, float]:
+    """
+    Returns the best fit time in seconds and the peak temporary bytes of a fit.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    fit(X)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fit(X)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), peak - before
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    fits = [
+        ("np.mean+np.std", two_pass_fit),
+        ("blocked", blocked_fit(None)),
+        (f"blocked x{os.cpu_count()}", blocked_fit(-1)),
+    ]
+
+    print(
+        f"{'shape':>16} | {'fit':>14} | {'ms':>8} | {'GB/s':>6} | {'peak temp MB':>12}"
+    )
+    print("-" * 70)
+    for shape in SHAPES:
+        X = rng.normal(loc=3.0, size=shape)
+        reference = two_pass_fit(X)
+
+        for name, fit in fits:
+            mean, scale = fit(X)
+            assert np.allclose(mean, reference[0]) and np.allclose(scale, reference[1])
+
+            elapsed, allocated = measure(fit, X)
+            print(
+                f"{str(shape):>16} | {name:>14} | {elapsed * 1e3:>8.1f} | "
+                f"{X.nbytes / elapsed / 1e9:>6.2f} | {allocated / 1e6:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
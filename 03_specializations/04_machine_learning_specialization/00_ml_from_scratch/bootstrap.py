@@ -0,0 +1,202 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from dtypes import BLOCK_BYTES
+from metrics import STREAMING_METRICS
+from parallel import SharedArray, effective_n_jobs
+
+
+def bootstrap_distribution(
+    y: np.ndarray,
+    pred: np.ndarray,
+    metric: str = "mse",
+    n_resamples: int = 1000,
+    block_size: int = 64,
+    n_jobs: int | None = None,
+    random_state: int | None = None,
+) -> np.ndarray:
+    """
+    Computes a metric on bootstrap resamples of the rows of y and pred.
+
+    Instead of scoring one resample at a time, `block_size` resamples are scored
+    together: the resample indices are drawn in chunks of rows as a
+    (rows, block_size) array, and y and pred are gathered into a 2-D block in
+    which every column is one resample. The metric's streaming accumulator then
+    reduces all columns at once, so no resample is ever materialized in full and
+    the memory stays bounded by the block size, whatever the number of rows.
+
+    Every block of resamples draws from its own child of one `SeedSequence`, so
+    the result depends only on `random_state` and `block_size`, not on `n_jobs`.
+    With several jobs, y and pred are copied once into shared memory and the
+    blocks are scored by a pool of processes. When the "spawn" start method is
+    used, the calling script must guard its entry point with
+    `if __name__ == "__main__":`.
+
+    Args:
+        y (np.ndarray): The true targets (num_observations[, num_outputs]).
+        pred (np.ndarray): The predictions, of the same shape as y.
+        metric (str, optional): A name from `STREAMING_METRICS`. Defaults to "mse".
+        n_resamples (int, optional): The number of bootstrap resamples. Defaults to 1000.
+        block_size (int, optional): The number of resamples scored together. Defaults to 64.
+        n_jobs (int | None, optional): The number of worker processes. Defaults to None (1).
+        random_state (int | None, optional): The seed of the resampling. Defaults to None.
+
+    Raises:
+        ValueError: If the metric is unknown, y and pred have different shapes,
+            there are no samples or `n_resamples` or `block_size` is below 1.
+
+    Returns:
+        np.ndarray: The metric of every resample (n_resamples).
+    """
+    y = np.asarray(y)
+    pred = np.asarray(pred)
+    if metric not in STREAMING_METRICS:
+        raise ValueError(
+            f"Unknown metric '{metric}', expected a name from {list(STREAMING_METRICS)}."
+        )
+    if y.shape != pred.shape:
+        raise ValueError(
+            f"y and pred must have the same shape, got {y.shape} and {pred.shape}."
+        )
+    if y.ndim == 0 or y.shape[0] == 0:
+        raise ValueError("Cannot bootstrap a metric without any samples.")
+    if n_resamples < 1 or block_size < 1:
+        raise ValueError("n_resamples and block_size must be at least 1.")
+
+    sizes = [
+        min(block_size, n_resamples - start)
+        for start in range(0, n_resamples, block_size)
+    ]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    n_jobs = min(effective_n_jobs(n_jobs), len(sizes))
+
+    if n_jobs == 1:
+        return np.concatenate(
+            [
+                _resample_block(y, pred, metric, seed, size)
+                for seed, size in zip(seeds, sizes)
+            ]
+        )
+
+    shared_y = SharedArray.from_array(y)
+    shared_pred = SharedArray.from_array(pred)
+    try:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            blocks = list(
+                executor.map(
+                    _shared_resample_block,
+                    [shared_y.spec] * len(sizes),
+                    [shared_pred.spec] * len(sizes),
+                    [metric] * len(sizes),
+                    seeds,
+                    sizes,
+                )
+            )
+    finally:
+        shared_y.release()
+        shared_pred.release()
+
+    return np.concatenate(blocks)
+
+
+def bootstrap_confidence_interval(
+    y: np.ndarray,
+    pred: np.ndarray,
+    metric: str = "mse",
+    confidence_level: float = 0.95,
+    n_resamples: int = 1000,
+    block_size: int = 64,
+    n_jobs: int | None = None,
+    random_state: int | None = None,
+) -> tuple[float, float]:
+    """
+    Computes a percentile bootstrap confidence interval of a metric.
+
+    Args:
+        y (np.ndarray): The true targets (num_observations[, num_outputs]).
+        pred (np.ndarray): The predictions, of the same shape as y.
+        metric (str, optional): A name from `STREAMING_METRICS`. Defaults to "mse".
+        confidence_level (float, optional): The coverage of the interval. Defaults to 0.95.
+        n_resamples (int, optional): The number of bootstrap resamples. Defaults to 1000.
+        block_size (int, optional): The number of resamples scored together. Defaults to 64.
+        n_jobs (int | None, optional): The number of worker processes. Defaults to None (1).
+        random_state (int | None, optional): The seed of the resampling. Defaults to None.
+
+    Raises:
+        ValueError: If `confidence_level` is not between 0 and 1, or for the
+            reasons of `bootstrap_distribution`.
+
+    Returns:
+        tuple[float, float]: The lower and upper bounds of the interval.
+    """
+    if not 0 < confidence_level < 1:
+        raise ValueError("confidence_level must be between 0 and 1.")
+
+    values = bootstrap_distribution(
+        y, pred, metric, n_resamples, block_size, n_jobs, random_state
+    )
+    tail = (1 - confidence_level) / 2
+    low, high = np.quantile(values, [tail, 1 - tail])
+
+    return float(low), float(high)
+
+
+def _resample_block(
+    y: np.ndarray,
+    pred: np.ndarray,
+    metric: str,
+    seed: np.random.SeedSequence,
+    n_resamples: int,
+) -> np.ndarray:
+    """
+    Scores `n_resamples` resamples at once, gathering them chunk by chunk of rows.
+    """
+    rng = np.random.default_rng(seed)
+    n = y.shape[0]
+    index_dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+    row_bytes = n_resamples * (
+        np.dtype(index_dtype).itemsize + y[:1].nbytes + pred[:1].nbytes
+    )
+    rows = max(BLOCK_BYTES // row_bytes, 1)
+
+    # Every column of the gathered block is one resample, i.e. one output. The
+    # rows are gathered straight from y and pred, which may be shared memory, so
+    # only the block is ever copied.
+    accumulator = STREAMING_METRICS[metric]()
+    for start in range(0, n, rows):
+        indices = rng.integers(
+            n, size=(min(rows, n - start), n_resamples), dtype=index_dtype
+        )
+        accumulator.update(np.take(y, indices, axis=0), np.take(pred, indices, axis=0))
+
+    values = accumulator.result(multioutput="raw_values")
+    if y.ndim > 1:
+        values = accumulator.combine_outputs(values.reshape(n_resamples, -1), axis=1)
+
+    return values
+
+
+def _shared_resample_block(
+    y_spec: tuple[str, tuple[int, ...], str],
+    pred_spec: tuple[str, tuple[int, ...], str],
+    metric: str,
+    seed: np.random.SeedSequence,
+    n_resamples: int,
+) -> np.ndarray:
+    """
+    Scores a block of resamples of the shared arrays (runs in a worker).
+    """
+    y_memory = shared_memory.SharedMemory(name=y_spec[0])
+    pred_memory = shared_memory.SharedMemory(name=pred_spec[0])
+    try:
+        y = np.ndarray(y_spec[1], dtype=y_spec[2], buffer=y_memory.buf)
+        pred = np.ndarray(pred_spec[1], dtype=pred_spec[2], buffer=pred_memory.buf)
+        values = _resample_block(y, pred, metric, seed, n_resamples)
+        del y, pred
+    finally:
+        y_memory.close()
+        pred_memory.close()
+
+    return values
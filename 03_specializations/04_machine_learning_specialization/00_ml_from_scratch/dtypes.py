@@ -0,0 +1,53 @@
+import numpy as np
+
+from sparse_utils import issparse
+
+# The floating point precisions the models can compute in
+FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+# The approximate size of the blocks that blocked passes over the data process at
+# a time, small enough for a block of the input and of the result to stay in cache
+BLOCK_BYTES = 1 << 18
+
+
+def check_float_dtype(dtype) -> np.dtype:
+    """
+    Validates a compute precision.
+
+    Args:
+        dtype: A NumPy dtype or anything `np.dtype` accepts, e.g. "float32".
+
+    Raises:
+        ValueError: If `dtype` is not float32 or float64.
+
+    Returns:
+        np.dtype: The validated dtype.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(
+            f"Unsupported dtype '{dtype}'. Expected one of "
+            f"{tuple(str(d) for d in FLOAT_DTYPES)}."
+        )
+
+    return dtype
+
+
+def as_float_array(X, dtype: np.dtype):
+    """
+    Converts dense or sparse data to the compute precision.
+
+    Data that already has the precision is returned as is, so a model that
+    computes in float32 on float32 data never copies or upcasts it.
+
+    Args:
+        X (np.ndarray | sparse matrix): The data.
+        dtype (np.dtype): The compute precision.
+
+    Returns:
+        np.ndarray | sparse matrix: The data with the given dtype.
+    """
+    if issparse(X):
+        return X.astype(dtype, copy=False)
+
+    return np.asarray(X, dtype=dtype)
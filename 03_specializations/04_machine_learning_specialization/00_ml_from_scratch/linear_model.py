@@ -0,0 +1,640 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from dtypes import as_float_array, check_float_dtype
+from optimizers import Objective, Optimizer, get_optimizer
+from sparse_utils import matmul
+
+# Solvers that minimize the objective with an optimizer from `optimizers.py`
+OPTIMIZER_SOLVERS = ("momentum", "adam", "newton", "lbfgs")
+# Solvers that every model trained by `LinearModel` supports
+ITERATIVE_SOLVERS = ("gd", "sgd") + OPTIMIZER_SOLVERS
+
+# Step size schedules for mini-batch gradient descent
+LEARNING_RATES = ("constant", "invscaling")
+
+
+class LinearModel:
+    """
+    The training machinery shared by the models with a linear score X W + b.
+
+    A subclass defines its loss through `_loss_gradient`, which turns the scores
+    into the gradient of the loss with respect to them, e.g. X W + b - y for least
+    squares or p - y for the log-loss. Everything else is shared: full-batch
+    gradient descent ("gd"), mini-batch gradient descent ("sgd") with the
+    `learning_rate` schedule, `fit_stream` and `partial_fit`, the early stopping
+    on `tol` and `n_iter_no_change`, and the optimizer solvers of `optimizers.py`,
+    which minimize the subclass's objective with `alpha` as learning rate and
+    `epochs` as iteration limit.
+
+    An L2 penalty (lambda / 2) * ||W||^2 on the weights is added by overriding
+    `_l2_penalty`, and subclasses that do not use the targets as they are, e.g.
+    class labels, override `_encode_targets` and `_target_shape`.
+
+    Args:
+        alpha (float): The learning rate.
+        epochs (int): The number of iterations.
+        solver (str | Optimizer): The name of the solver, or an `Optimizer`.
+        tol (float, optional): The tolerance for early stopping. Defaults to None
+            (run all epochs).
+        n_iter_no_change (int, optional): The number of epochs without sufficient loss
+            improvement before stopping. Defaults to 5.
+        batch_size (int, optional): The number of rows per update for solver="sgd". Defaults to 32.
+        shuffle (bool, optional): Whether to shuffle the rows every epoch for solver="sgd".
+            Defaults to True.
+        learning_rate (str, optional): The step size schedule for mini-batch updates,
+            "constant" (alpha) or "invscaling" (alpha / t ** power_t). Defaults to "constant".
+        power_t (float, optional): The exponent of the "invscaling" schedule. Defaults to 0.25.
+        random_state (int, optional): The seed for shuffling. Defaults to None.
+        warm_start (bool, optional): Whether `fit` and `fit_stream` continue from the
+            current parameters. Defaults to False.
+        chunk_size (int, optional): The number of rows per chunk when scoring into
+            `out`. Defaults to 10_000.
+        dtype (np.dtype, optional): The floating point precision, np.float32 or
+            np.float64. Defaults to np.float64.
+
+    """
+
+    # The solvers `_resolve_solver` accepts
+    _solvers = ITERATIVE_SOLVERS
+
+    def __init__(
+        self,
+        alpha: float,
+        epochs: int,
+        solver: str | Optimizer,
+        tol: float | None = None,
+        n_iter_no_change: int = 5,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        learning_rate: str = "constant",
+        power_t: float = 0.25,
+        random_state: int | None = None,
+        warm_start: bool = False,
+        chunk_size: int = 10_000,
+        dtype: np.dtype = np.float64,
+    ) -> None:
+        """
+        Initializes the model's configuration.
+
+        Raises:
+            ValueError: If `dtype` is not float32 or float64.
+
+        """
+        self.alpha = alpha
+        self.epochs = epochs
+        self.solver = solver
+        self.tol = tol
+        self.n_iter_no_change = n_iter_no_change
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.learning_rate = learning_rate
+        self.power_t = power_t
+        self.random_state = random_state
+        self.warm_start = warm_start
+        self.chunk_size = chunk_size
+        self.dtype = check_float_dtype(dtype)
+        self.weights = None
+        self.bias = None
+        self.n_iter_ = None
+        self.loss_history_ = None
+        self.t_ = 0
+
+    def fit_stream(
+        self,
+        batches: Iterable[tuple[np.ndarray, np.ndarray]],
+        n_passes: int = 1,
+    ) -> "LinearModel":
+        """
+        Trains the model with mini-batch gradient descent on a stream of batches.
+
+        Only one batch is held in memory at a time, so this works for datasets
+        that do not fit into memory, e.g. with the generators in `batching.py`.
+        The `shuffle` and `batch_size` settings do not apply: batches are used in
+        the order and size in which they arrive.
+
+        Args:
+            batches (Iterable[tuple[np.ndarray, np.ndarray]]): (X_batch, y_batch) pairs.
+            n_passes (int, optional): The number of passes over the stream. Passes after
+                the first require `batches` to be re-iterable, e.g. a list or an object
+                whose `__iter__` reopens the source. Defaults to 1.
+
+        Raises:
+            ValueError: If `n_passes` > 1 and `batches` is a one-shot iterator, or if
+                the learning rate schedule is not supported.
+
+        Returns:
+            LinearModel: The fitted model instance.
+
+        """
+        if n_passes > 1 and isinstance(batches, Iterator):
+            raise ValueError(
+                "Multiple passes require a re-iterable source of batches, not an iterator."
+            )
+        self._check_learning_rate()
+
+        initialized = False
+        loss_history = np.empty(n_passes)
+
+        epoch = -1
+        for epoch in range(n_passes):
+            total_loss, num_seen = 0.0, 0
+            for X_batch, y_batch in batches:
+                X_batch = as_float_array(X_batch, self.dtype)
+                y_batch = self._encode_targets(y_batch)
+                if not initialized:
+                    self._initialize_parameters(
+                        X_batch.shape[1], self._target_shape(y_batch)
+                    )
+                    initialized = True
+                total_loss += self._sgd_step(X_batch, y_batch) * X_batch.shape[0]
+                num_seen += X_batch.shape[0]
+
+            if num_seen == 0:
+                raise ValueError("Cannot fit the model on an empty stream of batches.")
+
+            loss_history[epoch] = total_loss / num_seen
+            if self._has_converged(loss_history, epoch):
+                break
+
+        self.n_iter_ = epoch + 1
+        self.loss_history_ = loss_history[: self.n_iter_].copy()
+
+        return self
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> "LinearModel":
+        """
+        Runs one epoch of mini-batch gradient descent, starting from the current
+        parameters if the model has already been fitted.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Training data targets (num_observations[, num_outputs]).
+
+        Raises:
+            ValueError: If the number of features or outputs differs from the fitted model.
+
+        Returns:
+            LinearModel: The updated model instance.
+
+        """
+        self._check_learning_rate()
+        X = as_float_array(X, self.dtype)
+        y = self._encode_targets(y)
+
+        if self.weights is None:
+            self._initialize_parameters(X.shape[1], self._target_shape(y))
+            self.n_iter_ = 0
+            self.loss_history_ = np.empty(0)
+        else:
+            self._check_parameter_shape(X.shape[1], self._target_shape(y))
+
+        # Vary the shuffling between calls while keeping it reproducible
+        seed = None if self.random_state is None else [self.random_state, self.t_]
+        loss = self._run_sgd_epoch(X, y, np.random.default_rng(seed))
+
+        self.n_iter_ += 1
+        self.loss_history_ = np.append(self.loss_history_, loss)
+
+        return self
+
+    def predict_iter(self, batches: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        Lazily makes predictions for a stream of batches, one batch at a time.
+
+        Args:
+            batches (Iterable[np.ndarray]): The feature batches. (X_batch, y_batch)
+                pairs, e.g. from `batching.py`, are accepted as well and y_batch is
+                ignored.
+
+        Raises:
+            ValueError: If called before the .fit() method.
+
+        Yields:
+            np.ndarray: The predictions for each batch.
+
+        """
+        self._check_fitted()
+
+        for batch in batches:
+            X_batch = batch[0] if isinstance(batch, tuple) else batch
+            yield self.predict(X_batch)
+
+    def _loss_gradient(self, scores: np.ndarray, y: np.ndarray) -> float:
+        """
+        Computes the mean loss of the scores and overwrites the scores with its
+        gradient with respect to them; implemented by the subclasses.
+
+        Args:
+            scores (np.ndarray): The scores X W + b, modified in place.
+            y (np.ndarray): The encoded targets.
+
+        Returns:
+            float: The mean loss over the rows (and outputs).
+
+        """
+        raise NotImplementedError
+
+    def _l2_penalty(self) -> float:
+        """
+        Returns the strength of the L2 penalty (lambda / 2) * ||w||^2 on the weights.
+        Unregularized models have none; regularized subclasses override this.
+
+        Returns:
+            float: The penalty strength lambda.
+
+        """
+        return 0.0
+
+    def _encode_targets(self, y: np.ndarray) -> np.ndarray:
+        """
+        Converts the targets into the form `_loss_gradient` expects, by default
+        floats in the model's dtype.
+        """
+        return as_float_array(y, self.dtype)
+
+    def _target_shape(self, y: np.ndarray) -> tuple[int, ...]:
+        """
+        Returns the shape of one column of weights for the encoded targets, () for
+        a single output or (num_outputs,).
+        """
+        return y.shape[1:]
+
+    def _objective_loss(
+        self, objective: Objective, objective_history: np.ndarray
+    ) -> np.ndarray:
+        """
+        Converts the objective values of an optimizer run into `loss_history_`, by
+        default unchanged.
+        """
+        return objective_history
+
+    def _resolve_solver(self, num_features: int) -> str | Optimizer:
+        """
+        Validates the configured solver.
+
+        Args:
+            num_features (int): The number of features of the training data.
+
+        Raises:
+            ValueError: If the solver is not one of the supported solvers.
+
+        Returns:
+            str | Optimizer: The name of the solver to use, or the optimizer instance.
+
+        """
+        if isinstance(self.solver, Optimizer):
+            return self.solver
+
+        if self.solver not in self._solvers:
+            raise ValueError(
+                f"Unknown solver '{self.solver}'. Expected one of {self._solvers}."
+            )
+
+        return self.solver
+
+    def _check_learning_rate(self) -> None:
+        """
+        Validates the configured learning rate schedule.
+
+        Raises:
+            ValueError: If the schedule is not one of the supported schedules.
+
+        """
+        if self.learning_rate not in LEARNING_RATES:
+            raise ValueError(
+                f"Unknown learning_rate '{self.learning_rate}'. "
+                f"Expected one of {LEARNING_RATES}."
+            )
+
+    def _check_fitted(self) -> None:
+        """
+        Checks that the model has parameters to predict with.
+
+        Raises:
+            ValueError: If called before the .fit() method.
+
+        """
+        if self.weights is None or self.bias is None:
+            raise ValueError(f"{type(self).__name__} model has not been fitted yet.")
+
+    def _check_parameter_shape(
+        self, num_features: int, target_shape: tuple[int, ...]
+    ) -> None:
+        """
+        Checks that new data has as many features and outputs as the fitted weights.
+
+        Args:
+            num_features (int): The number of features of the new data.
+            target_shape (tuple[int, ...]): The shape of one target row, () or (num_outputs,).
+
+        Raises:
+            ValueError: If the number of features or outputs differs from the fitted model.
+
+        """
+        if self.weights.shape[0] != num_features:
+            raise ValueError(
+                f"X has {num_features} features, but the model was fitted "
+                f"with {self.weights.shape[0]} features."
+            )
+
+        if self.weights.shape[1:] != tuple(target_shape):
+            raise ValueError(
+                f"y has target shape {tuple(target_shape)}, but the model was "
+                f"fitted with target shape {self.weights.shape[1:]}."
+            )
+
+    def _initialize_parameters(
+        self, num_features: int, target_shape: tuple[int, ...] = ()
+    ) -> None:
+        """
+        Resets the weights, bias and update counter before training, or keeps the
+        current parameters when warm starting a fitted model.
+
+        Args:
+            num_features (int): The number of features of the training data.
+            target_shape (tuple[int, ...], optional): The shape of one target row,
+                () for a single output or (num_outputs,). Defaults to ().
+
+        Raises:
+            ValueError: If warm starting with a different number of features or outputs.
+
+        """
+        if self.warm_start and self.weights is not None:
+            self._check_parameter_shape(num_features, target_shape)
+            # Copy so that in-place updates never write into an array the caller holds
+            self.weights = np.array(self.weights, dtype=self.dtype)
+            self.bias = np.asarray(self.bias, dtype=self.dtype)[()]
+            return
+
+        self.weights = np.zeros((num_features, *target_shape), dtype=self.dtype)
+        self.bias = np.zeros(target_shape, dtype=self.dtype)[()]
+        self.t_ = 0
+
+    def _fit_gradient_descent(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fits the parameters with full-batch gradient descent.
+
+        The loop does not allocate: the scores are computed into one buffer,
+        which `_loss_gradient` turns into the gradient with respect to the scores
+        in place, and the weights are updated in place.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Encoded training targets (num_observations[, num_outputs]).
+
+        """
+        num_observations, num_features = X.shape
+
+        # Initialize parameters
+        self._initialize_parameters(num_features, self._target_shape(y))
+        loss_history = np.empty(self.epochs)
+
+        # Preallocate the per-epoch buffers
+        X_T = X.T
+        scores = np.empty((num_observations, *self.weights.shape[1:]), dtype=self.dtype)
+        dw = np.empty(self.weights.shape, dtype=self.dtype)
+        l2_penalty = self._l2_penalty()
+
+        # Gradient Descent
+        epoch = -1
+        for epoch in range(self.epochs):
+            # Calculate the scores, then overwrite them with the loss gradient
+            matmul(X, self.weights, out=scores)
+            scores += self.bias
+            loss_history[epoch] = self._loss_gradient(scores, y)
+
+            # Calculate gradients
+            matmul(X_T, scores, out=dw)
+            dw *= 1 / num_observations
+            if l2_penalty:
+                dw += l2_penalty * self.weights
+            db = np.sum(scores, axis=0) / num_observations
+
+            # Stop before updating if the parameters no longer change meaningfully
+            grad_norm = np.sqrt(np.vdot(dw, dw) + np.sum(db**2))
+            if self._has_converged(loss_history, epoch, grad_norm):
+                break
+
+            # Update parameters
+            dw *= self.alpha
+            self.weights -= dw
+            self.bias = self.bias - self.alpha * db
+
+        self.n_iter_ = epoch + 1
+        self.loss_history_ = loss_history[: self.n_iter_].copy()
+
+    def _fit_optimizer(self, objective: Objective, solver: str | Optimizer) -> None:
+        """
+        Fits the parameters by minimizing the objective with an optimizer.
+
+        Args:
+            objective (Objective): The objective over the training data, which also
+                has `num_features`, `target_shape` and `unpack`.
+            solver (str | Optimizer): The optimizer name or instance.
+
+        """
+        if isinstance(solver, Optimizer):
+            optimizer = solver
+        else:
+            options = {"learning_rate": self.alpha, "max_iter": self.epochs}
+            if self.tol is not None:
+                options["tol"] = self.tol
+            optimizer = get_optimizer(solver, **options)
+
+        # Pack the weights and bias into one parameter vector
+        self._initialize_parameters(objective.num_features, objective.target_shape)
+        theta = np.concatenate([self.weights.ravel(), np.ravel(self.bias)])
+
+        theta, objective_history = optimizer.minimize(objective, theta)
+
+        self.weights, bias = objective.unpack(theta)
+        self.bias = bias[()]
+        self.n_iter_ = objective_history.shape[0]
+        self.loss_history_ = self._objective_loss(objective, objective_history)
+
+    def _fit_sgd(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fits the parameters with mini-batch stochastic gradient descent.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Encoded training targets (num_observations[, num_outputs]).
+
+        """
+        self._check_learning_rate()
+        rng = np.random.default_rng(self.random_state)
+
+        # Initialize parameters
+        self._initialize_parameters(X.shape[1], self._target_shape(y))
+        loss_history = np.empty(self.epochs)
+
+        epoch = -1
+        for epoch in range(self.epochs):
+            loss_history[epoch] = self._run_sgd_epoch(X, y, rng)
+            if self._has_converged(loss_history, epoch):
+                break
+
+        self.n_iter_ = epoch + 1
+        self.loss_history_ = loss_history[: self.n_iter_].copy()
+
+    def _run_sgd_epoch(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        rng: np.random.Generator,
+    ) -> float:
+        """
+        Makes one pass over the data in mini-batches of `batch_size` rows.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Encoded training targets (num_observations[, num_outputs]).
+            rng (np.random.Generator): The generator used for shuffling.
+
+        Returns:
+            float: The mean of the batch losses, weighted by batch size.
+
+        """
+        num_observations = X.shape[0]
+        order = rng.permutation(num_observations) if self.shuffle else None
+
+        total_loss = 0.0
+        for start in range(0, num_observations, self.batch_size):
+            stop = min(start + self.batch_size, num_observations)
+            rows = order[start:stop] if self.shuffle else slice(start, stop)
+            total_loss += self._sgd_step(X[rows], y[rows]) * (stop - start)
+
+        return total_loss / num_observations
+
+    def _sgd_step(self, X_batch: np.ndarray, y_batch: np.ndarray) -> float:
+        """
+        Makes a single gradient descent update on one mini-batch.
+
+        Args:
+            X_batch (np.ndarray): Batch features (batch_size, num_features).
+            y_batch (np.ndarray): Encoded batch targets (batch_size[, num_outputs]).
+
+        Returns:
+            float: The mean loss of the batch before the update.
+
+        """
+        batch_size = X_batch.shape[0]
+
+        scores = X_batch @ self.weights + self.bias
+        loss = self._loss_gradient(scores, y_batch)
+        dw = (1 / batch_size) * (X_batch.T @ scores) + self._l2_penalty() * self.weights
+        db = (1 / batch_size) * np.sum(scores, axis=0)
+
+        # Decay the step size with the number of updates made so far
+        step_size = self.alpha
+        if self.learning_rate == "invscaling":
+            step_size = self.alpha / (self.t_ + 1) ** self.power_t
+
+        self.weights = self.weights - step_size * dw
+        self.bias = self.bias - step_size * db
+        self.t_ += 1
+
+        return loss
+
+    def _has_converged(
+        self,
+        loss_history: np.ndarray,
+        epoch: int,
+        grad_norm: float | None = None,
+    ) -> bool:
+        """
+        Checks the early stopping criteria after an epoch.
+
+        Args:
+            loss_history (np.ndarray): The losses recorded so far.
+            epoch (int): The index of the current epoch in `loss_history`.
+            grad_norm (float, optional): The norm of the current gradient, if available.
+
+        Returns:
+            bool: True if training should stop.
+
+        """
+        if self.tol is None:
+            return False
+
+        if grad_norm is not None and grad_norm < self.tol:
+            return True
+
+        if epoch < self.n_iter_no_change:
+            return False
+
+        # Loss improvements over the last `n_iter_no_change` epochs
+        recent = loss_history[epoch - self.n_iter_no_change : epoch + 1]
+        return bool(np.all(recent[:-1] - recent[1:] < self.tol))
+
+    def _linear_scores(
+        self,
+        X: np.ndarray,
+        out: np.ndarray | None = None,
+        chunk_size: int | None = None,
+    ) -> np.ndarray:
+        """
+        Computes X W + b, in chunks of rows written straight into `out` when
+        `out` or `chunk_size` is given.
+
+        Raises:
+            ValueError: If called before the .fit() method, or if `out` has the wrong
+                shape or dtype.
+
+        """
+        self._check_fitted()
+        if out is None and chunk_size is None:
+            return as_float_array(X, self.dtype) @ self.weights + self.bias
+
+        X = self._check_rows(X)
+        chunks = self._chunks(X, out, chunk_size)
+        out = self._check_out(out, (X.shape[0], *self.weights.shape[1:]))
+        for rows, X_chunk in chunks:
+            matmul(X_chunk, self.weights, out=out[rows])
+            out[rows] += self.bias
+
+        return out
+
+    def _check_rows(self, X):
+        """
+        Converts input without a shape, e.g. nested lists, to an array. Arrays,
+        memmaps and sparse matrices are kept, and converted chunk by chunk.
+        """
+        if hasattr(X, "shape"):
+            return X
+
+        return as_float_array(X, self.dtype)
+
+    def _check_out(self, out: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Allocates the output array, or checks the one the caller passed.
+
+        Raises:
+            ValueError: If `out` has the wrong shape or dtype.
+
+        """
+        if out is None:
+            return np.empty(shape, dtype=self.dtype)
+
+        if out.shape != shape or out.dtype != self.dtype:
+            raise ValueError(
+                f"out must have shape {shape} and dtype {self.dtype}, "
+                f"got shape {out.shape} and dtype {out.dtype}."
+            )
+        return out
+
+    def _chunks(
+        self, X: np.ndarray, out: np.ndarray | None, chunk_size: int | None
+    ) -> Iterator[tuple[slice, np.ndarray]]:
+        """
+        Yields the row slices of X and their converted chunks. Without `chunk_size`,
+        X is a single chunk unless the caller passed `out`.
+        """
+        if chunk_size is None:
+            chunk_size = self.chunk_size if out is not None else X.shape[0]
+
+        for start in range(0, X.shape[0], max(chunk_size, 1)):
+            rows = slice(start, min(start + chunk_size, X.shape[0]))
+            yield rows, as_float_array(X[rows], self.dtype)
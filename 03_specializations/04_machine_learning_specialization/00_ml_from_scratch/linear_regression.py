@@ -1,38 +1,158 @@
 # Imports for the model
 import numpy as np
 
+from dtypes import as_float_array
+from linear_model import OPTIMIZER_SOLVERS, LinearModel
+from optimizers import Objective, Optimizer
+from parallel import effective_n_jobs, parallel_sufficient_stats
+from sparse_utils import column_mean, issparse, to_dense
+from sufficient_stats import SufficientStatistics
+
 # Imports for the analysis
 import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.model_selection import train_test_split
 from preprocessing import StandardScaler
 from metrics import mean_squared_error
+from bootstrap import bootstrap_confidence_interval
 from pathlib import Path
 
+# Solvers that compute the least-squares solution in a single pass
+DIRECT_SOLVERS = ("cholesky", "qr", "lstsq")
+SOLVERS = ("gd", "sgd", "auto") + DIRECT_SOLVERS + OPTIMIZER_SOLVERS
+
+# With solver="auto", problems with at most this many features are solved directly
+AUTO_DIRECT_MAX_FEATURES = 1000
+
 
-class LinearRegression:
+class LinearRegression(LinearModel):
     """
     A simple Linear Regression model implemented from scratch using Gradient Descent.
 
+    Besides gradient descent, the least-squares problem can be solved directly:
+    "cholesky" solves the normal equations, "qr" factorizes the centered data
+    matrix and "lstsq" uses the SVD based `np.linalg.lstsq`. "auto" picks a direct
+    solve when the number of features is small and gradient descent otherwise.
+
+    The solvers "momentum", "adam", "newton" and "lbfgs" minimize the objective
+    (1 / 2n) * ||X w + b - y||^2 with the optimizers of `optimizers.py`, using
+    `alpha` as learning rate and `epochs` as iteration limit. An `Optimizer`
+    instance can also be passed as solver to configure it fully. Newton's method
+    solves the problem in a single iteration and L-BFGS in a handful.
+
+    When `tol` is set, gradient descent stops early once the gradient norm drops
+    below `tol`, or once the loss has improved by less than `tol` for
+    `n_iter_no_change` consecutive epochs. After fitting, `n_iter_` holds the number
+    of epochs that were run and `loss_history_` the mean squared error per epoch
+    (averaged over outputs).
+
+    With solver="sgd", each epoch makes one update per mini-batch of `batch_size`
+    rows. `fit_stream` trains the same way on batches that are produced one at a
+    time, e.g. read in chunks from disk, so the full dataset never has to be in
+    memory.
+
+    With `warm_start=True`, the iterative solvers continue from the current weights
+    and bias instead of starting from zeros. `partial_fit` runs a single mini-batch
+    epoch from the current parameters, for incremental updates on new data.
+
+    With `precompute=True`, or when calling `fit_stats` directly, the data is reduced
+    once to its `SufficientStatistics` (means and centered (co)moments), computed in
+    chunks of `chunk_size` rows. Gradient descent and the direct solvers then work
+    in feature space only, so the cost per epoch no longer depends on the number of
+    rows.
+
+    With `n_jobs` > 1 (or -1 for all CPUs), `fit` computes the sufficient statistics
+    with a pool of processes over shared memory, each reducing its own shard of
+    rows, and then fits in feature space like `precompute=True`.
+
+    X can also be a SciPy sparse matrix (CSR or CSC). Sparse data is never
+    densified or centered: gradient descent and SGD multiply with the sparse
+    matrix directly, and the direct solvers work on its sufficient statistics,
+    whose Gram matrix only touches the stored entries.
+
+    All computations run in the precision `dtype`. With dtype=np.float32, the
+    data, the weights, the gradients and the predictions stay in float32, which
+    halves the memory traffic of every pass over X. Inputs in another precision
+    are converted once when they enter `fit`, `partial_fit`, `fit_stream` or
+    `predict`, and never upcast silently.
+
+    The target can also hold several outputs, `y` of shape (num_observations,
+    num_outputs). The weights are then a (num_features, num_outputs) matrix and
+    the bias a vector, so every pass over X serves all outputs at once.
+
     Args:
         alpha (float, optional): The learning rate. Defaults to 0.001.
         epochs (int, optional): The number of iterations for gradient descent. Defaults to 1000.
+        solver (str | Optimizer, optional): One of "gd", "sgd", "cholesky", "qr", "lstsq",
+            "auto", "momentum", "adam", "newton" and "lbfgs", or an `Optimizer`.
+            Defaults to "gd".
+        tol (float, optional): The tolerance for early stopping. Defaults to None (run all epochs).
+        n_iter_no_change (int, optional): The number of epochs without sufficient loss
+            improvement before stopping. Defaults to 5.
+        batch_size (int, optional): The number of rows per update for solver="sgd". Defaults to 32.
+        shuffle (bool, optional): Whether to shuffle the rows every epoch for solver="sgd".
+            Defaults to True.
+        learning_rate (str, optional): The step size schedule for mini-batch updates,
+            "constant" (alpha) or "invscaling" (alpha / t ** power_t). Defaults to "constant".
+        power_t (float, optional): The exponent of the "invscaling" schedule. Defaults to 0.25.
+        random_state (int, optional): The seed for shuffling. Defaults to None.
+        warm_start (bool, optional): Whether `fit` and `fit_stream` continue from the
+            current parameters. Defaults to False.
+        precompute (bool, optional): Whether `fit` first reduces the data to its sufficient
+            statistics. Defaults to False.
+        chunk_size (int, optional): The number of rows per chunk when computing the
+            sufficient statistics. Defaults to 10_000.
+        n_jobs (int, optional): The number of processes that compute the sufficient
+            statistics. Defaults to None (a single process).
+        dtype (np.dtype, optional): The floating point precision, np.float32 or
+            np.float64. Defaults to np.float64.
 
     """
 
+    _solvers = SOLVERS
+
     def __init__(
         self,
         alpha: float = 0.001,
         epochs: int = 1000,
+        solver: str | Optimizer = "gd",
+        tol: float | None = None,
+        n_iter_no_change: int = 5,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        learning_rate: str = "constant",
+        power_t: float = 0.25,
+        random_state: int | None = None,
+        warm_start: bool = False,
+        precompute: bool = False,
+        chunk_size: int = 10_000,
+        n_jobs: int | None = None,
+        dtype: np.dtype = np.float64,
     ) -> None:
         """
         Initializes the model's configuration.
 
+        Raises:
+            ValueError: If `dtype` is not float32 or float64.
+
         """
-        self.alpha = alpha
-        self.epochs = epochs
-        self.weights = None
-        self.bias = None
+        super().__init__(
+            alpha=alpha,
+            epochs=epochs,
+            solver=solver,
+            tol=tol,
+            n_iter_no_change=n_iter_no_change,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            learning_rate=learning_rate,
+            power_t=power_t,
+            random_state=random_state,
+            warm_start=warm_start,
+            chunk_size=chunk_size,
+            dtype=dtype,
+        )
+        self.precompute = precompute
+        self.n_jobs = n_jobs
 
     def fit(
         self,
@@ -44,56 +164,545 @@ class LinearRegression:
 
         Args:
             X (np.ndarray): Training data features (num_observations, num_features).
-            y (np.ndarray): Training data targets (num_observations).
+            y (np.ndarray): Training data targets (num_observations) or
+                (num_observations, num_outputs).
+
+        Raises:
+            ValueError: If the solver is not one of the supported solvers, or is
+                "sgd" with `n_jobs` > 1.
 
         Returns:
             LinearRegression: The fitted model instance.
 
         """
-        num_observations, num_features = X.shape
+        X = as_float_array(X, self.dtype)
+        y = as_float_array(y, self.dtype)
+        solver = self._resolve_solver(X.shape[1])
+
+        if effective_n_jobs(self.n_jobs) > 1:
+            if solver == "sgd":
+                raise ValueError(
+                    "solver='sgd' needs the individual rows and cannot be combined "
+                    "with n_jobs > 1."
+                )
+            return self.fit_stats(
+                parallel_sufficient_stats(
+                    X, y, n_jobs=self.n_jobs, chunk_size=self.chunk_size
+                )
+            )
+
+        # Centering sparse data would densify it, so direct solvers use its statistics
+        if self.precompute or (issparse(X) and solver in DIRECT_SOLVERS):
+            return self.fit_stats(
+                SufficientStatistics.from_arrays(X, y, chunk_size=self.chunk_size)
+            )
+
+        if solver == "gd":
+            self._fit_gradient_descent(X, y)
+        elif solver == "sgd":
+            self._fit_sgd(X, y)
+        elif solver in DIRECT_SOLVERS:
+            self._fit_direct(X, y, solver)
+        else:
+            objective = _LeastSquaresObjective(X, y, self._l2_penalty())
+            self._fit_optimizer(objective, solver)
 
-        # Initialize parameters
-        self.weights = np.zeros(num_features)
-        self.bias = 0
+        return self
 
-        # Gradient Descent
-        for _ in range(self.epochs):
-            # Calculate predictions
-            preds = X @ self.weights + self.bias
+    def fit_stats(self, stats: SufficientStatistics) -> "LinearRegression":
+        """
+        Trains the model on the sufficient statistics of the data.
+
+        Gradient descent runs exactly the same updates as on the full data, and
+        "qr" and "lstsq" solve the normal equations with `np.linalg.lstsq` since
+        the data matrix itself is not available.
+
+        Args:
+            stats (SufficientStatistics): The statistics of the training data.
+
+        Raises:
+            ValueError: If the statistics are empty, or the solver is "sgd" (which
+                needs the individual rows) or not supported.
+
+        Returns:
+            LinearRegression: The fitted model instance.
+
+        """
+        if stats.n_samples_ == 0:
+            raise ValueError("Cannot fit the model on empty statistics.")
+
+        stats = stats.astype(self.dtype)
+        solver = self._resolve_solver(stats.mean_x_.shape[0])
+
+        if solver == "sgd":
+            raise ValueError(
+                "solver='sgd' needs the individual rows and cannot be fitted "
+                "from sufficient statistics."
+            )
+
+        if solver == "gd":
+            self._fit_gradient_descent_stats(stats)
+        elif solver not in DIRECT_SOLVERS:
+            objective = _StatsLeastSquaresObjective(stats, self._l2_penalty())
+            self._fit_optimizer(objective, solver)
+        else:
+            gram = _add_to_diagonal(stats.xx_, stats.n_samples_ * self._l2_penalty())
+            if solver == "cholesky":
+                self.weights = _solve_cholesky(gram, stats.xy_)
+            else:
+                self.weights = _solve_lstsq(gram, stats.xy_)
+
+            self.bias = stats.mean_y_ - stats.mean_x_ @ self.weights
+            self.n_iter_ = 1
+            self.loss_history_ = np.array([_stats_loss(stats, self.weights)])
+
+        return self
+
+    def _resolve_solver(self, num_features: int) -> str | Optimizer:
+        """
+        Validates the configured solver and resolves "auto" to a concrete solver.
+
+        Args:
+            num_features (int): The number of features of the training data.
 
-            # Calculate error
-            error = preds - y
+        Raises:
+            ValueError: If the solver is not one of the supported solvers.
+
+        Returns:
+            str | Optimizer: The name of the solver to use, or the optimizer instance.
+
+        """
+        solver = super()._resolve_solver(num_features)
+        if solver == "auto":
+            return "cholesky" if num_features <= AUTO_DIRECT_MAX_FEATURES else "gd"
 
-            # Calculate gradients
-            dw = (1 / num_observations) * (X.T @ error)
-            db = (1 / num_observations) * np.sum(error)
+        return solver
+
+    def _loss_gradient(self, error: np.ndarray, y: np.ndarray) -> float:
+        """
+        Turns the predictions into the error X W + b - y in place, the gradient of
+        (1 / 2) * error^2 with respect to them.
+
+        Args:
+            error (np.ndarray): The predictions, overwritten with the error.
+            y (np.ndarray): The targets.
+
+        Returns:
+            float: The mean squared error, averaged over outputs.
+
+        """
+        error -= y
+        return float(np.vdot(error, error) / error.size)
+
+    def _objective_loss(
+        self, objective: Objective, objective_history: np.ndarray
+    ) -> np.ndarray:
+        """
+        Converts the least-squares objective values into mean squared errors.
+        """
+        # Twice the objective is the mean squared error (plus penalty), averaged over outputs
+        return 2 * objective_history / objective.num_outputs
+
+    def _fit_gradient_descent_stats(self, stats: SufficientStatistics) -> None:
+        """
+        Fits the parameters with full-batch gradient descent in feature space.
+
+        With the error split into its centered part and the constant offset
+        c = mean_x @ w + b - mean_y, the gradients over all rows are
+        dw = (XX w - Xy) / n + outer(mean_x, c) and db = c, where XX and Xy are the
+        centered moments. Each epoch therefore costs O(num_features^2).
+
+        Args:
+            stats (SufficientStatistics): The statistics of the training data.
+
+        """
+        num_observations = stats.n_samples_
+        num_features = stats.mean_x_.shape[0]
+        num_outputs = np.size(stats.mean_y_)
+
+        # Initialize parameters
+        self._initialize_parameters(num_features, np.shape(stats.mean_y_))
+        loss_history = np.empty(self.epochs)
+
+        # Preallocate the per-epoch buffers
+        xx_w = np.empty(self.weights.shape, dtype=self.dtype)
+        dw = np.empty(self.weights.shape, dtype=self.dtype)
+        l2_penalty = self._l2_penalty()
+
+        # Gradient Descent
+        epoch = -1
+        for epoch in range(self.epochs):
+            # Offset of the mean prediction from the mean target
+            offset = stats.mean_x_ @ self.weights + self.bias - stats.mean_y_
+
+            # Calculate loss and gradients from the statistics
+            np.matmul(stats.xx_, self.weights, out=xx_w)
+            loss_history[epoch] = (
+                np.vdot(self.weights, xx_w)
+                - 2 * np.vdot(self.weights, stats.xy_)
+                + np.sum(stats.yy_)
+            ) / (num_observations * num_outputs) + np.mean(offset**2)
+
+            np.subtract(xx_w, stats.xy_, out=dw)
+            dw *= 1 / num_observations
+            dw += np.multiply.outer(stats.mean_x_, offset)
+            if l2_penalty:
+                dw += l2_penalty * self.weights
+            db = offset
+
+            # Stop before updating if the parameters no longer change meaningfully
+            grad_norm = np.sqrt(np.vdot(dw, dw) + np.sum(db**2))
+            if self._has_converged(loss_history, epoch, grad_norm):
+                break
 
             # Update parameters
-            self.weights = self.weights - self.alpha * dw
+            dw *= self.alpha
+            self.weights -= dw
             self.bias = self.bias - self.alpha * db
 
-        return self
+        self.n_iter_ = epoch + 1
+        self.loss_history_ = loss_history[: self.n_iter_].copy()
 
-    def predict(self, X: np.ndarray) -> np.ndarray:
+    def _fit_direct(self, X: np.ndarray, y: np.ndarray, solver: str) -> None:
+        """
+        Solves the least-squares problem directly in a single pass over the data.
+
+        The data is centered first so that the intercept drops out of the system:
+        the weights solve the centered problem and the bias is recovered from
+        the feature and target means. An L2 penalty is added to the diagonal of
+        the normal equations, or as extra rows sqrt(n * lambda) * I for "qr" and
+        "lstsq".
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Training data targets (num_observations).
+            solver (str): One of "cholesky", "qr" or "lstsq".
+
+        """
+        X_mean = np.mean(X, axis=0)
+        y_mean = np.mean(y, axis=0)
+        X_centered = X - X_mean
+        y_centered = y - y_mean
+        penalty = X.shape[0] * self._l2_penalty()
+
+        if solver == "cholesky":
+            gram = _add_to_diagonal(X_centered.T @ X_centered, penalty)
+            self.weights = _solve_cholesky(gram, X_centered.T @ y_centered)
+        else:
+            X_solve, y_solve = X_centered, y_centered
+            if penalty:
+                # Ridge as ordinary least squares on data augmented with penalty rows
+                X_solve = np.vstack(
+                    [X_centered, np.sqrt(penalty * np.eye(X.shape[1], dtype=X.dtype))]
+                )
+                y_solve = np.concatenate(
+                    [y_centered, np.zeros((X.shape[1], *y.shape[1:]), dtype=y.dtype)]
+                )
+
+            if solver == "qr":
+                self.weights = _solve_qr(X_solve, y_solve)
+            else:
+                self.weights = _solve_lstsq(X_solve, y_solve)
+
+        self.bias = y_mean - X_mean @ self.weights
+        self.n_iter_ = 1
+        self.loss_history_ = np.array(
+            [np.mean((X_centered @ self.weights - y_centered) ** 2)]
+        )
+
+    def predict(
+        self,
+        X: np.ndarray,
+        out: np.ndarray | None = None,
+        chunk_size: int | None = None,
+    ) -> np.ndarray:
         """
         Makes predictions on new data using the trained model.
 
+        With `out` or `chunk_size` given, X is scored in chunks of rows that are
+        written straight into the output, so only one chunk of converted input is
+        held at a time. `out` can be a `np.memmap`, which lets huge batches be
+        scored from disk to disk with bounded memory.
+
         Args:
-            X (np.ndarray): New data to predict on.
+            X (np.ndarray): New data to predict on, e.g. a `np.memmap`.
+            out (np.ndarray, optional): The array to write the predictions into, of the
+                model's dtype. Defaults to None (allocate a new array).
+            chunk_size (int, optional): The number of rows per chunk. Defaults to None
+                (a single chunk, or `self.chunk_size` rows when `out` is given).
 
         Raises:
-            ValueError: If called before the .fit() method.
+            ValueError: If called before the .fit() method, or if `out` has the wrong
+                shape or dtype.
 
         Returns:
-            np.ndarray: The predicted values.
+            np.ndarray: The predicted values (num_observations) or
+                (num_observations, num_outputs), `out` if it was given.
 
         """
+        return self._linear_scores(X, out, chunk_size)
 
-        # Check that weights or bias are not None before predicting
-        if self.weights is None or self.bias is None:
-            raise ValueError("LinearRegression model has not been fitted yet.")
 
-        return X @ self.weights + self.bias
+class _LeastSquaresObjective:
+    """
+    The objective (1 / 2n) * ||X W + b - Y||^2 + (lambda / 2) * ||W||^2 as a function
+    of the flat parameter vector theta = [W; b], for the optimizers in `optimizers.py`.
+
+    The Hessian is the same for every output and every theta, so it is computed
+    once and `hessian_solve` applies it to all outputs at the same time.
+
+    Args:
+        X (np.ndarray): Training data features (num_observations, num_features).
+        y (np.ndarray): Training data targets (num_observations[, num_outputs]).
+        l2_penalty (float): The strength lambda of the L2 penalty.
+
+    """
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, l2_penalty: float) -> None:
+        self.X = X
+        self.y = y
+        self.l2_penalty = l2_penalty
+        self.num_features = X.shape[1]
+        self.target_shape = y.shape[1:]
+        self.num_outputs = int(np.prod(self.target_shape))
+        self._hessian = None
+
+    def unpack(self, theta: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Splits the parameter vector into the weights and the bias.
+        """
+        params = theta.reshape((self.num_features + 1, *self.target_shape))
+        return params[:-1].copy(), params[-1].copy()
+
+    def loss_and_grad(self, theta: np.ndarray) -> tuple[float, np.ndarray]:
+        """
+        Returns the objective value and its gradient at `theta`.
+        """
+        weights, bias = self.unpack(theta)
+        num_observations = self.X.shape[0]
+
+        error = self.X @ weights + bias - self.y
+        loss = np.vdot(error, error) / (2 * num_observations)
+        loss += self.l2_penalty / 2 * np.vdot(weights, weights)
+
+        grad = np.empty((self.num_features + 1, *self.target_shape), dtype=theta.dtype)
+        grad[:-1] = self.X.T @ error / num_observations + self.l2_penalty * weights
+        grad[-1] = np.sum(error, axis=0) / num_observations
+
+        return float(loss), grad.ravel()
+
+    def hessian_solve(self, theta: np.ndarray, grad: np.ndarray) -> np.ndarray:
+        """
+        Returns H^-1 @ grad for the (constant) Hessian of the objective.
+        """
+        if self._hessian is None:
+            self._hessian = _least_squares_hessian(
+                to_dense(self.X.T @ self.X) / self.X.shape[0],
+                column_mean(self.X),
+                self.l2_penalty,
+            )
+
+        grad = grad.reshape((self.num_features + 1, *self.target_shape))
+        return np.linalg.solve(self._hessian, grad).ravel()
+
+
+class _StatsLeastSquaresObjective(_LeastSquaresObjective):
+    """
+    The least-squares objective of `_LeastSquaresObjective`, evaluated from the
+    sufficient statistics of the data in O(num_features^2) per evaluation.
+
+    Args:
+        stats (SufficientStatistics): The statistics of the training data.
+        l2_penalty (float): The strength lambda of the L2 penalty.
+
+    """
+
+    def __init__(self, stats: SufficientStatistics, l2_penalty: float) -> None:
+        self.stats = stats
+        self.l2_penalty = l2_penalty
+        self.num_features = stats.mean_x_.shape[0]
+        self.target_shape = np.shape(stats.mean_y_)
+        self.num_outputs = int(np.prod(self.target_shape))
+        self._hessian = None
+
+    def loss_and_grad(self, theta: np.ndarray) -> tuple[float, np.ndarray]:
+        """
+        Returns the objective value and its gradient at `theta`.
+        """
+        stats = self.stats
+        weights, bias = self.unpack(theta)
+        num_observations = stats.n_samples_
+
+        # Offset of the mean prediction from the mean target
+        offset = stats.mean_x_ @ weights + bias - stats.mean_y_
+        xx_w = stats.xx_ @ weights
+
+        sse = (
+            np.vdot(weights, xx_w)
+            - 2 * np.vdot(weights, stats.xy_)
+            + np.sum(stats.yy_)
+            + num_observations * np.sum(offset**2)
+        )
+        loss = sse / (2 * num_observations)
+        loss += self.l2_penalty / 2 * np.vdot(weights, weights)
+
+        grad = np.empty((self.num_features + 1, *self.target_shape), dtype=theta.dtype)
+        grad[:-1] = (xx_w - stats.xy_) / num_observations
+        grad[:-1] += np.multiply.outer(stats.mean_x_, offset)
+        grad[:-1] += self.l2_penalty * weights
+        grad[-1] = offset
+
+        return float(loss), grad.ravel()
+
+    def hessian_solve(self, theta: np.ndarray, grad: np.ndarray) -> np.ndarray:
+        """
+        Returns H^-1 @ grad for the (constant) Hessian of the objective.
+        """
+        if self._hessian is None:
+            stats = self.stats
+            # Uncentered second moment of the features
+            second_moment = stats.xx_ / stats.n_samples_ + np.multiply.outer(
+                stats.mean_x_, stats.mean_x_
+            )
+            self._hessian = _least_squares_hessian(
+                second_moment, stats.mean_x_, self.l2_penalty
+            )
+
+        grad = grad.reshape((self.num_features + 1, *self.target_shape))
+        return np.linalg.solve(self._hessian, grad).ravel()
+
+
+def _least_squares_hessian(
+    second_moment: np.ndarray, mean_x: np.ndarray, l2_penalty: float
+) -> np.ndarray:
+    """
+    Builds the Hessian of the least-squares objective with respect to [w; b].
+
+    Args:
+        second_moment (np.ndarray): The uncentered second moment X^T X / n.
+        mean_x (np.ndarray): The feature means.
+        l2_penalty (float): The strength lambda of the L2 penalty.
+
+    Returns:
+        np.ndarray: The (num_features + 1, num_features + 1) Hessian.
+
+    """
+    num_features = mean_x.shape[0]
+    hessian = np.empty((num_features + 1, num_features + 1), dtype=second_moment.dtype)
+    hessian[:-1, :-1] = _add_to_diagonal(second_moment, l2_penalty)
+    hessian[:-1, -1] = mean_x
+    hessian[-1, :-1] = mean_x
+    hessian[-1, -1] = 1.0
+
+    return hessian
+
+
+def _add_to_diagonal(matrix: np.ndarray, value: float) -> np.ndarray:
+    """
+    Returns a copy of a square matrix with `value` added to its diagonal.
+
+    Args:
+        matrix (np.ndarray): The square matrix, e.g. a Gram matrix.
+        value (float): The value to add, e.g. n * lambda for ridge regression.
+
+    Returns:
+        np.ndarray: The shifted matrix, or `matrix` itself when `value` is 0.
+
+    """
+    if not value:
+        return matrix
+
+    shifted = matrix.copy()
+    shifted[np.diag_indices_from(shifted)] += value
+    return shifted
+
+
+def _solve_cholesky(gram: np.ndarray, moment: np.ndarray) -> np.ndarray:
+    """
+    Solves the normal equations (X^T X) w = X^T y with a Cholesky factorization.
+
+    Falls back to `_solve_lstsq` when X^T X is not positive definite, e.g. when
+    features are collinear.
+
+    Args:
+        gram (np.ndarray): The Gram matrix X^T X of the centered features.
+        moment (np.ndarray): The product X^T y of the centered features and targets.
+
+    Returns:
+        np.ndarray: The least-squares weights.
+
+    """
+    try:
+        L = np.linalg.cholesky(gram)
+    except np.linalg.LinAlgError:
+        # The minimum-norm solution of the normal equations is the least-squares one
+        return _solve_lstsq(gram, moment)
+
+    # Forward substitution L z = X^T y, then back substitution L^T w = z
+    z = np.linalg.solve(L, moment)
+    return np.linalg.solve(L.T, z)
+
+
+def _solve_qr(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Solves the least-squares problem with a reduced QR factorization X = QR.
+
+    Args:
+        X (np.ndarray): Centered features (num_observations, num_features).
+        y (np.ndarray): Centered targets (num_observations[, num_outputs]).
+
+    Returns:
+        np.ndarray: The least-squares weights.
+
+    """
+    if X.shape[0] < X.shape[1]:
+        # R would not be square, so there is no unique triangular solve
+        return _solve_lstsq(X, y)
+
+    Q, R = np.linalg.qr(X)
+    try:
+        return np.linalg.solve(R, Q.T @ y)
+    except np.linalg.LinAlgError:
+        return _solve_lstsq(X, y)
+
+
+def _solve_lstsq(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Solves the least-squares problem with the SVD based `np.linalg.lstsq`.
+
+    This is the most robust solver and returns the minimum-norm solution when
+    the problem is rank deficient.
+
+    Args:
+        X (np.ndarray): Centered features (num_observations, num_features).
+        y (np.ndarray): Centered targets (num_observations[, num_outputs]).
+
+    Returns:
+        np.ndarray: The least-squares weights.
+
+    """
+    weights, *_ = np.linalg.lstsq(X, y, rcond=None)
+    return weights
+
+
+def _stats_loss(stats: SufficientStatistics, weights: np.ndarray) -> float:
+    """
+    Computes the mean squared error of the least-squares weights from the statistics.
+
+    Args:
+        stats (SufficientStatistics): The statistics of the training data.
+        weights (np.ndarray): The fitted weights; the bias is assumed optimal.
+
+    Returns:
+        float: The mean squared error on the training data, averaged over outputs.
+
+    """
+    sse = (
+        np.vdot(weights, stats.xx_ @ weights)
+        - 2 * np.vdot(weights, stats.xy_)
+        + np.sum(stats.yy_)
+    )
+    return float(max(sse, 0.0) / (stats.n_samples_ * np.size(stats.mean_y_)))
 
 
 def run_analysis():
@@ -126,13 +735,18 @@ def run_analysis():
     )  # Use the same scaler for the test set (no fitting this time)
 
     # Create the Regressor, fit the data, and make predictions
-    reg = LinearRegression(alpha=0.001, epochs=10000)
+    reg = LinearRegression(alpha=0.001, epochs=10000, tol=1e-6)
     reg.fit(X_train_scaled, y_train)
     preds = reg.predict(X_test_scaled)
+    print(f"Gradient descent converged after {reg.n_iter_} of {reg.epochs} epochs")
 
     # Calculate MSE
     mse = mean_squared_error(y_test, preds)
     print(f"Mean Squared Error on the test set: {mse:.2f}")
+    low, high = bootstrap_confidence_interval(
+        y_test, preds, metric="mse", n_resamples=10_000, random_state=42
+    )
+    print(f"95% bootstrap confidence interval of the MSE: [{low:.2f}, {high:.2f}]")
 
     # Visualize Results
     plt.figure(figsize=(8, 6))
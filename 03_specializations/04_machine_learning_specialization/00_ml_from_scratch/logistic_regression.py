@@ -0,0 +1,563 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from dtypes import as_float_array
+from linear_model import LinearModel
+from optimizers import Optimizer
+from sparse_utils import to_dense
+
+
+class LogisticRegression(LinearModel):
+    """
+    A Logistic Regression classifier implemented from scratch.
+
+    Minimizes the mean log-loss plus an L2 penalty (lambda_ / 2) * ||W||^2 on the
+    weights (the bias is not penalized). With two classes the model is the usual
+    sigmoid of one linear score; with more, it is multinomial: the weights are a
+    (num_features, num_classes) matrix and the probabilities the softmax of the
+    scores, so every pass over X serves all classes at once.
+
+    The loss is evaluated from the scores without ever forming log(p): the binary
+    loss as softplus(z) - y z with exp(-|z|), and the multinomial one with a
+    max-shifted log-sum-exp, so it never overflows or takes log(0). The same
+    pass turns the score buffer into the gradient with respect to the scores
+    (p - y) in place, which then takes one more product with X to become the
+    gradient of the weights.
+
+    The solvers "gd" (full-batch gradient descent) and "sgd" (mini-batches of
+    `batch_size` rows, with the `learning_rate` schedule) are those of
+    `LinearModel`, shared with `LinearRegression`. "momentum", "adam", "newton"
+    and "lbfgs" minimize the objective with the optimizers of `optimizers.py`,
+    using `alpha` as learning rate and `epochs` as iteration limit; an
+    `Optimizer` instance can be passed as well. "newton" is IRLS: every step solves with the Hessian
+    X^T diag(p (1 - p)) X (one block per pair of classes in the multinomial
+    case), accumulated in chunks of `chunk_size` rows so that its memory does
+    not grow with the data. It converges in a handful of iterations when the
+    number of features is moderate.
+
+    `fit_stream` and `partial_fit` train with mini-batches on data that arrives
+    in pieces. Since a piece may not contain every class, the classes are then
+    passed explicitly on the first call.
+
+    X can be a SciPy sparse matrix, and all computations run in the precision
+    `dtype`, as in `LinearRegression`. After fitting, `classes_` holds the
+    sorted class labels, `n_iter_` the number of epochs or iterations and
+    `loss_history_` the mean log-loss per epoch (the full objective, penalty
+    included, with the optimizer solvers).
+
+    Args:
+        alpha (float, optional): The learning rate. Defaults to 0.1.
+        epochs (int, optional): The number of iterations. Defaults to 1000.
+        solver (str | Optimizer, optional): One of "gd", "sgd", "momentum", "adam",
+            "newton" and "lbfgs", or an `Optimizer`. Defaults to "lbfgs".
+        lambda_ (float, optional): The L2 regularization strength, which also keeps
+            the weights finite on separable data. Defaults to 1e-4.
+        tol (float, optional): The tolerance for early stopping. Defaults to None (run
+            all epochs with "gd" and "sgd", the optimizer's tolerance otherwise).
+        n_iter_no_change (int, optional): The number of epochs without sufficient loss
+            improvement before stopping. Defaults to 5.
+        batch_size (int, optional): The number of rows per update for solver="sgd". Defaults to 32.
+        shuffle (bool, optional): Whether to shuffle the rows every epoch for solver="sgd".
+            Defaults to True.
+        learning_rate (str, optional): The step size schedule for mini-batch updates,
+            "constant" (alpha) or "invscaling" (alpha / t ** power_t). Defaults to "constant".
+        power_t (float, optional): The exponent of the "invscaling" schedule. Defaults to 0.25.
+        random_state (int, optional): The seed for shuffling. Defaults to None.
+        warm_start (bool, optional): Whether `fit` and `fit_stream` continue from the
+            current parameters. Defaults to False.
+        chunk_size (int, optional): The number of rows per chunk when accumulating the
+            Hessian or scoring into `out`. Defaults to 10_000.
+        dtype (np.dtype, optional): The floating point precision, np.float32 or
+            np.float64. Defaults to np.float64.
+
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        epochs: int = 1000,
+        solver: str | Optimizer = "lbfgs",
+        lambda_: float = 1e-4,
+        tol: float | None = None,
+        n_iter_no_change: int = 5,
+        batch_size: int = 32,
+        shuffle: bool = True,
+        learning_rate: str = "constant",
+        power_t: float = 0.25,
+        random_state: int | None = None,
+        warm_start: bool = False,
+        chunk_size: int = 10_000,
+        dtype: np.dtype = np.float64,
+    ) -> None:
+        """
+        Initializes the model's configuration.
+
+        Raises:
+            ValueError: If `dtype` is not float32 or float64.
+
+        """
+        super().__init__(
+            alpha=alpha,
+            epochs=epochs,
+            solver=solver,
+            tol=tol,
+            n_iter_no_change=n_iter_no_change,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            learning_rate=learning_rate,
+            power_t=power_t,
+            random_state=random_state,
+            warm_start=warm_start,
+            chunk_size=chunk_size,
+            dtype=dtype,
+        )
+        self.lambda_ = lambda_
+        self.classes_ = None
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "LogisticRegression":
+        """
+        Trains the classifier on the provided data.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Training data labels (num_observations).
+
+        Raises:
+            ValueError: If the solver is not supported, y has fewer than two
+                classes, or warm starting with different classes.
+
+        Returns:
+            LogisticRegression: The fitted model instance.
+
+        """
+        X = as_float_array(X, self.dtype)
+        solver = self._resolve_solver(X.shape[1])
+        self._set_classes(np.unique(y), self.warm_start and self.weights is not None)
+        y = self._encode_targets(y)
+
+        if solver == "gd":
+            self._fit_gradient_descent(X, y)
+        elif solver == "sgd":
+            self._fit_sgd(X, y)
+        else:
+            objective = _LogLossObjective(
+                X, y, self.classes_.shape[0], self.lambda_, self.chunk_size
+            )
+            self._fit_optimizer(objective, solver)
+
+        return self
+
+    def fit_stream(
+        self,
+        batches: Iterable[tuple[np.ndarray, np.ndarray]],
+        n_passes: int = 1,
+        classes: np.ndarray | None = None,
+    ) -> "LogisticRegression":
+        """
+        Trains the classifier with mini-batch gradient descent on a stream of batches.
+
+        Only one batch is held in memory at a time. The `shuffle` and `batch_size`
+        settings do not apply: batches are used in the order and size in which
+        they arrive.
+
+        Args:
+            batches (Iterable[tuple[np.ndarray, np.ndarray]]): (X_batch, y_batch) pairs.
+            n_passes (int, optional): The number of passes over the stream. Passes after
+                the first require `batches` to be re-iterable. Defaults to 1.
+            classes (np.ndarray, optional): All class labels. Required unless the model
+                already has `classes_`. Defaults to None.
+
+        Raises:
+            ValueError: If `n_passes` > 1 and `batches` is a one-shot iterator, the
+                classes are unknown, a batch has an unknown label or the learning
+                rate schedule is not supported.
+
+        Returns:
+            LogisticRegression: The fitted model instance.
+
+        """
+        self._set_classes(classes, self.warm_start and self.weights is not None)
+        return super().fit_stream(batches, n_passes)
+
+    def partial_fit(
+        self, X: np.ndarray, y: np.ndarray, classes: np.ndarray | None = None
+    ) -> "LogisticRegression":
+        """
+        Runs one epoch of mini-batch gradient descent, starting from the current
+        parameters if the model has already been fitted.
+
+        Args:
+            X (np.ndarray): Training data features (num_observations, num_features).
+            y (np.ndarray): Training data labels (num_observations).
+            classes (np.ndarray, optional): All class labels. Required on the first
+                call, since y may not contain all of them. Defaults to None.
+
+        Raises:
+            ValueError: If the classes are unknown or differ from the fitted ones, or
+                the number of features differs from the fitted model.
+
+        Returns:
+            LogisticRegression: The updated model instance.
+
+        """
+        self._set_classes(classes, self.weights is not None)
+        return super().partial_fit(X, y)
+
+    def decision_function(
+        self,
+        X: np.ndarray,
+        out: np.ndarray | None = None,
+        chunk_size: int | None = None,
+    ) -> np.ndarray:
+        """
+        Computes the linear scores X W + b, the log-odds of the larger class for
+        two classes and the unnormalized log-probabilities otherwise.
+
+        Args:
+            X (np.ndarray): New data (num_observations, num_features), e.g. a `np.memmap`.
+            out (np.ndarray, optional): The array to write the scores into, of the
+                model's dtype. Defaults to None (allocate a new array).
+            chunk_size (int, optional): The number of rows per chunk. Defaults to None
+                (a single chunk, or `self.chunk_size` rows when `out` is given).
+
+        Raises:
+            ValueError: If called before the .fit() method, or if `out` has the wrong
+                shape or dtype.
+
+        Returns:
+            np.ndarray: The scores (num_observations) for two classes, or
+                (num_observations, num_classes), `out` if it was given.
+
+        """
+        return self._linear_scores(X, out, chunk_size)
+
+    def predict_proba(
+        self,
+        X: np.ndarray,
+        out: np.ndarray | None = None,
+        chunk_size: int | None = None,
+    ) -> np.ndarray:
+        """
+        Estimates the probability of every class.
+
+        Args:
+            X (np.ndarray): New data (num_observations, num_features), e.g. a `np.memmap`.
+            out (np.ndarray, optional): The array to write the probabilities into, of
+                the model's dtype. Defaults to None (allocate a new array).
+            chunk_size (int, optional): The number of rows per chunk. Defaults to None
+                (a single chunk, or `self.chunk_size` rows when `out` is given).
+
+        Raises:
+            ValueError: If called before the .fit() method, or if `out` has the wrong
+                shape or dtype.
+
+        Returns:
+            np.ndarray: The probabilities (num_observations, num_classes), in the
+                order of `classes_`, `out` if it was given.
+
+        """
+        self._check_fitted()
+        X = self._check_rows(X)
+        # Only an `out` from the caller makes the rows default to chunks
+        chunks = self._chunks(X, out, chunk_size)
+        out = self._check_out(out, (X.shape[0], self.classes_.shape[0]))
+
+        for rows, X_chunk in chunks:
+            scores = X_chunk @ self.weights + self.bias
+            if scores.ndim == 1:
+                _sigmoid(scores, out=out[rows, 1])
+                np.subtract(1, out[rows, 1], out=out[rows, 0])
+            else:
+                out[rows] = _softmax(scores)
+
+        return out
+
+    def predict(self, X: np.ndarray, chunk_size: int | None = None) -> np.ndarray:
+        """
+        Predicts the most probable class.
+
+        Args:
+            X (np.ndarray): New data (num_observations, num_features), e.g. a `np.memmap`.
+            chunk_size (int, optional): The number of rows per chunk. Defaults to None
+                (a single chunk).
+
+        Raises:
+            ValueError: If called before the .fit() method.
+
+        Returns:
+            np.ndarray: The predicted labels (num_observations).
+
+        """
+        self._check_fitted()
+        X = self._check_rows(X)
+        codes = np.empty(X.shape[0], dtype=np.intp)
+
+        for rows, X_chunk in self._chunks(X, None, chunk_size):
+            scores = X_chunk @ self.weights + self.bias
+            # The sigmoid crosses 1/2 where the log-odds cross 0
+            codes[rows] = scores > 0 if scores.ndim == 1 else np.argmax(scores, axis=1)
+
+        return self.classes_[codes]
+
+    def _set_classes(self, classes: np.ndarray | None, keep_parameters: bool) -> None:
+        """
+        Sets the sorted class labels, or keeps the current ones if `classes` is None.
+
+        Args:
+            classes (np.ndarray | None): The class labels.
+            keep_parameters (bool): Whether training continues from the current
+                parameters, which then must belong to the same classes.
+
+        Raises:
+            ValueError: If there are no classes yet, fewer than two, or they differ
+                from the classes of the parameters that are kept.
+
+        """
+        if classes is None:
+            if self.classes_ is None:
+                raise ValueError(
+                    "The classes must be given on the first call, since a batch "
+                    "may not contain all of them."
+                )
+            return
+
+        classes = np.unique(classes)
+        if classes.shape[0] < 2:
+            raise ValueError(
+                f"LogisticRegression needs at least two classes, got {classes.shape[0]}."
+            )
+        if keep_parameters and not np.array_equal(classes, self.classes_):
+            raise ValueError(
+                f"The classes {classes} differ from the fitted classes {self.classes_}."
+            )
+
+        self.classes_ = classes
+
+    def _encode_targets(self, y: np.ndarray) -> np.ndarray:
+        """
+        Encodes labels as indices into `classes_`, and as 0.0 / 1.0 in the model's
+        dtype for two classes.
+
+        Args:
+            y (np.ndarray): The labels (num_observations).
+
+        Raises:
+            ValueError: If y contains a label that is not in `classes_`.
+
+        Returns:
+            np.ndarray: The encoded labels.
+
+        """
+        y = np.asarray(y)
+        codes = np.searchsorted(self.classes_, y)
+        np.minimum(codes, self.classes_.shape[0] - 1, out=codes)
+        if not np.all(self.classes_[codes] == y):
+            raise ValueError(f"y contains labels that are not in {self.classes_}.")
+
+        if self.classes_.shape[0] == 2:
+            return codes.astype(self.dtype)
+
+        return codes
+
+    def _target_shape(self, y: np.ndarray) -> tuple[int, ...]:
+        """
+        Returns the shape of one column of weights: two classes share one weight
+        vector and a scalar bias, more classes get one column and one bias each.
+        """
+        num_classes = self.classes_.shape[0]
+        return () if num_classes == 2 else (num_classes,)
+
+    def _l2_penalty(self) -> float:
+        """
+        Returns the strength of the L2 penalty on the weights.
+
+        Returns:
+            float: The penalty strength `lambda_`.
+
+        """
+        return self.lambda_
+
+    def _loss_gradient(self, scores: np.ndarray, y: np.ndarray) -> float:
+        """
+        Turns the scores into p - y in place, the gradient of the log-loss with
+        respect to them.
+
+        Args:
+            scores (np.ndarray): The scores (num_observations[, num_classes]), modified in place.
+            y (np.ndarray): The encoded labels (num_observations).
+
+        Returns:
+            float: The mean log-loss.
+
+        """
+        return _log_loss_gradient(scores, y) / scores.shape[0]
+
+
+class _LogLossObjective:
+    """
+    The objective (1 / n) * sum(log-loss) + (lambda / 2) * ||W||^2 as a function of
+    the flat parameter vector theta = [W; b], for the optimizers in `optimizers.py`.
+
+    `hessian_solve` makes Newton's method IRLS. The Hessian of the mean log-loss
+    with respect to [W; b] is [X 1]^T diag(s_ab) [X 1] / n for every pair of
+    classes a, b, with s = p (1 - p) for two classes and s_ab = p_a (delta_ab - p_b)
+    for the softmax. It is accumulated in chunks of rows. The softmax is invariant
+    to adding the same vector to every class, so its Hessian is singular along
+    those directions, and the step is the minimum-norm least-squares solution.
+
+    Args:
+        X (np.ndarray): Training data features (num_observations, num_features).
+        y (np.ndarray): Encoded training labels (num_observations).
+        num_classes (int): The number of classes.
+        l2_penalty (float): The strength lambda of the L2 penalty.
+        chunk_size (int): The number of rows per chunk of the Hessian.
+
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        num_classes: int,
+        l2_penalty: float,
+        chunk_size: int,
+    ) -> None:
+        self.X = X
+        self.y = y
+        self.l2_penalty = l2_penalty
+        self.chunk_size = chunk_size
+        self.num_features = X.shape[1]
+        self.target_shape = () if num_classes == 2 else (num_classes,)
+
+    def unpack(self, theta: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Splits the parameter vector into the weights and the bias.
+        """
+        params = theta.reshape((self.num_features + 1, *self.target_shape))
+        return params[:-1].copy(), params[-1].copy()
+
+    def loss_and_grad(self, theta: np.ndarray) -> tuple[float, np.ndarray]:
+        """
+        Returns the objective value and its gradient at `theta`.
+        """
+        weights, bias = self.unpack(theta)
+        num_observations = self.X.shape[0]
+
+        scores = self.X @ weights + bias
+        loss = _log_loss_gradient(scores, self.y) / num_observations
+        loss += self.l2_penalty / 2 * np.vdot(weights, weights)
+
+        grad = np.empty((self.num_features + 1, *self.target_shape), dtype=theta.dtype)
+        grad[:-1] = self.X.T @ scores / num_observations + self.l2_penalty * weights
+        grad[-1] = np.sum(scores, axis=0) / num_observations
+
+        return float(loss), grad.ravel()
+
+    def hessian_solve(self, theta: np.ndarray, grad: np.ndarray) -> np.ndarray:
+        """
+        Returns H^-1 @ grad for the Hessian of the objective at `theta`.
+        """
+        weights, bias = self.unpack(theta)
+        num_observations, num_features = self.X.shape
+        num_outputs = int(np.prod(self.target_shape))
+
+        # One (num_features + 1)^2 block per pair of classes
+        hessian = np.zeros(
+            (num_features + 1, num_outputs, num_features + 1, num_outputs),
+            dtype=theta.dtype,
+        )
+        for start in range(0, num_observations, self.chunk_size):
+            X_chunk = to_dense(self.X[start : start + self.chunk_size])
+            augmented = np.empty((X_chunk.shape[0], num_features + 1), theta.dtype)
+            augmented[:, :-1] = X_chunk
+            augmented[:, -1] = 1
+
+            scores = X_chunk @ weights + bias
+            if scores.ndim == 1:
+                proba = _sigmoid(scores)
+                curvature = proba * (1 - proba)
+                hessian[:, 0, :, 0] += augmented.T @ (augmented * curvature[:, None])
+                continue
+
+            proba = _softmax(scores)
+            for a in range(num_outputs):
+                for b in range(a, num_outputs):
+                    curvature = proba[:, a] * ((a == b) - proba[:, b])
+                    block = augmented.T @ (augmented * curvature[:, None])
+                    hessian[:, a, :, b] += block
+                    if a != b:
+                        hessian[:, b, :, a] += block
+
+        hessian /= num_observations
+        features = np.arange(num_features)
+        hessian[features, :, features, :] += self.l2_penalty * np.eye(num_outputs)
+        hessian = hessian.reshape(grad.shape[0], grad.shape[0])
+
+        if self.target_shape:
+            return np.linalg.lstsq(hessian, grad, rcond=None)[0]
+        try:
+            return np.linalg.solve(hessian, grad)
+        except np.linalg.LinAlgError:
+            return np.linalg.lstsq(hessian, grad, rcond=None)[0]
+
+
+def _log_loss_gradient(scores: np.ndarray, y: np.ndarray) -> float:
+    """
+    Computes the summed log-loss of the scores and overwrites the scores with its
+    gradient with respect to them, p - y.
+
+    For two classes, the loss of a score z is softplus(z) - y z, evaluated as
+    max(z, 0) + log1p(exp(-|z|)) - y z, and the same exp(-|z|) gives the sigmoid.
+    For more classes, the scores are shifted by their row maximum before the
+    log-sum-exp, so no exponential overflows.
+
+    Args:
+        scores (np.ndarray): The scores (num_observations[, num_classes]), modified in place.
+        y (np.ndarray): The labels, 0.0 / 1.0 for two classes and class indices
+            otherwise (num_observations).
+
+    Returns:
+        float: The sum of the log-losses of all rows.
+
+    """
+    if scores.ndim == 1:
+        exp_neg_abs = np.exp(-np.abs(scores))
+        loss = (
+            np.sum(np.log1p(exp_neg_abs))
+            + np.sum(np.maximum(scores, 0))
+            - np.dot(y, scores)
+        )
+        np.divide(np.where(scores >= 0, 1, exp_neg_abs), 1 + exp_neg_abs, out=scores)
+        scores -= y
+        return float(loss)
+
+    rows = np.arange(scores.shape[0])
+    scores -= np.max(scores, axis=1, keepdims=True)
+    # log-sum-exp(z) - z_y of the shifted scores
+    loss = -np.sum(scores[rows, y])
+    np.exp(scores, out=scores)
+    sums = np.sum(scores, axis=1, keepdims=True)
+    loss += np.sum(np.log(sums))
+
+    scores /= sums
+    scores[rows, y] -= 1
+    return float(loss)
+
+
+def _sigmoid(z: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Computes 1 / (1 + exp(-z)) from exp(-|z|), which never overflows.
+    """
+    exp_neg_abs = np.exp(-np.abs(z))
+    return np.divide(np.where(z >= 0, 1, exp_neg_abs), 1 + exp_neg_abs, out=out)
+
+
+def _softmax(scores: np.ndarray) -> np.ndarray:
+    """
+    Computes the row-wise softmax in place, shifted by the row maximum.
+    """
+    scores -= np.max(scores, axis=1, keepdims=True)
+    np.exp(scores, out=scores)
+    scores /= np.sum(scores, axis=1, keepdims=True)
+    return scores
@@ -1,5 +1,869 @@
+from collections.abc import Iterable, Iterator
+
 import numpy as np
 
+from dtypes import BLOCK_BYTES
+from sufficient_stats import merge_moments
+
 
 def mean_squared_error(y_test: np.ndarray, predictions: np.ndarray) -> float:
     return float(np.mean((predictions - y_test) ** 2))
+
+
+def evaluate(
+    y: np.ndarray,
+    pred: np.ndarray,
+    metrics: Iterable[str] = ("mse", "mae", "r2", "explained_variance"),
+) -> dict[str, float]:
+    """
+    Computes several regression metrics in a single pass over y and pred.
+
+    The residual pred - y is computed once per cache-sized block and every
+    requested metric reads it while it is still in cache, so scoring k metrics
+    costs one pass over the data and one block-sized buffer instead of k passes,
+    each allocating a full-size residual.
+
+    Args:
+        y (np.ndarray): The true targets (num_observations[, num_outputs]).
+        pred (np.ndarray): The predictions, of the same shape as y.
+        metrics (Iterable[str], optional): Names from `STREAMING_METRICS`. Defaults to ("mse", "mae", "r2", "explained_variance").
+
+    Raises:
+        ValueError: If a metric is unknown, y and pred have different shapes or
+            there are no samples.
+
+    Returns:
+        dict[str, float]: The value of every requested metric by name.
+    """
+    metrics = list(metrics)
+    unknown = [name for name in metrics if name not in STREAMING_METRICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown metrics {unknown}, expected names from {list(STREAMING_METRICS)}."
+        )
+
+    accumulators = {name: STREAMING_METRICS[name]() for name in metrics}
+    _accumulate(accumulators.values(), y, pred)
+
+    return {name: accumulator.result() for name, accumulator in accumulators.items()}
+
+
+class StreamingMetric:
+    """
+    Base class of the mergeable regression metrics.
+
+    A metric is accumulated batch by batch with `update(y, pred)`, so scoring a
+    dataset that does not fit into memory, or a stream of predictions, takes one
+    pass and O(1) memory. Each batch is processed in cache-sized blocks, and the
+    residual pred - y of a block is written into a reused buffer. Accumulators
+    of disjoint rows, e.g. from separate workers, are combined with `merge`.
+
+    For targets with several outputs, every output is accumulated separately and
+    `result` averages the metric over the outputs (`MaxError` takes the maximum),
+    or returns all of them with multioutput="raw_values".
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty accumulator.
+        """
+        self.n_samples_ = 0
+
+    def update(self, y: np.ndarray, pred: np.ndarray) -> "StreamingMetric":
+        """
+        Adds a batch of targets and predictions.
+
+        Args:
+            y (np.ndarray): The true targets (batch_size[, num_outputs]).
+            pred (np.ndarray): The predictions, of the same shape as y.
+
+        Raises:
+            ValueError: If y and pred have different shapes.
+
+        Returns:
+            StreamingMetric: The updated accumulator.
+        """
+        _accumulate([self], y, pred)
+
+        return self
+
+    def merge(self, other: "StreamingMetric") -> "StreamingMetric":
+        """
+        Merges the accumulator of other, disjoint rows into this one.
+
+        Args:
+            other (StreamingMetric): An accumulator of the same metric.
+
+        Raises:
+            ValueError: If `other` accumulates a different metric.
+
+        Returns:
+            StreamingMetric: The merged accumulator.
+        """
+        if type(other) is not type(self):
+            raise ValueError(
+                f"Cannot merge a {type(other).__name__} into a {type(self).__name__}."
+            )
+        if other.n_samples_ == 0:
+            return self
+
+        if self.n_samples_ == 0:
+            vars(self).update(
+                {name: np.copy(value) for name, value in vars(other).items()}
+            )
+            self.n_samples_ = other.n_samples_
+        else:
+            self._merge(other)
+            self.n_samples_ += other.n_samples_
+
+        return self
+
+    def result(self, multioutput: str = "uniform_average") -> float | np.ndarray:
+        """
+        Returns the metric over all rows seen so far.
+
+        Args:
+            multioutput (str, optional): "uniform_average" combines the outputs into
+                one value, "raw_values" returns the metric of every output. Defaults to "uniform_average".
+
+        Raises:
+            ValueError: If no rows have been added or `multioutput` is unknown.
+
+        Returns:
+            float | np.ndarray: The value of the metric, or an array with one value
+                per output for "raw_values".
+        """
+        if self.n_samples_ == 0:
+            raise ValueError(
+                f"{type(self).__name__} cannot be computed without any samples."
+            )
+
+        values = np.asarray(self._result())
+        if multioutput == "raw_values":
+            return values
+        if multioutput != "uniform_average":
+            raise ValueError(
+                "multioutput must be 'uniform_average' or 'raw_values', "
+                f"got '{multioutput}'."
+            )
+
+        return float(self.combine_outputs(values))
+
+    @staticmethod
+    def combine_outputs(values: np.ndarray, axis: int | None = None) -> np.ndarray:
+        """
+        Combines per-output values of the metric the way `result` does, by default
+        with their mean.
+
+        Args:
+            values (np.ndarray): Values from result(multioutput="raw_values").
+            axis (int, optional): The axis of the outputs. Defaults to None (all).
+
+        Returns:
+            np.ndarray: The combined values.
+        """
+        return np.mean(values, axis=axis)
+
+    def _update(self, y: np.ndarray, residual: np.ndarray) -> None:
+        """
+        Adds a block of targets and its residuals pred - y (must not modify them).
+        """
+        raise NotImplementedError
+
+    def _merge(self, other: "StreamingMetric") -> None:
+        """
+        Merges the state of a non-empty accumulator into this non-empty one.
+        """
+        raise NotImplementedError
+
+    def _result(self) -> np.ndarray:
+        """
+        Computes the metric of every output from the state of a non-empty accumulator.
+        """
+        raise NotImplementedError
+
+
+class MeanSquaredError(StreamingMetric):
+    """
+    The mean squared error (1 / n) * sum((pred - y)^2).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sum_squares_ = 0.0
+
+    def _update(self, y: np.ndarray, residual: np.ndarray) -> None:
+        self.sum_squares_ = self.sum_squares_ + np.einsum(
+            "i...,i...->...", residual, residual
+        )
+
+    def _merge(self, other: "MeanSquaredError") -> None:
+        self.sum_squares_ = self.sum_squares_ + other.sum_squares_
+
+    def _result(self) -> np.ndarray:
+        return self.sum_squares_ / self.n_samples_
+
+
+class RootMeanSquaredError(MeanSquaredError):
+    """
+    The root mean squared error sqrt((1 / n) * sum((pred - y)^2)).
+    """
+
+    def _result(self) -> np.ndarray:
+        return np.sqrt(self.sum_squares_ / self.n_samples_)
+
+
+class MeanAbsoluteError(StreamingMetric):
+    """
+    The mean absolute error (1 / n) * sum(|pred - y|).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sum_absolute_ = 0.0
+
+    def _update(self, y: np.ndarray, residual: np.ndarray) -> None:
+        self.sum_absolute_ = self.sum_absolute_ + np.sum(np.abs(residual), axis=0)
+
+    def _merge(self, other: "MeanAbsoluteError") -> None:
+        self.sum_absolute_ = self.sum_absolute_ + other.sum_absolute_
+
+    def _result(self) -> np.ndarray:
+        return self.sum_absolute_ / self.n_samples_
+
+
+class MaxError(StreamingMetric):
+    """
+    The largest absolute error max(|pred - y|).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.max_error_ = 0.0
+
+    def _update(self, y: np.ndarray, residual: np.ndarray) -> None:
+        self.max_error_ = np.maximum(self.max_error_, np.max(np.abs(residual), axis=0))
+
+    def _merge(self, other: "MaxError") -> None:
+        self.max_error_ = np.maximum(self.max_error_, other.max_error_)
+
+    def _result(self) -> np.ndarray:
+        return self.max_error_
+
+    @staticmethod
+    def combine_outputs(values: np.ndarray, axis: int | None = None) -> np.ndarray:
+        return np.max(values, axis=axis)
+
+
+class R2Score(StreamingMetric):
+    """
+    The coefficient of determination 1 - sum((pred - y)^2) / sum((y - mean(y))^2).
+
+    The spread of the targets around their mean is accumulated with the pairwise
+    update of Chan et al., so the score is exact in a single pass. A constant
+    target scores 1.0 if it is predicted perfectly and 0.0 otherwise.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sum_squares_ = 0.0
+        self.mean_y_ = 0.0
+        self.squared_deviations_y_ = 0.0
+
+    def _update(self, y: np.ndarray, residual: np.ndarray) -> None:
+        block = R2Score()
+        block.n_samples_ = y.shape[0]
+        block.sum_squares_ = np.einsum("i...,i...->...", residual, residual)
+        block.mean_y_, block.squared_deviations_y_ = _mean_squared_deviations(y)
+        # The pairwise update also covers the empty accumulator
+        self._merge(block)
+
+    def _merge(self, other: "R2Score") -> None:
+        self.sum_squares_ = self.sum_squares_ + other.sum_squares_
+        self.mean_y_, self.squared_deviations_y_ = merge_moments(
+            self.n_samples_,
+            self.mean_y_,
+            self.squared_deviations_y_,
+            other.n_samples_,
+            other.mean_y_,
+            other.squared_deviations_y_,
+        )
+
+    def _result(self) -> np.ndarray:
+        return _score(self.sum_squares_, self.squared_deviations_y_)
+
+
+class ExplainedVariance(StreamingMetric):
+    """
+    The explained variance score 1 - Var(pred - y) / Var(y).
+
+    Unlike R², a constant offset of the predictions is not penalized. The spreads
+    of the residuals and of the targets are both accumulated with the pairwise
+    update of Chan et al. A constant target scores 1.0 if the residual is
+    constant and 0.0 otherwise.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.mean_residual_ = 0.0
+        self.squared_deviations_residual_ = 0.0
+        self.mean_y_ = 0.0
+        self.squared_deviations_y_ = 0.0
+
+    def _update(self, y: np.ndarray, residual: np.ndarray) -> None:
+        block = ExplainedVariance()
+        block.n_samples_ = y.shape[0]
+        block.mean_residual_, block.squared_deviations_residual_ = (
+            _mean_squared_deviations(residual)
+        )
+        block.mean_y_, block.squared_deviations_y_ = _mean_squared_deviations(y)
+        # The pairwise update also covers the empty accumulator
+        self._merge(block)
+
+    def _merge(self, other: "ExplainedVariance") -> None:
+        self.mean_residual_, self.squared_deviations_residual_ = merge_moments(
+            self.n_samples_,
+            self.mean_residual_,
+            self.squared_deviations_residual_,
+            other.n_samples_,
+            other.mean_residual_,
+            other.squared_deviations_residual_,
+        )
+        self.mean_y_, self.squared_deviations_y_ = merge_moments(
+            self.n_samples_,
+            self.mean_y_,
+            self.squared_deviations_y_,
+            other.n_samples_,
+            other.mean_y_,
+            other.squared_deviations_y_,
+        )
+
+    def _result(self) -> np.ndarray:
+        return _score(self.squared_deviations_residual_, self.squared_deviations_y_)
+
+
+# The streaming metrics by name
+STREAMING_METRICS = {
+    "mse": MeanSquaredError,
+    "rmse": RootMeanSquaredError,
+    "mae": MeanAbsoluteError,
+    "max_error": MaxError,
+    "r2": R2Score,
+    "explained_variance": ExplainedVariance,
+}
+
+
+def accuracy_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """
+    Computes the fraction of correctly predicted labels.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_pred (np.ndarray): The predicted labels (num_observations).
+
+    Raises:
+        ValueError: If y_true and y_pred have different shapes or are empty.
+
+    Returns:
+        float: The accuracy, between 0 and 1.
+    """
+    y_true, y_pred = _check_labels(y_true, y_pred)
+
+    return float(np.count_nonzero(y_true == y_pred) / y_true.shape[0])
+
+
+def confusion_matrix(
+    y_true: np.ndarray, y_pred: np.ndarray, labels: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Counts how often every true label is predicted as every label.
+
+    Both label arrays are encoded as indices into the sorted `labels`, and every
+    (true, predicted) pair becomes one code true * k + predicted, so the whole
+    matrix is a single `np.bincount` over n codes instead of k^2 comparisons.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_pred (np.ndarray): The predicted labels (num_observations).
+        labels (np.ndarray, optional): The labels to count, in the order of the
+            rows and columns. Rows with other labels are ignored. Defaults to
+            None (all labels that occur, sorted).
+
+    Raises:
+        ValueError: If y_true and y_pred have different shapes or are empty, or
+            `labels` is empty.
+
+    Returns:
+        np.ndarray: The counts (num_labels, num_labels), with the true labels
+            along the rows and the predicted ones along the columns.
+    """
+    y_true, y_pred = _check_labels(y_true, y_pred)
+    if labels is None:
+        labels = _unique_labels(y_true, y_pred)
+    labels = np.asarray(labels)
+    k = labels.shape[0]
+    if k == 0:
+        raise ValueError("labels must contain at least one label.")
+
+    true_codes, true_known = _encode(y_true, labels)
+    pred_codes, pred_known = _encode(y_pred, labels)
+    known = true_known & pred_known
+    if not known.all():
+        true_codes, pred_codes = true_codes[known], pred_codes[known]
+
+    pairs = true_codes * k + pred_codes
+
+    return np.bincount(pairs, minlength=k * k).reshape(k, k)
+
+
+def precision_recall_f1(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    average: str | None = "binary",
+    pos_label=1,
+    labels: np.ndarray | None = None,
+) -> tuple[float | np.ndarray, float | np.ndarray, float | np.ndarray]:
+    """
+    Computes precision, recall and F1 from one confusion matrix.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_pred (np.ndarray): The predicted labels (num_observations).
+        average (str | None, optional): "binary" scores `pos_label` only,
+            "micro" pools the counts of all labels, "macro" averages the scores
+            of the labels, "weighted" weights them by their number of true rows
+            and None returns the scores of every label. Defaults to "binary".
+        pos_label (optional): The positive label for "binary". Defaults to 1.
+        labels (np.ndarray, optional): The labels to score. Defaults to None
+            (all labels that occur, sorted).
+
+    Raises:
+        ValueError: If `average` is unknown, `labels` is empty, or "binary" is
+            used with a `pos_label` that is not among the labels.
+
+    Returns:
+        tuple: The precision, recall and F1, as floats or as arrays with one
+            value per label for average=None. Undefined ratios (0 / 0) are 0.
+    """
+    if average not in ("binary", "micro", "macro", "weighted", None):
+        raise ValueError(
+            "average must be 'binary', 'micro', 'macro', 'weighted' or None, "
+            f"got '{average}'."
+        )
+
+    # The counts over all labels, so that predictions of a scored label count
+    # even when the true label is not scored
+    all_labels = _unique_labels(y_true, y_pred)
+    matrix = confusion_matrix(y_true, y_pred, all_labels)
+    if labels is None:
+        labels = all_labels
+    labels = np.asarray(labels)
+    if labels.shape[0] == 0:
+        raise ValueError("labels must contain at least one label.")
+    selected, present = _encode(labels, all_labels)
+    true_positives = np.where(present, np.diag(matrix)[selected], 0)
+    predicted = np.where(present, matrix.sum(axis=0)[selected], 0)
+    actual = np.where(present, matrix.sum(axis=1)[selected], 0)
+
+    if average == "binary":
+        position = np.flatnonzero(labels == pos_label)
+        if position.shape[0] == 0:
+            raise ValueError(f"pos_label={pos_label} is not among the labels.")
+        true_positives, predicted, actual = (
+            true_positives[position],
+            predicted[position],
+            actual[position],
+        )
+    elif average == "micro":
+        true_positives, predicted, actual = (
+            true_positives.sum(keepdims=True),
+            predicted.sum(keepdims=True),
+            actual.sum(keepdims=True),
+        )
+
+    precision = _safe_divide(true_positives, predicted)
+    recall = _safe_divide(true_positives, actual)
+    f1 = _safe_divide(2 * precision * recall, precision + recall)
+
+    if average is None:
+        return precision, recall, f1
+    weights = actual if average == "weighted" else None
+    if weights is not None and weights.sum() == 0:
+        weights = None
+
+    return tuple(
+        float(np.average(score, weights=weights)) for score in (precision, recall, f1)
+    )
+
+
+def precision_score(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    average: str | None = "binary",
+    pos_label=1,
+    labels: np.ndarray | None = None,
+) -> float | np.ndarray:
+    """
+    Computes the precision tp / (tp + fp), see `precision_recall_f1`.
+    """
+    return precision_recall_f1(y_true, y_pred, average, pos_label, labels)[0]
+
+
+def recall_score(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    average: str | None = "binary",
+    pos_label=1,
+    labels: np.ndarray | None = None,
+) -> float | np.ndarray:
+    """
+    Computes the recall tp / (tp + fn), see `precision_recall_f1`.
+    """
+    return precision_recall_f1(y_true, y_pred, average, pos_label, labels)[1]
+
+
+def f1_score(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    average: str | None = "binary",
+    pos_label=1,
+    labels: np.ndarray | None = None,
+) -> float | np.ndarray:
+    """
+    Computes the harmonic mean of precision and recall, see `precision_recall_f1`.
+    """
+    return precision_recall_f1(y_true, y_pred, average, pos_label, labels)[2]
+
+
+def log_loss(
+    y_true: np.ndarray, proba: np.ndarray, labels: np.ndarray | None = None
+) -> float:
+    """
+    Computes the mean negative log-likelihood of the true labels.
+
+    Probabilities are clipped to [eps, 1 - eps], with the machine epsilon of
+    their dtype, so a confident mistake costs a large but finite loss.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        proba (np.ndarray): The predicted probabilities, either of the positive
+            label for two labels (num_observations), or of every label in the
+            order of `labels` (num_observations, num_labels).
+        labels (np.ndarray, optional): The labels in the order of the columns of
+            proba, the positive label last for 1-D probabilities. Defaults to
+            None (the sorted labels of y_true, or [0, 1] if it has only one).
+
+    Raises:
+        ValueError: If the shapes do not match or y_true contains a label
+            outside of `labels`.
+
+    Returns:
+        float: The log-loss.
+    """
+    y_true = np.asarray(y_true)
+    proba = np.asarray(proba)
+    if proba.ndim == 1:
+        proba = proba[:, np.newaxis]
+        binary = True
+    else:
+        binary = False
+    if y_true.ndim != 1 or proba.shape[0] != y_true.shape[0] or y_true.shape[0] == 0:
+        raise ValueError(
+            "y_true must be a non-empty 1-D array with one row of proba per "
+            f"label, got {y_true.shape} and {proba.shape}."
+        )
+
+    if labels is None:
+        labels = np.unique(y_true)
+        if binary and labels.shape[0] < 2:
+            labels = np.union1d(labels, [0, 1])
+    labels = np.asarray(labels)
+    if labels.shape[0] != (2 if binary else proba.shape[1]):
+        raise ValueError(
+            f"Expected probabilities of {labels.shape[0]} labels, got "
+            f"{2 if binary else proba.shape[1]}."
+        )
+
+    codes, known = _encode(y_true, labels)
+    if not known.all():
+        raise ValueError("y_true contains labels that are not in labels.")
+
+    eps = np.finfo(np.result_type(proba, np.float32)).eps
+    if binary:
+        # The probability of the true label: p if it is positive and 1 - p otherwise
+        p = proba[:, 0]
+        likelihood = np.where(codes == 1, p, 1 - p)
+    else:
+        likelihood = np.take_along_axis(proba, codes[:, np.newaxis], axis=1)[:, 0]
+
+    return float(-np.mean(np.log(np.clip(likelihood, eps, 1 - eps))))
+
+
+def roc_curve(
+    y_true: np.ndarray, y_score: np.ndarray, pos_label=1
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes the receiver operating characteristic of a binary score.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_score (np.ndarray): The scores, larger meaning more likely positive.
+        pos_label (optional): The positive label. Defaults to 1.
+
+    Raises:
+        ValueError: If the shapes differ or y_true does not contain both classes.
+
+    Returns:
+        tuple: The false positive rates, true positive rates and the decreasing
+            thresholds at which they are reached, starting from (0, 0).
+    """
+    false_positives, true_positives, thresholds = _binary_clf_curve(
+        y_true, y_score, pos_label
+    )
+    false_positives = np.r_[0, false_positives]
+    true_positives = np.r_[0, true_positives]
+
+    return (
+        false_positives / false_positives[-1],
+        true_positives / true_positives[-1],
+        np.r_[np.inf, thresholds],
+    )
+
+
+def roc_auc_score(y_true: np.ndarray, y_score: np.ndarray, pos_label=1) -> float:
+    """
+    Computes the area under the ROC curve of a binary score.
+
+    The curve comes from one sort of the scores and cumulative sums of the
+    labels, so it costs O(n log n) without looping over thresholds. Tied scores
+    form a single point, i.e. a diagonal segment of the curve.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_score (np.ndarray): The scores, larger meaning more likely positive.
+        pos_label (optional): The positive label. Defaults to 1.
+
+    Raises:
+        ValueError: If the shapes differ or y_true does not contain both classes.
+
+    Returns:
+        float: The area, between 0 and 1.
+    """
+    false_positive_rate, true_positive_rate, _ = roc_curve(y_true, y_score, pos_label)
+
+    return float(
+        np.sum(
+            np.diff(false_positive_rate)
+            * (true_positive_rate[1:] + true_positive_rate[:-1])
+            / 2
+        )
+    )
+
+
+def precision_recall_curve(
+    y_true: np.ndarray, y_score: np.ndarray, pos_label=1
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Computes precision and recall of a binary score at every threshold.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_score (np.ndarray): The scores, larger meaning more likely positive.
+        pos_label (optional): The positive label. Defaults to 1.
+
+    Raises:
+        ValueError: If the shapes differ or y_true does not contain both classes.
+
+    Returns:
+        tuple: The precisions and recalls at the decreasing thresholds, and the
+            thresholds.
+    """
+    false_positives, true_positives, thresholds = _binary_clf_curve(
+        y_true, y_score, pos_label
+    )
+    precision = true_positives / (true_positives + false_positives)
+    recall = true_positives / true_positives[-1]
+
+    return precision, recall, thresholds
+
+
+def average_precision_score(
+    y_true: np.ndarray, y_score: np.ndarray, pos_label=1
+) -> float:
+    """
+    Computes the area under the precision-recall curve of a binary score.
+
+    The area is the step-wise sum of the precision at every threshold weighted
+    by the increase in recall, sum_n (R_n - R_(n-1)) * P_n, which unlike the
+    trapezoidal rule does not interpolate optimistically between points.
+
+    Args:
+        y_true (np.ndarray): The true labels (num_observations).
+        y_score (np.ndarray): The scores, larger meaning more likely positive.
+        pos_label (optional): The positive label. Defaults to 1.
+
+    Raises:
+        ValueError: If the shapes differ or y_true does not contain both classes.
+
+    Returns:
+        float: The average precision, between 0 and 1.
+    """
+    precision, recall, _ = precision_recall_curve(y_true, y_score, pos_label)
+
+    return float(np.sum(np.diff(recall, prepend=0) * precision))
+
+
+def _accumulate(
+    accumulators: Iterable[StreamingMetric], y: np.ndarray, pred: np.ndarray
+) -> None:
+    """
+    Adds a batch to several accumulators, computing each residual block once.
+    """
+    accumulators = list(accumulators)
+    for y_block, residual in _residual_blocks(y, pred):
+        for accumulator in accumulators:
+            accumulator._update(y_block, residual)
+            accumulator.n_samples_ += y_block.shape[0]
+
+
+def _mean_squared_deviations(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the column means of a block and the sums of squared deviations from them.
+    """
+    mean = np.mean(values, axis=0)
+    deviations = values - mean
+
+    return mean, np.einsum("i...,i...->...", deviations, deviations)
+
+
+def _score(residual: np.ndarray, total: np.ndarray) -> np.ndarray:
+    """
+    Returns 1 - residual / total per output, scoring a constant target (total = 0)
+    with 1.0 if residual = 0 and 0.0 otherwise.
+    """
+    residual = np.asarray(residual)
+    total = np.asarray(total)
+    constant = total == 0
+
+    return np.where(
+        constant,
+        np.where(residual == 0, 1.0, 0.0),
+        1 - residual / np.where(constant, 1, total),
+    )
+
+
+def _residual_blocks(
+    y: np.ndarray, pred: np.ndarray
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Yields (y_block, pred_block - y_block) in cache-sized row blocks, writing every
+    residual into the same buffer.
+
+    Raises:
+        ValueError: If y and pred have different shapes.
+    """
+    y = np.asarray(y)
+    pred = np.asarray(pred)
+    if y.shape != pred.shape:
+        raise ValueError(
+            f"y and pred must have the same shape, got {y.shape} and {pred.shape}."
+        )
+    if y.shape[0] == 0:
+        return
+
+    dtype = np.result_type(y, pred, np.float32)
+    rows = max(BLOCK_BYTES // max(y[:1].size * dtype.itemsize, 1), 1)
+    buffer = np.empty((min(rows, y.shape[0]), *y.shape[1:]), dtype=dtype)
+
+    for start in range(0, y.shape[0], rows):
+        y_block = y[start : start + rows]
+        residual = buffer[: y_block.shape[0]]
+        np.subtract(pred[start : start + rows], y_block, out=residual)
+        yield y_block, residual
+
+
+def _check_labels(
+    y_true: np.ndarray, y_pred: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Checks that two label arrays are non-empty, 1-D and of the same length.
+
+    Raises:
+        ValueError: If they are not.
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if y_true.ndim != 1 or y_true.shape != y_pred.shape or y_true.shape[0] == 0:
+        raise ValueError(
+            "y_true and y_pred must be non-empty 1-D arrays of the same length, "
+            f"got {y_true.shape} and {y_pred.shape}."
+        )
+
+    return y_true, y_pred
+
+
+def _unique_labels(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """
+    Returns the sorted labels that occur in either array, without concatenating them.
+    """
+    return np.union1d(np.unique(y_true), np.unique(y_pred))
+
+
+def _encode(values: np.ndarray, labels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the position of every value in labels (in any order) and a mask of
+    the values that are among them.
+    """
+    order = np.argsort(labels)
+    positions = np.searchsorted(labels, values, sorter=order)
+    np.minimum(positions, labels.shape[0] - 1, out=positions)
+    codes = order[positions]
+
+    return codes, labels[codes] == values
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    Divides elementwise, with 0 where the denominator is 0.
+    """
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator),
+        where=denominator != 0,
+    )
+
+
+def _binary_clf_curve(
+    y_true: np.ndarray, y_score: np.ndarray, pos_label
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Counts the false and true positives at every distinct score, from the largest
+    down, with one sort and cumulative sums.
+
+    Raises:
+        ValueError: If the shapes differ or y_true does not contain both classes.
+    """
+    y_true = np.asarray(y_true)
+    y_score = np.asarray(y_score)
+    if y_true.ndim != 1 or y_true.shape != y_score.shape or y_true.shape[0] == 0:
+        raise ValueError(
+            "y_true and y_score must be non-empty 1-D arrays of the same length, "
+            f"got {y_true.shape} and {y_score.shape}."
+        )
+
+    order = np.argsort(y_score)[::-1]
+    sorted_scores = y_score[order]
+    positive = y_true[order] == pos_label
+
+    # The last row of every run of tied scores
+    ends = np.r_[np.flatnonzero(np.diff(sorted_scores)), y_true.shape[0] - 1]
+    true_positives = np.cumsum(positive, dtype=np.int64)[ends]
+    false_positives = ends + 1 - true_positives
+    if true_positives[-1] in (0, y_true.shape[0]):
+        raise ValueError("y_true must contain both positive and negative rows.")
+
+    return false_positives, true_positives, sorted_scores[ends]
@@ -0,0 +1,412 @@
+import inspect
+from typing import Protocol
+
+import numpy as np
+
+
+class Objective(Protocol):
+    """
+    The interface between a model and an optimizer.
+
+    A model describes its training objective as a function of a flat parameter
+    vector `theta`. First-order optimizers only need `loss_and_grad`; `Newton`
+    also needs `hessian_solve`, which lets the model exploit the structure of its
+    Hessian (e.g. one shared block for all outputs, or IRLS weights).
+    """
+
+    def loss_and_grad(self, theta: np.ndarray) -> tuple[float, np.ndarray]:
+        """
+        Returns the objective value and its gradient at `theta`.
+        """
+        ...
+
+    def hessian_solve(self, theta: np.ndarray, grad: np.ndarray) -> np.ndarray:
+        """
+        Returns H^-1 @ grad, where H is the Hessian of the objective at `theta`.
+        """
+        ...
+
+
+class Optimizer:
+    """
+    Base class of the optimizers: minimizes an `Objective` from a starting point.
+
+    Subclasses implement `_minimize`; `minimize` records the objective value of
+    every iteration and stops once the gradient norm falls below `tol`.
+
+    Args:
+        max_iter (int, optional): The maximum number of iterations. Defaults to 1000.
+        tol (float, optional): The gradient norm at which to stop. Defaults to 1e-6.
+    """
+
+    def __init__(self, max_iter: int = 1000, tol: float = 1e-6):
+        """
+        Initializes the optimizer's configuration.
+        """
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def minimize(
+        self, objective: Objective, theta: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Minimizes the objective, starting from `theta`.
+
+        Args:
+            objective (Objective): The objective to minimize.
+            theta (np.ndarray): The starting parameters (not modified).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The final parameters and the objective
+                value of every iteration.
+        """
+        # Keep float32 parameters in float32; anything else is computed in float64
+        theta = np.array(theta, dtype=np.result_type(theta, np.float32))
+        loss_history = np.empty(self.max_iter)
+        n_iter = self._minimize(objective, theta, loss_history)
+
+        return theta, loss_history[:n_iter].copy()
+
+    def _minimize(
+        self, objective: Objective, theta: np.ndarray, loss_history: np.ndarray
+    ) -> int:
+        """
+        Updates `theta` in place, fills `loss_history` and returns the number of
+        iterations that were run.
+        """
+        raise NotImplementedError
+
+    def _converged(self, grad: np.ndarray) -> bool:
+        """
+        Checks the gradient norm against the tolerance.
+        """
+        return bool(np.sqrt(grad @ grad) <= self.tol)
+
+
+class GradientDescent(Optimizer):
+    """
+    Fixed-step gradient descent: theta <- theta - learning_rate * grad.
+
+    Args:
+        learning_rate (float, optional): The step size. Defaults to 0.01.
+        max_iter (int, optional): The maximum number of iterations. Defaults to 1000.
+        tol (float, optional): The gradient norm at which to stop. Defaults to 1e-6.
+    """
+
+    def __init__(
+        self, learning_rate: float = 0.01, max_iter: int = 1000, tol: float = 1e-6
+    ):
+        """
+        Initializes the optimizer's configuration.
+        """
+        super().__init__(max_iter=max_iter, tol=tol)
+        self.learning_rate = learning_rate
+
+    def _minimize(self, objective, theta, loss_history):
+        for n_iter in range(self.max_iter):
+            loss_history[n_iter], grad = objective.loss_and_grad(theta)
+            if self._converged(grad):
+                return n_iter + 1
+            theta -= self.learning_rate * grad
+
+        return self.max_iter
+
+
+class Momentum(Optimizer):
+    """
+    Gradient descent with (optionally Nesterov) momentum.
+
+    The velocity accumulates an exponentially decaying sum of past gradients,
+    which speeds up progress along directions where the gradient is consistent.
+
+    Args:
+        learning_rate (float, optional): The step size. Defaults to 0.01.
+        momentum (float, optional): The decay of the velocity. Defaults to 0.9.
+        nesterov (bool, optional): Whether to evaluate the gradient at the look-ahead
+            point. Defaults to False.
+        max_iter (int, optional): The maximum number of iterations. Defaults to 1000.
+        tol (float, optional): The gradient norm at which to stop. Defaults to 1e-6.
+    """
+
+    def __init__(
+        self,
+        learning_rate: float = 0.01,
+        momentum: float = 0.9,
+        nesterov: bool = False,
+        max_iter: int = 1000,
+        tol: float = 1e-6,
+    ):
+        """
+        Initializes the optimizer's configuration.
+        """
+        super().__init__(max_iter=max_iter, tol=tol)
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self.nesterov = nesterov
+
+    def _minimize(self, objective, theta, loss_history):
+        velocity = np.zeros_like(theta)
+
+        for n_iter in range(self.max_iter):
+            if self.nesterov:
+                loss_history[n_iter], grad = objective.loss_and_grad(
+                    theta + self.momentum * velocity
+                )
+            else:
+                loss_history[n_iter], grad = objective.loss_and_grad(theta)
+            if self._converged(grad):
+                return n_iter + 1
+
+            velocity *= self.momentum
+            velocity -= self.learning_rate * grad
+            theta += velocity
+
+        return self.max_iter
+
+
+class Adam(Optimizer):
+    """
+    Adam: gradient descent with per-parameter step sizes from bias-corrected
+    running averages of the gradient and its square (Kingma & Ba, 2015).
+
+    Args:
+        learning_rate (float, optional): The step size. Defaults to 0.001.
+        beta1 (float, optional): The decay of the gradient average. Defaults to 0.9.
+        beta2 (float, optional): The decay of the squared gradient average. Defaults to 0.999.
+        epsilon (float, optional): Added to the denominator for stability. Defaults to 1e-8.
+        max_iter (int, optional): The maximum number of iterations. Defaults to 1000.
+        tol (float, optional): The gradient norm at which to stop. Defaults to 1e-6.
+    """
+
+    def __init__(
+        self,
+        learning_rate: float = 0.001,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        epsilon: float = 1e-8,
+        max_iter: int = 1000,
+        tol: float = 1e-6,
+    ):
+        """
+        Initializes the optimizer's configuration.
+        """
+        super().__init__(max_iter=max_iter, tol=tol)
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def _minimize(self, objective, theta, loss_history):
+        first_moment = np.zeros_like(theta)
+        second_moment = np.zeros_like(theta)
+
+        for n_iter in range(self.max_iter):
+            loss_history[n_iter], grad = objective.loss_and_grad(theta)
+            if self._converged(grad):
+                return n_iter + 1
+
+            first_moment *= self.beta1
+            first_moment += (1 - self.beta1) * grad
+            second_moment *= self.beta2
+            second_moment += (1 - self.beta2) * grad**2
+
+            # Correct the bias towards zero of the averages in the first iterations
+            t = n_iter + 1
+            m_hat = first_moment / (1 - self.beta1**t)
+            v_hat = second_moment / (1 - self.beta2**t)
+            theta -= self.learning_rate * m_hat / (np.sqrt(v_hat) + self.epsilon)
+
+        return self.max_iter
+
+
+class Newton(Optimizer):
+    """
+    Newton's method with a backtracking line search.
+
+    Each iteration solves H d = grad through `objective.hessian_solve` and steps
+    along -d, halving the step until the objective decreases sufficiently
+    (Armijo condition). Quadratic objectives such as least squares are solved in
+    a single iteration; for logistic regression this is IRLS.
+
+    Args:
+        max_iter (int, optional): The maximum number of iterations. Defaults to 100.
+        tol (float, optional): The gradient norm at which to stop. Defaults to 1e-6.
+    """
+
+    def __init__(self, max_iter: int = 100, tol: float = 1e-6):
+        """
+        Initializes the optimizer's configuration.
+        """
+        super().__init__(max_iter=max_iter, tol=tol)
+
+    def _minimize(self, objective, theta, loss_history):
+        loss, grad = objective.loss_and_grad(theta)
+
+        for n_iter in range(self.max_iter):
+            loss_history[n_iter] = loss
+            if self._converged(grad):
+                return n_iter + 1
+
+            direction = -objective.hessian_solve(theta, grad)
+            accepted = _backtracking_line_search(
+                objective, theta, loss, grad, direction
+            )
+            if accepted is None:
+                # No decrease along the Newton direction: at the optimum up to rounding
+                return n_iter + 1
+            theta[:], loss, grad = accepted
+
+        return self.max_iter
+
+
+class LBFGS(Optimizer):
+    """
+    Limited-memory BFGS with a backtracking line search.
+
+    Approximates the inverse Hessian from the last `memory` parameter and
+    gradient differences (two-loop recursion), which gives close to Newton
+    convergence with only gradient evaluations and O(memory * num_params) memory.
+
+    Args:
+        memory (int, optional): The number of difference pairs to keep. Defaults to 10.
+        max_iter (int, optional): The maximum number of iterations. Defaults to 500.
+        tol (float, optional): The gradient norm at which to stop. Defaults to 1e-6.
+    """
+
+    def __init__(self, memory: int = 10, max_iter: int = 500, tol: float = 1e-6):
+        """
+        Initializes the optimizer's configuration.
+        """
+        super().__init__(max_iter=max_iter, tol=tol)
+        self.memory = memory
+
+    def _minimize(self, objective, theta, loss_history):
+        loss, grad = objective.loss_and_grad(theta)
+        steps, grad_changes, inverse_curvatures = [], [], []
+
+        for n_iter in range(self.max_iter):
+            loss_history[n_iter] = loss
+            if self._converged(grad):
+                return n_iter + 1
+
+            direction = -_two_loop_recursion(
+                grad, steps, grad_changes, inverse_curvatures
+            )
+            if direction @ grad >= 0:
+                # Not a descent direction: restart from steepest descent
+                steps, grad_changes, inverse_curvatures = [], [], []
+                direction = -grad
+
+            accepted = _backtracking_line_search(
+                objective, theta, loss, grad, direction
+            )
+            if accepted is None:
+                return n_iter + 1
+
+            new_theta, loss, new_grad = accepted
+            step, grad_change = new_theta - theta, new_grad - grad
+            curvature = step @ grad_change
+            if curvature > 1e-12:
+                steps.append(step)
+                grad_changes.append(grad_change)
+                inverse_curvatures.append(1 / curvature)
+                if len(steps) > self.memory:
+                    del steps[0], grad_changes[0], inverse_curvatures[0]
+
+            theta[:], grad = new_theta, new_grad
+
+        return self.max_iter
+
+
+OPTIMIZERS = {
+    "gd": GradientDescent,
+    "momentum": Momentum,
+    "adam": Adam,
+    "newton": Newton,
+    "lbfgs": LBFGS,
+}
+
+
+def get_optimizer(name: str, **kwargs) -> Optimizer:
+    """
+    Creates an optimizer by name.
+
+    Args:
+        name (str): One of "gd", "momentum", "adam", "newton" or "lbfgs".
+        **kwargs: Options of the optimizer; options it does not accept are ignored,
+            so e.g. `learning_rate` can be passed to every optimizer.
+
+    Raises:
+        ValueError: If the name is not a known optimizer.
+
+    Returns:
+        Optimizer: The optimizer instance.
+    """
+    if name not in OPTIMIZERS:
+        raise ValueError(
+            f"Unknown optimizer '{name}'. Expected one of {tuple(OPTIMIZERS)}."
+        )
+
+    optimizer_class = OPTIMIZERS[name]
+    accepted = inspect.signature(optimizer_class).parameters
+    return optimizer_class(**{k: v for k, v in kwargs.items() if k in accepted})
+
+
+def _backtracking_line_search(
+    objective: Objective,
+    theta: np.ndarray,
+    loss: float,
+    grad: np.ndarray,
+    direction: np.ndarray,
+    shrink: float = 0.5,
+    c: float = 1e-4,
+    max_halvings: int = 30,
+) -> tuple[np.ndarray, float, np.ndarray] | None:
+    """
+    Finds a step along `direction` that satisfies the Armijo condition
+    f(theta + t d) <= f(theta) + c * t * grad @ d, starting from t = 1.
+
+    Returns:
+        tuple[np.ndarray, float, np.ndarray] | None: The new parameters, objective
+            value and gradient, or None if no step decreases the objective.
+    """
+    slope = grad @ direction
+    step_size = 1.0
+
+    for _ in range(max_halvings):
+        candidate = theta + step_size * direction
+        new_loss, new_grad = objective.loss_and_grad(candidate)
+        if new_loss <= loss + c * step_size * slope:
+            return candidate, new_loss, new_grad
+        step_size *= shrink
+
+    return None
+
+
+def _two_loop_recursion(
+    grad: np.ndarray,
+    steps: list[np.ndarray],
+    grad_changes: list[np.ndarray],
+    inverse_curvatures: list[float],
+) -> np.ndarray:
+    """
+    Applies the L-BFGS inverse Hessian approximation to `grad`.
+    """
+    q = grad.copy()
+    alphas = []
+    for s, y, rho in zip(
+        reversed(steps), reversed(grad_changes), reversed(inverse_curvatures)
+    ):
+        a = rho * (s @ q)
+        alphas.append(a)
+        q -= a * y
+
+    # Scale the initial inverse Hessian by the most recent curvature estimate
+    if steps:
+        q *= (steps[-1] @ grad_changes[-1]) / (grad_changes[-1] @ grad_changes[-1])
+
+    for s, y, rho, a in zip(steps, grad_changes, inverse_curvatures, reversed(alphas)):
+        b = rho * (y @ q)
+        q += (a - b) * s
+
+    return q
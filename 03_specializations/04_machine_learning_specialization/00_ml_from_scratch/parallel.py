@@ -0,0 +1,155 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from sparse_utils import issparse
+from sufficient_stats import SufficientStatistics
+
+
+def effective_n_jobs(n_jobs: int | None) -> int:
+    """
+    Resolves the `n_jobs` convention: None means 1, and negative values count
+    back from the number of CPUs (-1 uses all of them).
+
+    Args:
+        n_jobs (int | None): The requested number of jobs.
+
+    Raises:
+        ValueError: If `n_jobs` is 0.
+
+    Returns:
+        int: The number of worker processes to use.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs == 0 has no meaning.")
+    if n_jobs < 0:
+        return max(os.cpu_count() + 1 + n_jobs, 1)
+
+    return n_jobs
+
+
+def parallel_sufficient_stats(
+    X: np.ndarray,
+    y: np.ndarray,
+    n_jobs: int | None = -1,
+    chunk_size: int = 10_000,
+) -> SufficientStatistics:
+    """
+    Computes the `SufficientStatistics` of the data with a pool of processes.
+
+    X and y are copied once into shared memory, and every worker attaches to it
+    without copying and reduces its own shard of rows in chunks. The partial
+    statistics are merged in the parent. One parallel pass over the data is
+    enough to then fit `LinearRegression` in feature space with any solver but
+    "sgd".
+
+    Sparse matrices are reduced in the calling process, since their index arrays
+    would have to be shared as well.
+
+    When the "spawn" start method is used (the default on macOS and Windows),
+    the calling script must guard its entry point with `if __name__ == "__main__":`.
+
+    Args:
+        X (np.ndarray): Features (num_observations, num_features).
+        y (np.ndarray): Targets (num_observations[, num_outputs]).
+        n_jobs (int | None, optional): The number of worker processes. Defaults to -1 (all CPUs).
+        chunk_size (int, optional): The number of rows per chunk in a worker. Defaults to 10_000.
+
+    Returns:
+        SufficientStatistics: The statistics of the data.
+    """
+    n_jobs = min(effective_n_jobs(n_jobs), max(X.shape[0], 1))
+    if n_jobs == 1 or issparse(X):
+        return SufficientStatistics.from_arrays(X, y, chunk_size=chunk_size)
+
+    shared_X = SharedArray.from_array(X)
+    shared_y = SharedArray.from_array(y)
+    try:
+        bounds = np.linspace(0, X.shape[0], n_jobs + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            partial_stats = executor.map(
+                _shard_stats,
+                [shared_X.spec] * n_jobs,
+                [shared_y.spec] * n_jobs,
+                bounds[:-1],
+                bounds[1:],
+                [chunk_size] * n_jobs,
+            )
+            stats = SufficientStatistics()
+            for partial in partial_stats:
+                stats.merge(partial)
+    finally:
+        shared_X.release()
+        shared_y.release()
+
+    return stats
+
+
+class SharedArray:
+    """
+    A NumPy array in a named shared memory block that other processes can attach to.
+
+    Workers attach to the block by its `spec` without copying the data. The
+    process that created it frees the block with `release`.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, array: np.ndarray):
+        self.memory = memory
+        self.array = array
+
+    @classmethod
+    def from_array(cls, source: np.ndarray) -> "SharedArray":
+        """
+        Copies an array into a new shared memory block.
+        """
+        source = np.asarray(source)
+        memory = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+        array = np.ndarray(source.shape, dtype=source.dtype, buffer=memory.buf)
+        array[...] = source
+
+        return cls(memory, array)
+
+    @property
+    def spec(self) -> tuple[str, tuple[int, ...], str]:
+        """
+        The (name, shape, dtype) a worker needs to attach to the block.
+        """
+        return self.memory.name, self.array.shape, self.array.dtype.str
+
+    def release(self) -> None:
+        """
+        Frees the shared memory block.
+        """
+        del self.array
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _shard_stats(
+    X_spec: tuple[str, tuple[int, ...], str],
+    y_spec: tuple[str, tuple[int, ...], str],
+    start: int,
+    stop: int,
+    chunk_size: int,
+) -> SufficientStatistics:
+    """
+    Computes the statistics of rows [start, stop) of the shared arrays (runs in a worker).
+    """
+    X_memory = shared_memory.SharedMemory(name=X_spec[0])
+    y_memory = shared_memory.SharedMemory(name=y_spec[0])
+    try:
+        X = np.ndarray(X_spec[1], dtype=X_spec[2], buffer=X_memory.buf)
+        y = np.ndarray(y_spec[1], dtype=y_spec[2], buffer=y_memory.buf)
+        stats = SufficientStatistics.from_arrays(
+            X[start:stop], y[start:stop], chunk_size=chunk_size
+        )
+        del X, y
+    finally:
+        X_memory.close()
+        y_memory.close()
+
+    return stats
@@ -0,0 +1,198 @@
+import importlib
+import inspect
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+# File layout: magic | format version (uint32) | header length (uint32) | JSON header
+# (padded with spaces) | array payloads, each starting at a multiple of ALIGNMENT
+MAGIC = b"MLFSMODL"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sII")
+
+# The classes that can be saved, and the modules they are imported from on load
+SUPPORTED_CLASSES = {
+    "LinearRegression": "linear_regression",
+    "LogisticRegression": "logistic_regression",
+    "RidgeRegression": "ridge_regression",
+    "StandardScaler": "preprocessing",
+}
+
+
+def save(obj, path: str | Path) -> None:
+    """
+    Saves a model or scaler in a compact, versioned binary format.
+
+    The file starts with a JSON header holding the class, its hyperparameters,
+    the fitted scalar attributes and the dtype, shape and offset of every fitted
+    array. The raw array data follows, each array aligned to 64 bytes, so that
+    `load(path, mmap=True)` can map the arrays straight from the file.
+
+    Args:
+        obj: A `LinearRegression`, `LogisticRegression`, `RidgeRegression` or
+            `StandardScaler` instance.
+        path (str | Path): The file to write.
+
+    Raises:
+        ValueError: If the class is not supported, or if a hyperparameter or
+            attribute cannot be stored (e.g. an `Optimizer` instance as solver).
+    """
+    class_name = type(obj).__name__
+    if class_name not in SUPPORTED_CLASSES:
+        raise ValueError(
+            f"Cannot save a {class_name}. Expected one of {tuple(SUPPORTED_CLASSES)}."
+        )
+
+    params = _get_params(obj)
+    attributes, arrays = {}, {}
+    for name, value in vars(obj).items():
+        if name in params:
+            continue
+        if isinstance(value, (np.ndarray, np.generic)):
+            arrays[name] = np.asarray(value, order="C")
+        elif value is None or isinstance(value, (bool, int, float)):
+            attributes[name] = value
+        else:
+            raise ValueError(f"Cannot save attribute '{name}' of type {type(value)}.")
+
+    # Offsets are relative to the (aligned) start of the array data
+    array_specs, offset = {}, 0
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise ValueError(f"Cannot save array '{name}' of dtype object.")
+        array_specs[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps(
+        {
+            "class": class_name,
+            "params": params,
+            "attributes": attributes,
+            "arrays": array_specs,
+        }
+    ).encode()
+    header += b" " * (_align(_PREFIX.size + len(header)) - _PREFIX.size - len(header))
+
+    with open(path, "wb") as file:
+        file.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+        file.write(header)
+        for name, array in arrays.items():
+            file.write(b"\0" * (array_specs[name]["offset"] - _tell_data(file, header)))
+            # Write the array's memory directly, without a serialized copy
+            file.write(memoryview(array.reshape(-1)).cast("B"))
+
+
+def load(path: str | Path, mmap: bool = False):
+    """
+    Loads a model or scaler saved with `save`.
+
+    With `mmap=True`, the fitted arrays are read-only views of a memory map of the
+    file: nothing is copied, and the pages are only read from disk when they are
+    used, so even large models load in about the time it takes to parse the header.
+    The file must then not be modified while the model is in use.
+
+    Args:
+        path (str | Path): The file to read.
+        mmap (bool, optional): Whether to memory-map the arrays instead of reading
+            them into memory. Defaults to False.
+
+    Raises:
+        ValueError: If the file is not a saved model, was written by a newer format
+            version, or holds an unsupported class.
+
+    Returns:
+        The restored, fitted instance.
+    """
+    if mmap:
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+    else:
+        data = np.fromfile(path, dtype=np.uint8)
+
+    if data.shape[0] < _PREFIX.size:
+        raise ValueError(f"'{path}' is not a saved model.")
+    magic, version, header_length = _PREFIX.unpack(data[: _PREFIX.size].tobytes())
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' is not a saved model.")
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"'{path}' has format version {version}, but only versions up to "
+            f"{FORMAT_VERSION} are supported."
+        )
+
+    data_start = _PREFIX.size + header_length
+    header = json.loads(data[_PREFIX.size : data_start].tobytes())
+
+    class_name = header["class"]
+    if class_name not in SUPPORTED_CLASSES:
+        raise ValueError(f"'{path}' holds an unsupported class '{class_name}'.")
+    cls = getattr(importlib.import_module(SUPPORTED_CLASSES[class_name]), class_name)
+
+    obj = cls(**header["params"])
+    for name, value in header["attributes"].items():
+        setattr(obj, name, value)
+
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        start = data_start + spec["offset"]
+        stop = start + dtype.itemsize * int(np.prod(shape))
+        array = data[start:stop].view(dtype).reshape(shape)
+        # Zero-dimensional arrays were NumPy scalars, e.g. the bias of a single output
+        setattr(obj, name, array[()] if array.ndim == 0 else array)
+
+    return obj
+
+
+def _get_params(obj) -> dict:
+    """
+    Collects the constructor arguments of an instance from its attributes,
+    including those passed on to base classes through **kwargs.
+    """
+    params = {}
+    for cls in type(obj).__mro__:
+        if "__init__" not in vars(cls) or cls is object:
+            continue
+        for name, parameter in inspect.signature(cls.__init__).parameters.items():
+            if name == "self" or parameter.kind in (
+                parameter.VAR_POSITIONAL,
+                parameter.VAR_KEYWORD,
+            ):
+                continue
+            params.setdefault(name, _to_json(name, getattr(obj, name)))
+
+    return params
+
+
+def _to_json(name: str, value):
+    """
+    Converts a hyperparameter to a JSON value.
+    """
+    if isinstance(value, np.dtype):
+        return value.str
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    raise ValueError(f"Cannot save hyperparameter '{name}' of type {type(value)}.")
+
+
+def _align(position: int) -> int:
+    """
+    Rounds a position up to the next multiple of ALIGNMENT.
+    """
+    return -(-position // ALIGNMENT) * ALIGNMENT
+
+
+def _tell_data(file, header: bytes) -> int:
+    """
+    Returns the current position of the file relative to the start of the array data.
+    """
+    return file.tell() - _PREFIX.size - len(header)
@@ -1,17 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+from dtypes import BLOCK_BYTES, as_float_array, check_float_dtype
+from parallel import effective_n_jobs
+from quantile_sketch import KLLSketch
+from sparse_utils import column_mean_var, issparse, scale_columns
+from sufficient_stats import merge_moments
+
 
 class StandardScaler:
     """
     Standardizes features by removing the mean and scaling to unit variance.
     The standard score of a sample `x` is calculated as: z = (x - u) / s
+
+    SciPy sparse matrices (CSR or CSC) are supported with `with_mean=False`: the
+    columns are then only scaled, which keeps the sparsity pattern, and the
+    statistics are computed from the stored entries alone.
+
+    `partial_fit` updates the statistics chunk by chunk and `merge` combines the
+    statistics of scalers fitted on disjoint rows, e.g. in separate processes.
+
+    Dense data is reduced in a single pass: each block of columns is read in
+    chunks of rows small enough to stay in the cache, and the moments of the
+    chunks are merged. With `n_jobs` > 1, the column blocks are reduced by a pool
+    of threads, which NumPy's reductions let run in parallel.
+
+    The statistics and the transformed data have the precision `dtype`, so a
+    float32 pipeline stays in float32 end to end.
+
+    Args:
+        with_mean (bool, optional): Whether to center the data. Defaults to True.
+        with_std (bool, optional): Whether to scale the data to unit variance. Defaults to True.
+        dtype (np.dtype, optional): The floating point precision, np.float32 or
+            np.float64. Defaults to np.float64.
+        n_jobs (int, optional): The number of threads that compute the statistics of
+            dense data, -1 for all CPUs. Defaults to None (a single thread).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        with_mean: bool = True,
+        with_std: bool = True,
+        dtype=np.float64,
+        n_jobs: int | None = None,
+    ):
         """
         Initializes the scaler's parameters.
+
+        Raises:
+            ValueError: If `dtype` is not float32 or float64.
         """
+        self.with_mean = with_mean
+        self.with_std = with_std
+        self.dtype = check_float_dtype(dtype)
+        self.n_jobs = n_jobs
+        self.n_samples_seen_ = 0
         self.mean_ = None
+        self.var_ = None
         self.scale_ = None
 
     def fit(self, X: np.ndarray) -> "StandardScaler":
@@ -19,35 +65,402 @@ class StandardScaler:
         Compute the mean and standard deviation to be used for later scaling.
 
         Args:
-            X (np.ndarray): The data used to compute the mean and standard deviation.
+            X (np.ndarray | sparse matrix): The data used to compute the mean and standard deviation.
+
+        Raises:
+            ValueError: If `X` is sparse and `with_mean` is True.
 
         Returns:
             StandardScaler: The fitted scaler instance
         """
-        self.mean_ = np.mean(X, axis=0)
-        self.scale_ = np.std(X, axis=0)
+        self.n_samples_seen_ = 0
+        self.mean_ = None
+        self.var_ = None
+        self.scale_ = None
+
+        return self.partial_fit(X)
+
+    def partial_fit(self, X: np.ndarray) -> "StandardScaler":
+        """
+        Update the mean and standard deviation with a new chunk of rows.
+
+        The statistics of the chunk are merged into the running ones with the
+        pairwise update of Chan et al., so a scaler can be fitted in a single
+        streaming pass over data that does not fit into memory.
+
+        Args:
+            X (np.ndarray | sparse matrix): The chunk (chunk_size, num_features).
+
+        Raises:
+            ValueError: If `X` is sparse and `with_mean` is True, or if it has a
+                different number of features than the data seen so far.
+
+        Returns:
+            StandardScaler: The updated scaler instance
+        """
+        self._check_sparse(X)
+        X = as_float_array(X, self.dtype)
+        if X.shape[0] == 0:
+            return self
+
+        chunk = StandardScaler(self.with_mean, self.with_std, self.dtype)
+        if issparse(X):
+            mean, var = column_mean_var(X)
+        else:
+            mean, var = _column_mean_var_blocked(X, effective_n_jobs(self.n_jobs))
+        chunk.n_samples_seen_ = X.shape[0]
+        chunk.mean_ = mean.astype(self.dtype, copy=False)
+        chunk.var_ = var.astype(self.dtype, copy=False)
+
+        return self.merge(chunk)
+
+    def merge(self, other: "StandardScaler") -> "StandardScaler":
+        """
+        Merge the statistics of another scaler, fitted on disjoint rows, into this one.
+
+        This combines scalers fitted on separate chunks or in separate worker
+        processes into the scaler of all their rows.
+
+        Args:
+            other (StandardScaler): The scaler to merge.
+
+        Raises:
+            ValueError: If the scalers were fitted on different numbers of features.
+
+        Returns:
+            StandardScaler: The merged scaler instance
+        """
+        if other.n_samples_seen_ == 0:
+            return self
+
+        other_mean = np.asarray(other.mean_, dtype=self.dtype)
+        other_var = np.asarray(other.var_, dtype=self.dtype)
+
+        if self.n_samples_seen_ == 0:
+            self.n_samples_seen_ = other.n_samples_seen_
+            self.mean_ = other_mean.copy()
+            self.var_ = other_var.copy()
+        else:
+            if self.mean_.shape != other_mean.shape:
+                raise ValueError(
+                    "Cannot merge scalers fitted on different numbers of features."
+                )
+
+            n_self, n_other = self.n_samples_seen_, other.n_samples_seen_
+            self.mean_, squared_deviations = merge_moments(
+                n_self,
+                self.mean_,
+                self.var_ * n_self,
+                n_other,
+                other_mean,
+                other_var * n_other,
+            )
+            self.n_samples_seen_ = n_self + n_other
+            self.var_ = squared_deviations / self.n_samples_seen_
+
+        self.scale_ = np.sqrt(self.var_)
 
         return self
 
-    def transform(self, X: np.ndarray) -> np.ndarray:
+    def transform(
+        self, X: np.ndarray, copy: bool = True, out: np.ndarray | None = None
+    ) -> np.ndarray:
         """
         Perform standardization by centering and scaling.
 
+        The data is centered and scaled block by block, each block while it is
+        still in the cache, and written straight into the result. Apart from the
+        result, no temporary of the size of X is allocated.
+
+        Args:
+            X (np.ndarray | sparse matrix): The data to scale.
+            copy (bool, optional): Whether to leave X unchanged. With False, X is
+                transformed in place if it is a writeable array of the scaler's
+                dtype (or a CSR/CSC matrix). Defaults to True.
+            out (np.ndarray, optional): A dense array of the shape of X and the
+                scaler's dtype to write the result into. Defaults to None.
+
+        Raises:
+            ValueError: If called before the .fit() method, if `X` is sparse and
+                `with_mean` is True, or if `out` does not match X.
+
+        Returns:
+            np.ndarray | sparse matrix: The transformed data, sparse if `X` is sparse.
+        """
+        if self.mean_ is None or self.scale_ is None:
+            raise ValueError(
+                ".transform() method cannot be called before the .fit() method."
+            )
+
+        return self._standardize(X, copy, out, inverse=False)
+
+    def inverse_transform(
+        self, X: np.ndarray, copy: bool = True, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Scale the data back to the original representation: x = z * s + u
+
+        Args:
+            X (np.ndarray | sparse matrix): The standardized data.
+            copy (bool, optional): Whether to leave X unchanged, as in `transform`.
+                Defaults to True.
+            out (np.ndarray, optional): A dense array to write the result into, as in
+                `transform`. Defaults to None.
+
+        Raises:
+            ValueError: If called before the .fit() method, if `X` is sparse and
+                `with_mean` is True, or if `out` does not match X.
+
+        Returns:
+            np.ndarray | sparse matrix: The data in the original representation.
+        """
+        if self.mean_ is None or self.scale_ is None:
+            raise ValueError(
+                ".inverse_transform() method cannot be called before the .fit() method."
+            )
+
+        return self._standardize(X, copy, out, inverse=True)
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit to data, then transform it.
+
+        Args:
+            X (np.ndarray | sparse matrix): The data to fit and transform
+
+        Returns:
+            np.ndarray | sparse matrix: The transformed data.
+        """
+        self.fit(X)
+
+        return self.transform(X)
+
+    def _standardize(
+        self, X: np.ndarray, copy: bool, out: np.ndarray | None, inverse: bool
+    ) -> np.ndarray:
+        """
+        Applies (X - u) / s, or X * s + u when `inverse` is True, without temporaries.
+        """
+        self._check_sparse(X)
+
+        if issparse(X):
+            if out is not None:
+                raise ValueError("out is not supported for sparse data.")
+            X = as_float_array(X, self.dtype)
+            if not self.with_std:
+                return X.copy() if copy else X
+            factors = self.scale_ if inverse else 1 / self.scale_
+            return scale_columns(X, factors, copy=copy)
+
+        X = np.asarray(X)
+        if out is None:
+            in_place = not copy and X.dtype == self.dtype and X.flags.writeable
+            out = X if in_place else np.empty(X.shape, dtype=self.dtype)
+        elif out.shape != X.shape or out.dtype != self.dtype:
+            raise ValueError(
+                f"out must have shape {X.shape} and dtype {self.dtype}, "
+                f"got shape {out.shape} and dtype {out.dtype}."
+            )
+
+        # Rows per block, so that a block of X and of the result stay in the cache
+        block_rows = max(BLOCK_BYTES // max(X[:1].nbytes, 1), 1)
+        for start in range(0, max(X.shape[0], 1), block_rows):
+            source = X[start : start + block_rows]
+            target = out[start : start + block_rows]
+            if inverse:
+                np.multiply(source, self.scale_ if self.with_std else 1, out=target)
+                if self.with_mean:
+                    target += self.mean_
+            else:
+                np.subtract(source, self.mean_ if self.with_mean else 0, out=target)
+                if self.with_std:
+                    target /= self.scale_
+
+        return out
+
+    def _check_sparse(self, X) -> None:
+        """
+        Rejects centering sparse data, which would make it dense.
+        """
+        if self.with_mean and issparse(X):
+            raise ValueError(
+                "Cannot center sparse data, since it would become dense. "
+                "Use with_mean=False instead."
+            )
+
+
+class RobustScaler:
+    """
+    Scales features with statistics that are robust to outliers: the median is
+    removed and the data is divided by the interquartile range (IQR).
+
+    The quantiles come from a `KLLSketch` per scaler, so `partial_fit` can fit the
+    scaler on data of any size in a single streaming pass with memory bounded by
+    `k`, and scalers fitted on disjoint rows can be combined with `merge`. While
+    the scaler has seen fewer rows than fit into the sketch, the quantiles are
+    exact; beyond that, their rank error is around 1% for the default k = 200.
+
+    Args:
+        with_centering (bool, optional): Whether to remove the median. Defaults to True.
+        with_scaling (bool, optional): Whether to divide by the quantile range. Defaults to True.
+        quantile_range (tuple[float, float], optional): The percentiles that bound
+            the range. Defaults to (25.0, 75.0), the IQR.
+        k (int, optional): The size parameter of the quantile sketch. Defaults to 200.
+        random_state (int, optional): The seed of the quantile sketch. Defaults to None.
+        dtype (np.dtype, optional): The floating point precision, np.float32 or
+            np.float64. Defaults to np.float64.
+    """
+
+    def __init__(
+        self,
+        with_centering: bool = True,
+        with_scaling: bool = True,
+        quantile_range: tuple[float, float] = (25.0, 75.0),
+        k: int = 200,
+        random_state: int | None = None,
+        dtype=np.float64,
+    ):
+        """
+        Initializes the scaler's parameters.
+
+        Raises:
+            ValueError: If `dtype` is not float32 or float64.
+        """
+        self.with_centering = with_centering
+        self.with_scaling = with_scaling
+        self.quantile_range = quantile_range
+        self.k = k
+        self.random_state = random_state
+        self.dtype = check_float_dtype(dtype)
+        self.n_samples_seen_ = 0
+        self.sketch_ = None
+        self.center_ = None
+        self.scale_ = None
+
+    def fit(self, X: np.ndarray) -> "RobustScaler":
+        """
+        Compute the median and quantile range to be used for later scaling.
+
+        Args:
+            X (np.ndarray): The data used to compute the median and quantile range.
+
+        Raises:
+            ValueError: If `X` is sparse or `quantile_range` is invalid.
+
+        Returns:
+            RobustScaler: The fitted scaler instance
+        """
+        self._check_quantile_range()
+        self.n_samples_seen_ = 0
+        self.sketch_ = None
+        self.center_ = None
+        self.scale_ = None
+
+        return self.partial_fit(X)
+
+    def partial_fit(self, X: np.ndarray) -> "RobustScaler":
+        """
+        Update the quantile sketch with a new chunk of rows.
+
+        Args:
+            X (np.ndarray): The chunk (chunk_size, num_features).
+
+        Raises:
+            ValueError: If `X` is sparse or has a different number of features than
+                the data seen so far, or if `quantile_range` is invalid.
+
+        Returns:
+            RobustScaler: The updated scaler instance
+        """
+        self._check_quantile_range()
+        _check_dense(X, "RobustScaler")
+        X = as_float_array(X, self.dtype)
+
+        if self.sketch_ is None:
+            self.sketch_ = KLLSketch(self.k, self.random_state)
+        self.sketch_.update(X)
+        self.n_samples_seen_ = self.sketch_.n_samples_
+        self._update_statistics()
+
+        return self
+
+    def merge(self, other: "RobustScaler") -> "RobustScaler":
+        """
+        Merge the sketch of another scaler, fitted on disjoint rows, into this one.
+
+        Args:
+            other (RobustScaler): The scaler to merge.
+
+        Raises:
+            ValueError: If the scalers were fitted on different numbers of features,
+                or if `quantile_range` is invalid.
+
+        Returns:
+            RobustScaler: The merged scaler instance
+        """
+        self._check_quantile_range()
+        if other.n_samples_seen_ == 0:
+            return self
+
+        if self.sketch_ is None:
+            self.sketch_ = KLLSketch(self.k, self.random_state)
+        self.sketch_.merge(other.sketch_)
+        self.n_samples_seen_ = self.sketch_.n_samples_
+        self._update_statistics()
+
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Center and scale the data: z = (x - median) / (q_high - q_low)
+
         Args:
             X (np.ndarray): The data to scale.
 
         Raises:
-            ValueError: If called before the .fit() method.
+            ValueError: If called before the .fit() method, or if `X` is sparse.
 
         Returns:
             np.ndarray: The transformed data.
         """
-        if self.mean_ is None or self.scale_ is None:
+        if self.center_ is None or self.scale_ is None:
             raise ValueError(
                 ".transform() method cannot be called before the .fit() method."
             )
+        _check_dense(X, "RobustScaler")
 
-        return (X - self.mean_) / self.scale_
+        out = np.empty(np.shape(X), dtype=self.dtype)
+        np.subtract(X, self.center_ if self.with_centering else 0, out=out)
+        if self.with_scaling:
+            out /= self.scale_
+
+        return out
+
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scale the data back to the original representation.
+
+        Args:
+            X (np.ndarray): The transformed data.
+
+        Raises:
+            ValueError: If called before the .fit() method, or if `X` is sparse.
+
+        Returns:
+            np.ndarray: The data in the original representation.
+        """
+        if self.center_ is None or self.scale_ is None:
+            raise ValueError(
+                ".inverse_transform() method cannot be called before the .fit() method."
+            )
+        _check_dense(X, "RobustScaler")
+
+        out = np.empty(np.shape(X), dtype=self.dtype)
+        np.multiply(X, self.scale_ if self.with_scaling else 1, out=out)
+        if self.with_centering:
+            out += self.center_
+
+        return out
 
     def fit_transform(self, X: np.ndarray) -> np.ndarray:
         """
@@ -62,3 +475,307 @@ class StandardScaler:
         self.fit(X)
 
         return self.transform(X)
+
+    def _check_quantile_range(self) -> None:
+        """
+        Checks `quantile_range` before any statistics are updated.
+
+        Raises:
+            ValueError: If the range is not 0 <= q_low <= q_high <= 100.
+        """
+        q_low, q_high = self.quantile_range
+        if not 0 <= q_low <= q_high <= 100:
+            raise ValueError(f"Invalid quantile_range {self.quantile_range}.")
+
+    def _update_statistics(self) -> None:
+        """
+        Reads the median and the quantile range from the sketch.
+        """
+        q_low, q_high = self.quantile_range
+        low, median, high = self.sketch_.quantile([q_low / 100, 0.5, q_high / 100])
+        self.center_ = median
+        # Constant features would be divided by zero, so they are left unscaled
+        scale = high - low
+        self.scale_ = np.where(scale == 0, 1, scale).astype(self.dtype)
+
+
+class MinMaxScaler:
+    """
+    Scales every feature to the range `feature_range` using its minimum and maximum:
+    z = (x - min) / (max - min) * (high - low) + low
+
+    The minimum and maximum can be updated exactly chunk by chunk, so
+    `partial_fit` and `merge` need no sketch.
+
+    Args:
+        feature_range (tuple[float, float], optional): The target range. Defaults to (0, 1).
+        dtype (np.dtype, optional): The floating point precision, np.float32 or
+            np.float64. Defaults to np.float64.
+    """
+
+    def __init__(self, feature_range: tuple[float, float] = (0, 1), dtype=np.float64):
+        """
+        Initializes the scaler's parameters.
+
+        Raises:
+            ValueError: If `dtype` is not float32 or float64.
+        """
+        self.feature_range = feature_range
+        self.dtype = check_float_dtype(dtype)
+        self.n_samples_seen_ = 0
+        self.data_min_ = None
+        self.data_max_ = None
+        self.scale_ = None
+        self.min_ = None
+
+    def fit(self, X: np.ndarray) -> "MinMaxScaler":
+        """
+        Compute the minimum and maximum to be used for later scaling.
+
+        Args:
+            X (np.ndarray): The data used to compute the minimum and maximum.
+
+        Raises:
+            ValueError: If `X` is sparse or `feature_range` is invalid.
+
+        Returns:
+            MinMaxScaler: The fitted scaler instance
+        """
+        self._check_feature_range()
+        self.n_samples_seen_ = 0
+        self.data_min_ = None
+        self.data_max_ = None
+        self.scale_ = None
+        self.min_ = None
+
+        return self.partial_fit(X)
+
+    def partial_fit(self, X: np.ndarray) -> "MinMaxScaler":
+        """
+        Update the minimum and maximum with a new chunk of rows.
+
+        Args:
+            X (np.ndarray): The chunk (chunk_size, num_features).
+
+        Raises:
+            ValueError: If `X` is sparse or has a different number of features than
+                the data seen so far, or if `feature_range` is invalid.
+
+        Returns:
+            MinMaxScaler: The updated scaler instance
+        """
+        self._check_feature_range()
+        _check_dense(X, "MinMaxScaler")
+        X = as_float_array(X, self.dtype)
+        if X.shape[0] == 0:
+            return self
+
+        chunk = MinMaxScaler(self.feature_range, self.dtype)
+        chunk.n_samples_seen_ = X.shape[0]
+        chunk.data_min_ = np.min(X, axis=0)
+        chunk.data_max_ = np.max(X, axis=0)
+
+        return self.merge(chunk)
+
+    def merge(self, other: "MinMaxScaler") -> "MinMaxScaler":
+        """
+        Merge the minimum and maximum of another scaler into this one.
+
+        Args:
+            other (MinMaxScaler): The scaler to merge.
+
+        Raises:
+            ValueError: If the scalers were fitted on different numbers of features,
+                or if `feature_range` is invalid.
+
+        Returns:
+            MinMaxScaler: The merged scaler instance
+        """
+        self._check_feature_range()
+        if other.n_samples_seen_ == 0:
+            return self
+
+        other_min = np.asarray(other.data_min_, dtype=self.dtype)
+        other_max = np.asarray(other.data_max_, dtype=self.dtype)
+
+        if self.n_samples_seen_ == 0:
+            self.data_min_ = other_min.copy()
+            self.data_max_ = other_max.copy()
+        elif self.data_min_.shape != other_min.shape:
+            raise ValueError(
+                "Cannot merge scalers fitted on different numbers of features."
+            )
+        else:
+            np.minimum(self.data_min_, other_min, out=self.data_min_)
+            np.maximum(self.data_max_, other_max, out=self.data_max_)
+        self.n_samples_seen_ += other.n_samples_seen_
+
+        low, high = self.feature_range
+        # Constant features are mapped to `low` instead of being divided by zero
+        data_range = self.data_max_ - self.data_min_
+        data_range = np.where(data_range == 0, 1, data_range).astype(self.dtype)
+        self.scale_ = ((high - low) / data_range).astype(self.dtype)
+        self.min_ = (low - self.data_min_ * self.scale_).astype(self.dtype)
+
+        return self
+
+    def _check_feature_range(self) -> None:
+        """
+        Checks `feature_range` before the minimum and maximum are updated.
+
+        Raises:
+            ValueError: If the range is not low < high.
+        """
+        low, high = self.feature_range
+        if low >= high:
+            raise ValueError(f"Invalid feature_range {self.feature_range}.")
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scale the data to `feature_range`.
+
+        Args:
+            X (np.ndarray): The data to scale.
+
+        Raises:
+            ValueError: If called before the .fit() method, or if `X` is sparse.
+
+        Returns:
+            np.ndarray: The transformed data.
+        """
+        if self.scale_ is None or self.min_ is None:
+            raise ValueError(
+                ".transform() method cannot be called before the .fit() method."
+            )
+        _check_dense(X, "MinMaxScaler")
+
+        out = np.empty(np.shape(X), dtype=self.dtype)
+        np.multiply(X, self.scale_, out=out)
+        out += self.min_
+
+        return out
+
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scale the data back to the original representation.
+
+        Args:
+            X (np.ndarray): The transformed data.
+
+        Raises:
+            ValueError: If called before the .fit() method, or if `X` is sparse.
+
+        Returns:
+            np.ndarray: The data in the original representation.
+        """
+        if self.scale_ is None or self.min_ is None:
+            raise ValueError(
+                ".inverse_transform() method cannot be called before the .fit() method."
+            )
+        _check_dense(X, "MinMaxScaler")
+
+        out = np.empty(np.shape(X), dtype=self.dtype)
+        np.subtract(X, self.min_, out=out)
+        out /= self.scale_
+
+        return out
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit to data, then transform it.
+
+        Args:
+            X (np.ndarray): The data to fit and transform
+
+        Returns:
+            np.ndarray: The transformed data.
+        """
+        self.fit(X)
+
+        return self.transform(X)
+
+
+def _check_dense(X, name: str) -> None:
+    """
+    Rejects sparse data for scalers that only support dense arrays.
+    """
+    if issparse(X):
+        raise ValueError(f"{name} does not support sparse data.")
+
+
+def _column_mean_var_blocked(
+    X: np.ndarray, n_jobs: int = 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the column means and variances of dense data in a single pass.
+
+    The columns are split into one block per thread. Each block is reduced in
+    chunks of rows that fit into the cache, and the chunk moments are merged with
+    Chan's update, so every element of X is read from memory only once.
+
+    One-dimensional data is treated as a single column, whose mean and variance
+    are returned as 0-d arrays.
+
+    Args:
+        X (np.ndarray): The data (num_observations, num_features) or (num_observations).
+        n_jobs (int, optional): The number of threads. Defaults to 1.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The column means and variances.
+    """
+    if X.ndim == 1:
+        mean, var = _block_mean_var(X[:, np.newaxis])
+        return mean.reshape(()), var.reshape(())
+
+    num_features = X.shape[1]
+    blocks = [
+        block
+        for block in np.array_split(np.arange(num_features), n_jobs)
+        if block.size > 0
+    ]
+    column_slices = [slice(block[0], block[-1] + 1) for block in blocks]
+
+    if len(column_slices) <= 1:
+        return _block_mean_var(X)
+
+    mean = np.empty(num_features, dtype=X.dtype)
+    var = np.empty(num_features, dtype=X.dtype)
+    with ThreadPoolExecutor(max_workers=len(column_slices)) as executor:
+        results = executor.map(
+            lambda columns: _block_mean_var(X[:, columns]), column_slices
+        )
+        for columns, (block_mean, block_var) in zip(column_slices, results):
+            mean[columns] = block_mean
+            var[columns] = block_var
+
+    return mean, var
+
+
+def _block_mean_var(X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the column means and variances of a block of columns chunk by chunk.
+    """
+    num_observations, num_features = X.shape
+    rows = max(BLOCK_BYTES // max(num_features * X.itemsize, 1), 1)
+
+    count = 0
+    mean = np.zeros(num_features, dtype=X.dtype)
+    squared_deviations = np.zeros(num_features, dtype=X.dtype)
+    for start in range(0, num_observations, rows):
+        chunk = X[start : start + rows]
+        chunk_count = chunk.shape[0]
+        chunk_mean = chunk.mean(axis=0)
+        deviations = chunk - chunk_mean
+        chunk_squared_deviations = np.einsum("ij,ij->j", deviations, deviations)
+
+        mean, squared_deviations = merge_moments(
+            count,
+            mean,
+            squared_deviations,
+            chunk_count,
+            chunk_mean,
+            chunk_squared_deviations,
+        )
+        count += chunk_count
+
+    return mean, squared_deviations / max(count, 1)
@@ -0,0 +1,190 @@
+import numpy as np
+
+
+class KLLSketch:
+    """
+    A mergeable quantile sketch with bounded memory (Karnin, Lang and Liberty).
+
+    The sketch keeps a hierarchy of compactors. Level h holds items that each
+    stand for 2^h of the original values. When a level exceeds its capacity, it
+    is sorted and every other item (starting at a random offset) is promoted to
+    the next level with twice the weight, halving the memory it takes. Upper
+    levels have the largest capacity `k` and lower ones shrink geometrically, so
+    the sketch holds O(k) items per column no matter how many values it has seen.
+    The rank error of a quantile shrinks in proportion to 1 / k, to around 1% of
+    the number of values for the default k = 200.
+
+    Every column of a batch receives the same number of values, so all columns
+    share the same level structure. Each level is stored as one
+    (num_items, num_features) array, and sorting and compacting runs for all
+    columns at once.
+
+    As long as no level has been compacted, quantiles are exact.
+
+    Args:
+        k (int, optional): The capacity of the top level, which sets the accuracy. Defaults to 200.
+        random_state (int, optional): The seed for the compaction offsets. Defaults to None.
+    """
+
+    def __init__(self, k: int = 200, random_state: int | None = None):
+        """
+        Initializes an empty sketch.
+
+        Raises:
+            ValueError: If `k` is smaller than 2.
+        """
+        if k < 2:
+            raise ValueError("k must be at least 2.")
+
+        self.k = k
+        self.random_state = random_state
+        self.n_samples_ = 0
+        self.levels_ = None
+        self._rng = np.random.default_rng(random_state)
+
+    def update(self, values: np.ndarray) -> "KLLSketch":
+        """
+        Adds a batch of values to the sketch.
+
+        Args:
+            values (np.ndarray): The values (num_observations[, num_features]).
+
+        Raises:
+            ValueError: If the number of features differs from earlier batches.
+
+        Returns:
+            KLLSketch: The updated sketch.
+        """
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        if values.shape[0] == 0:
+            return self
+
+        if self.levels_ is None:
+            self.levels_ = [np.empty((0, values.shape[1]), dtype=values.dtype)]
+        elif values.shape[1] != self.levels_[0].shape[1]:
+            raise ValueError(
+                f"Expected {self.levels_[0].shape[1]} features, got {values.shape[1]}."
+            )
+
+        self.levels_[0] = np.concatenate([self.levels_[0], values])
+        self.n_samples_ += values.shape[0]
+        self._compress()
+
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Merges a sketch of other values into this one.
+
+        Args:
+            other (KLLSketch): The sketch to merge.
+
+        Raises:
+            ValueError: If the sketches have different numbers of features.
+
+        Returns:
+            KLLSketch: The merged sketch.
+        """
+        if other.n_samples_ == 0:
+            return self
+
+        if self.levels_ is None:
+            self.levels_ = [np.empty((0, other.levels_[0].shape[1]), other.dtype)]
+        elif other.levels_[0].shape[1] != self.levels_[0].shape[1]:
+            raise ValueError(
+                "Cannot merge sketches with different numbers of features."
+            )
+
+        for h, level in enumerate(other.levels_):
+            if h == len(self.levels_):
+                self.levels_.append(level[:0])
+            self.levels_[h] = np.concatenate([self.levels_[h], level])
+        self.n_samples_ += other.n_samples_
+        self._compress()
+
+        return self
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The dtype of the stored items.
+        """
+        return self.levels_[0].dtype
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        Whether the sketch still holds every value it has seen.
+        """
+        return self.levels_ is not None and len(self.levels_) == 1
+
+    def quantile(self, q: float | np.ndarray) -> np.ndarray:
+        """
+        Estimates quantiles of every column.
+
+        Args:
+            q (float | np.ndarray): The probabilities, between 0 and 1.
+
+        Raises:
+            ValueError: If the sketch is empty.
+
+        Returns:
+            np.ndarray: The quantiles, of shape (num_features) for a scalar `q` and
+                (len(q), num_features) otherwise.
+        """
+        if self.n_samples_ == 0:
+            raise ValueError("Cannot compute quantiles of an empty sketch.")
+
+        q = np.asarray(q, dtype=float)
+        if self.is_exact:
+            return np.quantile(self.levels_[0], q, axis=0).astype(self.dtype)
+
+        items = np.concatenate(self.levels_)
+        weights = np.concatenate(
+            [np.full(level.shape[0], 2**h) for h, level in enumerate(self.levels_)]
+        )
+
+        # Sort each column and accumulate the weights of its items
+        order = np.argsort(items, axis=0)
+        sorted_items = np.take_along_axis(items, order, axis=0)
+        cumulative_weights = np.cumsum(weights[order], axis=0)
+
+        # The first item whose cumulative weight reaches q * n, for every column
+        targets = np.atleast_1d(q)[:, np.newaxis, np.newaxis] * self.n_samples_
+        index = np.sum(cumulative_weights[np.newaxis] < targets, axis=1)
+        index = np.minimum(index, items.shape[0] - 1)
+        result = np.take_along_axis(sorted_items, index, axis=0)
+
+        return result[0] if q.ndim == 0 else result
+
+    def _capacity(self, h: int) -> int:
+        """
+        Returns the capacity of level h: k at the top, shrinking by 2/3 per level below.
+        """
+        depth = len(self.levels_) - 1 - h
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self) -> None:
+        """
+        Compacts every level that exceeds its capacity, from the bottom up.
+        """
+        h = 0
+        while h < len(self.levels_):
+            level = self.levels_[h]
+            if level.shape[0] > self._capacity(h):
+                if h + 1 == len(self.levels_):
+                    self.levels_.append(level[:0])
+
+                level = np.sort(level, axis=0)
+                # An odd item out stays on this level
+                leftover, pairs = (
+                    level[: level.shape[0] % 2],
+                    level[level.shape[0] % 2 :],
+                )
+                promoted = pairs[self._rng.integers(2) :: 2]
+
+                self.levels_[h] = leftover
+                self.levels_[h + 1] = np.concatenate([self.levels_[h + 1], promoted])
+            h += 1
@@ -0,0 +1,46 @@
+from linear_regression import LinearRegression
+
+
+class RidgeRegression(LinearRegression):
+    """
+    Linear Regression with an L2 penalty on the weights (Ridge Regression).
+
+    Minimizes (1 / 2n) * ||X w + b - y||^2 + (lambda_ / 2) * ||w||^2. The bias is
+    not penalized. All solvers of `LinearRegression` are available: the direct
+    solvers give the closed-form solution (X^T X + n * lambda_ * I)^-1 X^T y on
+    centered data, and "gd"/"sgd" solve it iteratively.
+
+    Args:
+        lambda_ (float, optional): The regularization strength. Defaults to 1.0.
+        alpha (float, optional): The learning rate. Defaults to 0.001.
+        epochs (int, optional): The number of iterations for gradient descent. Defaults to 1000.
+        solver (str, optional): One of "gd", "sgd", "cholesky", "qr", "lstsq" or "auto".
+            Defaults to "auto".
+        **kwargs: Further options of `LinearRegression`, e.g. `tol` or `batch_size`.
+
+    """
+
+    def __init__(
+        self,
+        lambda_: float = 1.0,
+        alpha: float = 0.001,
+        epochs: int = 1000,
+        solver: str = "auto",
+        **kwargs,
+    ) -> None:
+        """
+        Initializes the model's configuration.
+
+        """
+        super().__init__(alpha=alpha, epochs=epochs, solver=solver, **kwargs)
+        self.lambda_ = lambda_
+
+    def _l2_penalty(self) -> float:
+        """
+        Returns the strength of the L2 penalty on the weights.
+
+        Returns:
+            float: The penalty strength `lambda_`.
+
+        """
+        return self.lambda_
@@ -0,0 +1,112 @@
+import numpy as np
+
+# SciPy is optional: without it, only dense arrays are supported
+try:
+    import scipy.sparse as sp
+except ImportError:  # pragma: no cover
+    sp = None
+
+
+def issparse(X) -> bool:
+    """
+    Checks whether X is a SciPy sparse matrix or array (e.g. CSR or CSC).
+
+    Args:
+        X: The data to check.
+
+    Returns:
+        bool: True if X is sparse.
+    """
+    return sp is not None and sp.issparse(X)
+
+
+def column_mean(X) -> np.ndarray:
+    """
+    Computes the mean of every column of a dense or sparse matrix.
+
+    Args:
+        X (np.ndarray | sparse matrix): The data (num_observations, num_features).
+
+    Returns:
+        np.ndarray: The column means (num_features).
+    """
+    return np.asarray(X.mean(axis=0)).ravel()
+
+
+def column_mean_var(X) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the mean and (population) variance of every column, touching only
+    the stored entries of a sparse matrix.
+
+    Args:
+        X (np.ndarray | sparse matrix): The data (num_observations, num_features).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The column means and variances.
+    """
+    if not issparse(X):
+        return np.mean(X, axis=0), np.var(X, axis=0)
+
+    mean = column_mean(X)
+    mean_of_squares = np.asarray(X.multiply(X).mean(axis=0)).ravel()
+    # E[x^2] - E[x]^2 can be slightly negative from rounding
+    return mean, np.maximum(mean_of_squares - mean**2, 0.0)
+
+
+def scale_columns(X, factors: np.ndarray, copy: bool = True):
+    """
+    Multiplies every column of a sparse matrix by a factor, keeping its format
+    and sparsity pattern.
+
+    Args:
+        X (sparse matrix): The data (num_observations, num_features).
+        factors (np.ndarray): One factor per column.
+        copy (bool, optional): Whether to return a scaled copy. With False, CSR
+            and CSC matrices are scaled in place. Defaults to True.
+
+    Returns:
+        sparse matrix: The scaled matrix.
+    """
+    if copy or X.format not in ("csr", "csc"):
+        return (X @ sp.diags(factors)).asformat(X.format)
+
+    # Scale the stored entries directly: CSR stores their column indices, CSC
+    # stores each column's entries contiguously
+    if X.format == "csr":
+        X.data *= factors[X.indices]
+    else:
+        X.data *= np.repeat(factors, np.diff(X.indptr))
+
+    return X
+
+
+def to_dense(X) -> np.ndarray:
+    """
+    Converts a (small) sparse result, e.g. a Gram matrix, to a dense array.
+
+    Args:
+        X (np.ndarray | sparse matrix): The data.
+
+    Returns:
+        np.ndarray: The dense data.
+    """
+    return X.toarray() if issparse(X) else np.asarray(X)
+
+
+def matmul(A, B: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Computes A @ B into `out`, for a dense or sparse A.
+
+    Args:
+        A (np.ndarray | sparse matrix): The left factor.
+        B (np.ndarray): The dense right factor.
+        out (np.ndarray): The array to write the product into.
+
+    Returns:
+        np.ndarray: `out`.
+    """
+    if issparse(A):
+        out[...] = A @ B
+        return out
+
+    return np.matmul(A, B, out=out)
@@ -0,0 +1,217 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from sparse_utils import column_mean, issparse, to_dense
+
+
+class SufficientStatistics:
+    """
+    Mergeable sufficient statistics of a least-squares problem.
+
+    Everything a linear regression fit needs from the data is contained in the
+    means of X and y and the centered (co)moments X_c^T X_c, X_c^T y_c and
+    sum(y_c^2). They have a size independent of the number of rows, can be
+    accumulated chunk by chunk and merged across chunks or worker processes.
+    Merging uses the pairwise update of Chan et al., which is numerically stable
+    even when the means are large compared to the spread of the data.
+
+    Sparse chunks are never centered: their Gram matrix is computed on the stored
+    entries and corrected by the outer product of the means afterwards.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty statistics.
+        """
+        self.n_samples_ = 0
+        self.mean_x_ = None
+        self.mean_y_ = None
+        self.xx_ = None
+        self.xy_ = None
+        self.yy_ = None
+
+    @classmethod
+    def from_arrays(
+        cls, X: np.ndarray, y: np.ndarray, chunk_size: int = 10_000
+    ) -> "SufficientStatistics":
+        """
+        Computes the statistics of in-memory (or memory-mapped) arrays in row chunks.
+
+        Args:
+            X (np.ndarray): Features (num_observations, num_features).
+            y (np.ndarray): Targets (num_observations[, num_outputs]).
+            chunk_size (int, optional): The number of rows per chunk. Defaults to 10_000.
+
+        Returns:
+            SufficientStatistics: The statistics of the data.
+        """
+        stats = cls()
+        for start in range(0, X.shape[0], chunk_size):
+            stats.update(X[start : start + chunk_size], y[start : start + chunk_size])
+
+        return stats
+
+    @classmethod
+    def from_batches(
+        cls, batches: Iterable[tuple[np.ndarray, np.ndarray]]
+    ) -> "SufficientStatistics":
+        """
+        Computes the statistics of a stream of (X_batch, y_batch) pairs in one pass.
+
+        Args:
+            batches (Iterable[tuple[np.ndarray, np.ndarray]]): The batches of data.
+
+        Returns:
+            SufficientStatistics: The statistics of the data.
+        """
+        stats = cls()
+        for X_batch, y_batch in batches:
+            stats.update(X_batch, y_batch)
+
+        return stats
+
+    def astype(self, dtype: np.dtype) -> "SufficientStatistics":
+        """
+        Returns the statistics with their means and moments in another precision.
+
+        Args:
+            dtype (np.dtype): The floating point precision.
+
+        Returns:
+            SufficientStatistics: The statistics themselves if they already have
+                that precision, a converted copy otherwise.
+        """
+        if self.n_samples_ == 0 or self.xx_.dtype == dtype:
+            return self
+
+        converted = SufficientStatistics()
+        converted.n_samples_ = self.n_samples_
+        for name in ("mean_x_", "mean_y_", "xx_", "xy_", "yy_"):
+            setattr(converted, name, np.asarray(getattr(self, name), dtype=dtype))
+
+        return converted
+
+    def update(self, X: np.ndarray, y: np.ndarray) -> "SufficientStatistics":
+        """
+        Adds a chunk of rows to the statistics.
+
+        Args:
+            X (np.ndarray | sparse matrix): Features of the chunk (chunk_size, num_features).
+            y (np.ndarray): Targets of the chunk (chunk_size[, num_outputs]).
+
+        Returns:
+            SufficientStatistics: The updated statistics.
+        """
+        if X.shape[0] == 0:
+            return self
+
+        chunk = SufficientStatistics()
+        chunk.n_samples_ = X.shape[0]
+        chunk.mean_y_ = np.mean(y, axis=0)
+        y_centered = y - chunk.mean_y_
+        chunk.yy_ = np.sum(y_centered**2, axis=0)
+
+        if issparse(X):
+            # X_c^T X_c = X^T X - n * mean mean^T, and X_c^T y_c = X^T y_c
+            chunk.mean_x_ = column_mean(X)
+            chunk.xx_ = to_dense(X.T @ X) - chunk.n_samples_ * np.multiply.outer(
+                chunk.mean_x_, chunk.mean_x_
+            )
+            chunk.xy_ = to_dense(X.T @ y_centered)
+        else:
+            chunk.mean_x_ = np.mean(X, axis=0)
+            X_centered = X - chunk.mean_x_
+            chunk.xx_ = X_centered.T @ X_centered
+            chunk.xy_ = X_centered.T @ y_centered
+
+        return self.merge(chunk)
+
+    def merge(self, other: "SufficientStatistics") -> "SufficientStatistics":
+        """
+        Merges the statistics of another, disjoint set of rows into these ones.
+
+        Args:
+            other (SufficientStatistics): The statistics to merge.
+
+        Raises:
+            ValueError: If the statistics have a different number of features or outputs.
+
+        Returns:
+            SufficientStatistics: The merged statistics.
+        """
+        if other.n_samples_ == 0:
+            return self
+
+        if self.n_samples_ == 0:
+            # Float32 statistics stay in float32, anything else becomes float64
+            dtype = np.result_type(other.xx_, np.float32)
+            self.n_samples_ = other.n_samples_
+            self.mean_x_ = np.array(other.mean_x_, dtype=dtype)
+            self.mean_y_ = np.array(other.mean_y_, dtype=dtype)
+            self.xx_ = np.array(other.xx_, dtype=dtype)
+            self.xy_ = np.array(other.xy_, dtype=dtype)
+            self.yy_ = np.array(other.yy_, dtype=dtype)
+            return self
+
+        if (
+            self.mean_x_.shape != other.mean_x_.shape
+            or self.mean_y_.shape != other.mean_y_.shape
+        ):
+            raise ValueError(
+                "Cannot merge statistics with different numbers of features or outputs."
+            )
+
+        n = self.n_samples_ + other.n_samples_
+        delta_x = other.mean_x_ - self.mean_x_
+        delta_y = other.mean_y_ - self.mean_y_
+        factor = self.n_samples_ * other.n_samples_ / n
+
+        # Chan et al. pairwise update of the centered moments
+        self.xx_ += other.xx_ + factor * np.multiply.outer(delta_x, delta_x)
+        self.xy_ += other.xy_ + factor * np.multiply.outer(delta_x, delta_y)
+        self.mean_y_[...], self.yy_[...] = merge_moments(
+            self.n_samples_,
+            self.mean_y_,
+            self.yy_,
+            other.n_samples_,
+            other.mean_y_,
+            other.yy_,
+        )
+        self.mean_x_ += delta_x * (other.n_samples_ / n)
+        self.n_samples_ = n
+
+        return self
+
+
+def merge_moments(
+    n_a: int,
+    mean_a: np.ndarray,
+    squared_deviations_a: np.ndarray,
+    n_b: int,
+    mean_b: np.ndarray,
+    squared_deviations_b: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Combines the means and sums of squared deviations of two disjoint sets of rows
+    with the pairwise update of Chan et al.
+
+    Args:
+        n_a (int): The number of rows of the first set.
+        mean_a (np.ndarray): The means of the first set.
+        squared_deviations_a (np.ndarray): The sums of squared deviations from `mean_a`.
+        n_b (int): The number of rows of the second set.
+        mean_b (np.ndarray): The means of the second set.
+        squared_deviations_b (np.ndarray): The sums of squared deviations from `mean_b`.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The means and sums of squared deviations of
+            the union of both sets.
+    """
+    n = n_a + n_b
+    delta = mean_b - mean_a
+
+    return (
+        mean_a + delta * (n_b / n),
+        squared_deviations_a + squared_deviations_b + delta**2 * (n_a * n_b / n),
+    )
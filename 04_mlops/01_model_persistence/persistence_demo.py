@@ -0,0 +1,97 @@
+"""
+Saves a fitted `StandardScaler` and `LinearRegression` from `00_ml_from_scratch`
+in its binary model format, loads them back with and without memory mapping, and
+compares the load time of a wide model with `pickle`.
+
+Run from the repository root:
+    python 04_mlops/01_model_persistence/persistence_demo.py
+"""
+
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ML_FROM_SCRATCH = (
+    Path(__file__).resolve().parents[2]
+    / "03_specializations"
+    / "04_machine_learning_specialization"
+    / "00_ml_from_scratch"
+)
+sys.path.insert(0, str(ML_FROM_SCRATCH))
+from linear_regression import LinearRegression  # noqa: E402
+from persistence import load, save  # noqa: E402
+from preprocessing import StandardScaler  # noqa: E402
+
+WIDE_SHAPE = (20_000, 500)
+REPEATS = 5
+
+
+def best_time(function) -> float:
+    """
+    Returns the fastest of REPEATS calls in milliseconds.
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) * 1e3
+
+
+def main() -> None:
+    sales = pd.read_csv(ML_FROM_SCRATCH / "data" / "marketing_sales.csv")
+    X = sales[["Marketing_Spend"]].to_numpy(dtype=float)
+    y = sales["Revenue"].to_numpy(dtype=float)
+
+    scaler = StandardScaler().fit(X)
+    model = LinearRegression(solver="cholesky").fit(scaler.transform(X), y)
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+
+        # Round trip of the scaler and the model
+        save(scaler, directory / "scaler.mlfs")
+        save(model, directory / "model.mlfs")
+        loaded_scaler = load(directory / "scaler.mlfs", mmap=True)
+        loaded_model = load(directory / "model.mlfs", mmap=True)
+
+        predictions = loaded_model.predict(loaded_scaler.transform(X))
+        print(
+            "Loaded pipeline reproduces the predictions:",
+            np.array_equal(predictions, model.predict(scaler.transform(X))),
+        )
+        print(f"Model file size: {(directory / 'model.mlfs').stat().st_size} bytes")
+
+        # Cold-start cost of a wide multi-output model
+        wide = LinearRegression(dtype=np.float32)
+        wide.weights = np.random.default_rng(0).normal(size=WIDE_SHAPE)
+        wide.weights = wide.weights.astype(np.float32)
+        wide.bias = np.zeros(WIDE_SHAPE[1], dtype=np.float32)
+        save(wide, directory / "wide.mlfs")
+        with open(directory / "wide.pkl", "wb") as file:
+            pickle.dump(wide, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def load_pickle():
+            with open(directory / "wide.pkl", "rb") as file:
+                return pickle.load(file)
+
+        size_mb = wide.weights.nbytes / 1e6
+        print(f"\nLoading a {WIDE_SHAPE} float32 model ({size_mb:.0f} MB):")
+        print(f"  pickle:     {best_time(load_pickle):8.2f} ms")
+        print(
+            f"  load:       {best_time(lambda: load(directory / 'wide.mlfs')):8.2f} ms"
+        )
+        print(
+            "  load(mmap): "
+            f"{best_time(lambda: load(directory / 'wide.mlfs', mmap=True)):8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
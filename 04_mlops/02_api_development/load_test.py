@@ -0,0 +1,167 @@
+"""
+Local load generator for `server.py`.
+
+Fits and saves a `StandardScaler` + `LinearRegression` pipeline, then starts the
+server in a subprocess for each batching configuration and sends single-row
+requests from CONCURRENCY keep-alive connections for DURATION seconds. Reports
+the p50/p99 latency, the throughput in requests per second and the average
+number of rows per predict call, with batching disabled (max_batch_size=1) and
+enabled.
+
+Run from the repository root:
+    python 04_mlops/02_api_development/load_test.py
+"""
+
+import asyncio
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+SERVER = Path(__file__).resolve().parent / "server.py"
+ML_FROM_SCRATCH = (
+    Path(__file__).resolve().parents[2]
+    / "03_specializations"
+    / "04_machine_learning_specialization"
+    / "00_ml_from_scratch"
+)
+sys.path.insert(0, str(ML_FROM_SCRATCH))
+from linear_regression import LinearRegression  # noqa: E402
+from persistence import save  # noqa: E402
+from preprocessing import StandardScaler  # noqa: E402
+
+NUM_FEATURES = 50
+CONCURRENCY = 64
+DURATION = 5.0
+# (max_batch_size, max_wait_ms)
+CONFIGS = [(1, 0.0), (16, 1.0), (64, 2.0)]
+
+
+async def client(
+    host: str, port: int, rows: np.ndarray, deadline: float, latencies: list[float]
+) -> None:
+    """
+    Sends requests over one keep-alive connection until the deadline.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = np.random.default_rng()
+    try:
+        while time.perf_counter() < deadline:
+            body = json.dumps({"features": rows[rng.integers(len(rows))].tolist()})
+            request = (
+                "POST /predict HTTP/1.1\r\n"
+                f"Host: {host}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "\r\n"
+                f"{body}"
+            )
+
+            start = time.perf_counter()
+            writer.write(request.encode())
+            await writer.drain()
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = int(re.search(rb"Content-Length: (\d+)", headers).group(1))
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run_config(
+    scaler_path: Path,
+    model_path: Path,
+    rows: np.ndarray,
+    max_batch_size: int,
+    max_wait_ms: float,
+) -> dict:
+    """
+    Starts a server with one batching configuration and measures it under load.
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(SERVER),
+        "--scaler",
+        str(scaler_path),
+        "--model",
+        str(model_path),
+        "--port",
+        "0",
+        "--max-batch-size",
+        str(max_batch_size),
+        "--max-wait-ms",
+        str(max_wait_ms),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        # The server announces its address once it accepts connections
+        banner = (await process.stdout.readline()).decode()
+        host, port = re.search(r"http://([\d.]+):(\d+)", banner).groups()
+
+        latencies = []
+        deadline = time.perf_counter() + DURATION
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                client(host, int(port), rows, deadline, latencies)
+                for _ in range(CONCURRENCY)
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+        # How many requests the server answered per predict call
+        reader, writer = await asyncio.open_connection(host, int(port))
+        writer.write(b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n")
+        health = json.loads((await reader.read()).split(b"\r\n\r\n", 1)[1])
+        writer.close()
+    finally:
+        process.terminate()
+        await process.wait()
+
+    latencies_ms = np.array(latencies) * 1e3
+    return {
+        "p50": np.percentile(latencies_ms, 50),
+        "p99": np.percentile(latencies_ms, 99),
+        "rps": len(latencies) / elapsed,
+        "rows_per_batch": health["rows"] / max(health["batches"], 1),
+    }
+
+
+async def main() -> None:
+    rng = np.random.default_rng(0)
+    X = rng.normal(loc=5.0, scale=2.0, size=(10_000, NUM_FEATURES))
+    y = X @ rng.normal(size=NUM_FEATURES) + rng.normal(size=X.shape[0])
+
+    scaler = StandardScaler().fit(X)
+    model = LinearRegression(solver="cholesky").fit(scaler.transform(X), y)
+
+    with tempfile.TemporaryDirectory() as directory:
+        scaler_path = Path(directory) / "scaler.mlfs"
+        model_path = Path(directory) / "model.mlfs"
+        save(scaler, scaler_path)
+        save(model, model_path)
+
+        print(
+            f"{CONCURRENCY} concurrent connections, {DURATION:.0f} s per configuration\n"
+        )
+        print(
+            f"{'max_batch_size':>14} {'max_wait_ms':>11} {'p50 ms':>8} "
+            f"{'p99 ms':>8} {'req/s':>9} {'rows/batch':>10}"
+        )
+        for max_batch_size, max_wait_ms in CONFIGS:
+            result = await run_config(
+                scaler_path, model_path, X[:1000], max_batch_size, max_wait_ms
+            )
+            print(
+                f"{max_batch_size:>14} {max_wait_ms:>11.1f} {result['p50']:>8.2f} "
+                f"{result['p99']:>8.2f} {result['rps']:>9.0f} "
+                f"{result['rows_per_batch']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+import asyncio
+from collections.abc import Callable
+
+import numpy as np
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-row prediction requests into batched calls.
+
+    Every `predict` call puts its row on a queue and waits for the result. A
+    background task takes the first waiting row, then keeps collecting rows
+    until `max_batch_size` rows are waiting or `max_wait_ms` has passed since the
+    first one, and answers all of them with one vectorized call of `predict_fn`.
+    Under load the batches fill up immediately, so the Python overhead of a
+    predict call is shared by up to `max_batch_size` requests. A lone request
+    waits at most `max_wait_ms`.
+
+    Args:
+        predict_fn (Callable[[np.ndarray], np.ndarray]): Maps a (batch_size, num_features)
+            array to one prediction per row, e.g. a scaler and `LinearRegression.predict`.
+        max_batch_size (int, optional): The largest number of rows per call. Defaults to 64.
+        max_wait_ms (float, optional): How long the first row of a batch waits for
+            others. Defaults to 2.0.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ):
+        """
+        Initializes the batcher's configuration.
+
+        Raises:
+            ValueError: If `max_batch_size` is smaller than 1 or `max_wait_ms` is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative.")
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.num_batches_ = 0
+        self.num_rows_ = 0
+        self._queue = None
+        self._worker = None
+
+    async def start(self) -> None:
+        """
+        Starts the background task that forms and runs the batches.
+        """
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the background task. Requests that are still waiting are cancelled.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def predict(self, row: np.ndarray) -> np.ndarray:
+        """
+        Predicts a single row, batched together with concurrent requests.
+
+        Args:
+            row (np.ndarray): The features of one observation (num_features).
+
+        Raises:
+            ValueError: If the batcher has not been started.
+
+        Returns:
+            np.ndarray: The prediction for the row.
+        """
+        if self._worker is None:
+            raise ValueError("MicroBatcher.start() must be awaited before predicting.")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+
+        return await future
+
+    async def _run(self) -> None:
+        """
+        Forms batches from the queue and answers them until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+
+            while len(batch) < self.max_batch_size:
+                # Take what is already waiting without giving up the event loop
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: list[tuple[np.ndarray, asyncio.Future]]) -> None:
+        """
+        Answers a batch with one call of `predict_fn`, or fails all of its requests.
+        """
+        # Clients that disconnected in the meantime no longer need an answer
+        batch = [(row, future) for row, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            predictions = self.predict_fn(np.stack([row for row, _ in batch]))
+        except Exception as error:
+            for _, future in batch:
+                future.set_exception(error)
+            return
+
+        for (_, future), prediction in zip(batch, predictions):
+            future.set_result(prediction)
+        self.num_batches_ += 1
+        self.num_rows_ += len(batch)
@@ -0,0 +1,295 @@
+"""
+A local asyncio HTTP server for persisted `StandardScaler` + `LinearRegression`
+pipelines from `00_ml_from_scratch`.
+
+Concurrent requests are coalesced by a `MicroBatcher` into vectorized predict
+calls. Endpoints:
+    POST /predict  {"features": [x_1, ..., x_d]}  ->  {"prediction": y}
+    GET  /health                                  ->  {"status": "ok", ...}
+
+Run from the repository root, e.g. with the files written by `persistence.save`:
+    python 04_mlops/02_api_development/server.py --scaler scaler.mlfs --model model.mlfs
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from micro_batcher import MicroBatcher
+
+ML_FROM_SCRATCH = (
+    Path(__file__).resolve().parents[2]
+    / "03_specializations"
+    / "04_machine_learning_specialization"
+    / "00_ml_from_scratch"
+)
+sys.path.insert(0, str(ML_FROM_SCRATCH))
+from persistence import load  # noqa: E402
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+
+def load_pipeline(
+    scaler_path: str | Path, model_path: str | Path
+) -> tuple[Callable[[np.ndarray], np.ndarray], int, np.dtype]:
+    """
+    Loads a persisted scaler and model (memory-mapped) as one predict function.
+
+    Args:
+        scaler_path (str | Path): The saved `StandardScaler`.
+        model_path (str | Path): The saved `LinearRegression` (or `RidgeRegression`).
+
+    Returns:
+        tuple: The function mapping raw features to predictions, the number of
+            features and the dtype of the model.
+    """
+    scaler = load(scaler_path, mmap=True)
+    model = load(model_path, mmap=True)
+
+    def predict(X: np.ndarray) -> np.ndarray:
+        return model.predict(scaler.transform(X))
+
+    return predict, model.weights.shape[0], model.dtype
+
+
+class PredictionServer:
+    """
+    Serves a predict function over HTTP/1.1 with keep-alive connections.
+
+    Args:
+        predict_fn (Callable[[np.ndarray], np.ndarray]): The batched predict function.
+        num_features (int): The number of features every request must send.
+        dtype (np.dtype, optional): The dtype the features are converted to. Defaults to np.float64.
+        max_batch_size (int, optional): The largest batch of the `MicroBatcher`. Defaults to 64.
+        max_wait_ms (float, optional): The longest wait for a batch to fill. Defaults to 2.0.
+        max_body_bytes (int, optional): The largest request body that is read; larger
+            ones are rejected with 413. Defaults to 1 MiB.
+        max_header_lines (int, optional): The most header lines a request may have;
+            more are rejected with 431. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        num_features: int,
+        dtype: np.dtype = np.float64,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        max_body_bytes: int = 1 << 20,
+        max_header_lines: int = 100,
+    ):
+        """
+        Initializes the server's configuration.
+        """
+        self.num_features = num_features
+        self.dtype = dtype
+        self.max_body_bytes = max_body_bytes
+        self.max_header_lines = max_header_lines
+        self.batcher = MicroBatcher(predict_fn, max_batch_size, max_wait_ms)
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000) -> int:
+        """
+        Starts the batcher and begins accepting connections.
+
+        Args:
+            host (str, optional): The interface to listen on. Defaults to "127.0.0.1".
+            port (int, optional): The port, 0 for any free port. Defaults to 8000.
+
+        Returns:
+            int: The port the server listens on.
+        """
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stops accepting connections and stops the batcher.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        """
+        Serves until cancelled, e.g. by Ctrl+C.
+        """
+        await self._server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answers the requests of one connection until the client closes it.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+
+                headers = {}
+                num_lines = 0
+                while num_lines <= self.max_header_lines:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    num_lines += 1
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                # The unread rest of the request would be taken for the next one,
+                # so close
+                if num_lines > self.max_header_lines:
+                    error = (
+                        f"The request has more than {self.max_header_lines} headers."
+                    )
+                    await _respond(writer, 431, {"error": error}, keep_alive=False)
+                    break
+                length = _content_length(headers)
+                if length is None:
+                    error = "Invalid Content-Length header."
+                    await _respond(writer, 400, {"error": error}, keep_alive=False)
+                    break
+                if length > self.max_body_bytes:
+                    error = f"The body exceeds {self.max_body_bytes} bytes."
+                    await _respond(writer, 413, {"error": error}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length)
+
+                status, payload = await self._dispatch(method, target, body)
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                await _respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # Malformed or interrupted requests simply end the connection
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _dispatch(
+        self, method: str, target: str, body: bytes
+    ) -> tuple[int, dict]:
+        """
+        Routes a request and returns the status code and the JSON payload.
+        """
+        if target == "/health":
+            if method != "GET":
+                return 405, {"error": "Use GET for /health."}
+            return 200, {
+                "status": "ok",
+                "batches": self.batcher.num_batches_,
+                "rows": self.batcher.num_rows_,
+            }
+
+        if target != "/predict":
+            return 404, {"error": f"Unknown path '{target}'."}
+        if method != "POST":
+            return 405, {"error": "Use POST for /predict."}
+
+        try:
+            row = np.asarray(json.loads(body)["features"], dtype=self.dtype)
+        except (ValueError, KeyError, TypeError):
+            return 400, {"error": 'Expected a JSON body {"features": [...]}.'}
+        if row.shape != (self.num_features,):
+            return 400, {"error": f"Expected {self.num_features} features."}
+
+        try:
+            prediction = await self.batcher.predict(row)
+        except Exception as error:
+            # The batcher forwards the failure of the predict call to every request
+            return 500, {"error": f"Prediction failed: {type(error).__name__}."}
+        return 200, {"prediction": prediction.tolist()}
+
+
+def _content_length(headers: dict[str, str]) -> int | None:
+    """
+    Returns the Content-Length of a request, 0 without a body, or None if invalid.
+    """
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        return None
+
+    return length if length >= 0 else None
+
+
+async def _respond(
+    writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool
+) -> None:
+    """
+    Writes a JSON response and waits until it can be sent.
+    """
+    content = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(content)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    writer.write(head.encode() + content)
+    await writer.drain()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scaler", required=True, help="The saved StandardScaler.")
+    parser.add_argument("--model", required=True, help="The saved LinearRegression.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--max-body-bytes", type=int, default=1 << 20)
+    parser.add_argument("--max-header-lines", type=int, default=100)
+    args = parser.parse_args()
+
+    predict_fn, num_features, dtype = load_pipeline(args.scaler, args.model)
+    server = PredictionServer(
+        predict_fn,
+        num_features,
+        dtype,
+        args.max_batch_size,
+        args.max_wait_ms,
+        args.max_body_bytes,
+        args.max_header_lines,
+    )
+    port = await server.start(args.host, args.port)
+    print(f"Serving {num_features}-feature model on http://{args.host}:{port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass